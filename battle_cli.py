@@ -55,15 +55,7 @@ def force_switch(team, opponent_team, battle, label):
         except ValueError:
             print("Invalid choice.")
             continue
-        team.switch(idx)
-        team.active().ability.on_switch_in(battle)
-        team.active().item.on_switch_in(battle)
-        opp_haz = opponent_team.hazards
-        if 'spikes' in opp_haz:
-            layers = opp_haz['spikes']
-            dmg = max(1, team.active().stats['hp'] * layers // 8)
-            team.active().apply_damage(dmg)
-            print(f"{team.active().name} is hurt by Spikes!")
+        battle.switch_in(1 if team is battle.team1 else 2, idx)
         break
 
 
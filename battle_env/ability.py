@@ -38,18 +38,15 @@ class Ability:
         # pressure silent announce
         if data.get('silent'):
             battle.log(f"[silent] {self.owner.name}'s {self.name} activated silently.")
-        # trap all foes (Shadow Tag)
-        if data.get('trap_all_foes'):
-            foes = battle.get_opponents(self.owner)
-            for foe in foes:
-                foe.trapped = True
-            battle.log(f"{self.owner.name}'s {self.name} traps all foes!")
-        # init truant turn
-        if data.get('init_truant_turn'):
+        # init truant turn; leads never run on_switch_in
+        if self.metadata.get('on_switch_in', {}).get('init_truant_turn'):
             self.owner.truantTurn = False
 
     def on_switch_in(self, battle: 'Battle'):
         data = self.metadata.get('on_switch_in', {})
+        # init truant turn
+        if data.get('init_truant_turn'):
+            self.owner.truantTurn = False
         # weather changes
         weather = data.get('weather')
         if weather:
@@ -76,6 +73,10 @@ class Ability:
 
     def on_before_move(self, move, attacker: 'Pokemon', defender: 'Pokemon', battle: 'Battle') -> bool:
         data = self.metadata.get('on_before_move', {})
+        # truant: loaf around every other turn
+        if data.get('skip_if_truant') and attacker is self.owner and self.owner.truantTurn:
+            battle.log(f"{self.owner.name} is loafing around!")
+            return False
         # type immunity (Levitate)
         immune = data.get('immune_type')
         if immune and defender is self.owner and move.type == immune:
@@ -114,7 +115,6 @@ class Ability:
         data = self.metadata.get('on_foe_trap_pokemon', {})
         if data.get('trap_all_foes') and pokemon is not self.owner:
             pokemon.trapped = True
-            battle.log(f"{pokemon.name} is trapped by {self.owner.name}'s {self.name}!")
 
     def on_after_damage(self, move, attacker: 'Pokemon', defender: 'Pokemon', damage: int, battle: 'Battle'):
         data = self.metadata.get('on_after_damage', {})
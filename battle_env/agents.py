@@ -0,0 +1,119 @@
+"""Cheap heuristic opponents for gauntlets and baselines.
+
+``GreedyAgent`` picks the move with the best expected damage and switches
+out of bad type matchups.  All type effectiveness, STAB and raw stat
+ratios for every (our member, move, their member) triple are computed once
+per battle into a ``MatchupTable``; during play only the active pair's row
+is rescaled, and only when an active Pokémon or a relevant stat stage
+changes.
+"""
+from __future__ import annotations
+import weakref
+
+from .damage import get_type_effectiveness
+from .pokemon import STAGE_FRACTIONS
+
+
+def _stage_mult(stage: int) -> float:
+    num, den = STAGE_FRACTIONS[stage + 6]
+    return num / den
+
+
+class MatchupTable:
+    """Per-battle score tables for one side.
+
+    ``offense[i][k]`` lists, for our member ``i`` and their member ``k``, one
+    ``(base_score, physical)`` pair per move: level/power term x STAB x
+    effectiveness x accuracy x unstaged attack/defence ratio.
+    ``defense[i][k]`` is the worst effectiveness of ``k``'s types against
+    ``i`` (used as a proxy for how hard ``k`` hits ``i``).  ``effectiveness``
+    is the battle's ``Ruleset.effectiveness``.
+    """
+
+    def __init__(self, ours, theirs, effectiveness=get_type_effectiveness):
+        self.offense: list[list[list[tuple[float, bool]]]] = []
+        self.defense: list[list[float]] = []
+        for mon in ours.members:
+            off_row, def_row = [], []
+            for foe in theirs.members:
+                scores = []
+                for mv in mon.moves:
+                    if not mv.power:
+                        scores.append((0.0, False))
+                        continue
+                    physical = mv.category == 'Physical'
+                    atk = mon.stats['atk' if physical else 'spa']
+                    dfn = foe.stats['def' if physical else 'spd']
+                    stab = 1.5 if mv.type in mon.types else 1.0
+                    acc = 1.0 if mv.accuracy is True else (mv.accuracy or 100) / 100
+                    level_term = (2 * mon.level // 5 + 2) * mv.power / 50
+                    score = level_term * atk / max(dfn, 1) * stab * acc
+                    scores.append((score * effectiveness(mv.type, foe.types), physical))
+                off_row.append(scores)
+                def_row.append(max(effectiveness(t, mon.types) for t in foe.types) if foe.types else 1.0)
+            self.offense.append(off_row)
+            self.defense.append(def_row)
+        self._key = None
+        self._row: list[float] = []
+
+    def move_scores(self, ours, theirs) -> list[float]:
+        """Scores of our active's moves against their active, stage-adjusted."""
+        me, foe = ours.active(), theirs.active()
+        key = (ours.active_index, theirs.active_index,
+               me.stages['atk'], me.stages['spa'], foe.stages['def'], foe.stages['spd'])
+        if key != self._key:
+            phys = _stage_mult(me.stages['atk']) / _stage_mult(foe.stages['def'])
+            spec = _stage_mult(me.stages['spa']) / _stage_mult(foe.stages['spd'])
+            self._row = [score * (phys if physical else spec)
+                         for score, physical in self.offense[ours.active_index][theirs.active_index]]
+            self._key = key
+        return self._row
+
+    def best_score(self, i: int, k: int) -> float:
+        return max((score for score, _ in self.offense[i][k]), default=0.0)
+
+
+class GreedyAgent:
+    """Policy: best expected damage, or switch to the best resist when walled.
+
+    Usable anywhere a policy function is, e.g.
+    ``battle.run_battle(GreedyAgent(), random_policy)``.
+    """
+
+    def __init__(self, switch_threshold: float = 2.0):
+        self.switch_threshold = switch_threshold
+        self._tables: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def table(self, battle, side: int) -> MatchupTable:
+        tables = self._tables.get(battle)
+        if tables is None:
+            tables = self._tables[battle] = {}
+        if side not in tables:
+            tables[side] = MatchupTable(battle.side(side), battle.side(3 - side), battle.rules.effectiveness)
+        return tables[side]
+
+    def _best_switch(self, table: MatchupTable, switches: list[dict], foe_index: int) -> tuple[dict, tuple]:
+        def rank(action):
+            i = action['index']
+            return (table.defense[i][foe_index], -table.best_score(i, foe_index))
+        best = min(switches, key=rank)
+        return best, rank(best)
+
+    def __call__(self, battle, side: int, actions: list[dict]) -> dict:
+        ours, theirs = battle.side(side), battle.side(3 - side)
+        table = self.table(battle, side)
+        moves = [a for a in actions if a['type'] == 'move']
+        switches = [a for a in actions if a['type'] == 'switch']
+        foe = theirs.active_index
+        if not moves:
+            return self._best_switch(table, switches, foe)[0]
+
+        scores = table.move_scores(ours, theirs)
+        best = max(moves, key=lambda a: scores[a['index']] if a['index'] < len(scores) else 0.0)
+        me = ours.active_index
+        if switches and table.defense[me][foe] >= self.switch_threshold:
+            target, (threat, neg_offense) = self._best_switch(table, switches, foe)
+            best_now = scores[best['index']] if best['index'] < len(scores) else 0.0
+            if threat < table.defense[me][foe] and -neg_offense >= best_now:
+                return target
+        return best
@@ -0,0 +1,210 @@
+"""Run many battles in lockstep and batch their policy calls.
+
+Every battle runs as its ``Battle.decisions`` generator, suspended at each
+decision point.  The central loop in ``run_batched`` gathers all pending
+requests for a ``BatchPolicy`` into one float32 observation matrix plus a
+boolean legal-action mask, calls the policy once per round and sends the
+chosen actions back into the generators.  Ordinary per-battle policies
+(``random_policy``, ``GreedyAgent``, ...) can sit on the other side and
+are called inline as usual.
+
+The engine draws from the global ``random`` module.  Pass ``seeds`` to give
+each battle its own stream, so a battle's outcome depends only on its seed
+and not on which battles it was batched with.
+
+    results = run_batched(battles, LinearPolicy(seed=0), random_policy, seeds=range(len(battles)))
+"""
+from __future__ import annotations
+import random
+
+import numpy as np
+
+from .battle import ACTION_SPACE, MOVE_SLOTS, SWITCH_SLOTS, Battle, BattleResult, action_from_index
+from .history import STAGE_KEYS
+
+STATUSES = ('brn', 'par', 'psn', 'tox', 'slp', 'frz')
+WEATHERS = ('sun', 'rain', 'sandstorm', 'hail')
+
+# per member: hp fraction, fainted, active, status one-hot
+MEMBER_FEATURES = 3 + len(STATUSES)
+# per own move slot: power / 100, effectiveness vs their active / 4, STAB, pp fraction
+MOVE_FEATURES = 4
+OBS_SIZE = (2 * SWITCH_SLOTS * MEMBER_FEATURES + 2 * len(STAGE_KEYS)
+            + MOVE_SLOTS * MOVE_FEATURES + len(WEATHERS))
+
+
+def encode_observation(battle: Battle, side: int, out: np.ndarray) -> None:
+    """Write ``side``'s view of ``battle`` into the zeroed ``OBS_SIZE`` row ``out``."""
+    pos = 0
+    ours, theirs = battle.side(side), battle.side(3 - side)
+    for team in (ours, theirs):
+        for j, mon in enumerate(team.members[:SWITCH_SLOTS]):
+            base = pos + j * MEMBER_FEATURES
+            out[base] = mon.current_hp / mon.stats['hp']
+            out[base + 1] = mon.current_hp == 0
+            out[base + 2] = j == team.active_index
+            if mon.status in STATUSES:
+                out[base + 3 + STATUSES.index(mon.status)] = 1.0
+        pos += SWITCH_SLOTS * MEMBER_FEATURES
+    me, foe = ours.active(), theirs.active()
+    effectiveness = battle.rules.effectiveness
+    for mon in (me, foe):
+        for k, key in enumerate(STAGE_KEYS):
+            out[pos + k] = mon.stages.get(key, 0) / 6
+        pos += len(STAGE_KEYS)
+    for i, mv in enumerate(me.moves[:MOVE_SLOTS]):
+        base = pos + i * MOVE_FEATURES
+        out[base] = (mv.power or 0) / 100
+        out[base + 1] = effectiveness(mv.type, foe.types) / 4
+        out[base + 2] = mv.type in me.types
+        out[base + 3] = mv.current_pp / mv.max_pp if mv.max_pp else 0.0
+    pos += MOVE_SLOTS * MOVE_FEATURES
+    if battle.weather in WEATHERS:
+        out[pos + WEATHERS.index(battle.weather)] = 1.0
+
+
+class BatchPolicy:
+    """Base class for policies evaluated on a whole batch at once.
+
+    Subclasses implement ``__call__(obs, mask)``: ``obs`` is
+    ``(n, OBS_SIZE)`` float32, ``mask`` is ``(n, ACTION_SPACE)`` bool and
+    the result is ``n`` action indices (see ``action_from_index``), each of
+    which must be legal.  Override ``observe`` to use another encoding.
+    """
+    obs_size = OBS_SIZE
+
+    def observe(self, battle: Battle, side: int, out: np.ndarray) -> None:
+        encode_observation(battle, side, out)
+
+    def __call__(self, obs: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
+
+class LinearPolicy(BatchPolicy):
+    """One dense layer over the observation, masked, then sampled or argmaxed.
+
+    A stand-in for a trained network: the batch cost is one
+    ``(n, OBS_SIZE) @ (OBS_SIZE, ACTION_SPACE)`` matmul.
+    """
+
+    def __init__(self, weights: np.ndarray | None = None, bias: np.ndarray | None = None,
+                 temperature: float = 1.0, seed: int | None = None):
+        self.rng = np.random.default_rng(seed)
+        self.weights = (weights if weights is not None
+                        else self.rng.normal(0, 0.1, (OBS_SIZE, ACTION_SPACE)).astype(np.float32))
+        self.bias = bias if bias is not None else np.zeros(ACTION_SPACE, dtype=np.float32)
+        self.temperature = temperature
+
+    def __call__(self, obs: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        logits = obs @ self.weights + self.bias
+        logits[~mask] = -np.inf
+        if self.temperature <= 0:
+            return logits.argmax(axis=1)
+        logits = logits / self.temperature
+        logits -= logits.max(axis=1, keepdims=True)
+        probs = np.exp(logits)
+        cum = probs.cumsum(axis=1)
+        draw = self.rng.random(len(obs))[:, None] * cum[:, -1:]
+        return np.minimum((cum <= draw).sum(axis=1), ACTION_SPACE - 1)
+
+
+def _mask_row(mask: int, out: np.ndarray) -> None:
+    for i in range(ACTION_SPACE):
+        out[i] = mask >> i & 1
+
+
+def run_batched(battles: list[Battle], policy1, policy2, max_turns: int = 500,
+                stalemate_turns: int = 100, seeds=None) -> list[BattleResult]:
+    """Play ``battles`` to completion, batching ``BatchPolicy`` decisions.
+
+    Each round collects the pending requests of every live battle, makes
+    one call per distinct ``BatchPolicy`` (the same instance on both sides
+    is still one call) and resumes the battles.  Non-batch policies are
+    called per battle as in ``Battle.run_battle``.
+
+    With ``seeds`` every battle (and its non-batch policy calls) runs on its
+    own ``random`` state, as if played alone after ``random.seed(seed)``;
+    the caller's ``random`` state is restored afterwards.  Without it the
+    battles interleave draws from the global stream.  A sampling
+    ``BatchPolicy`` (``LinearPolicy`` with ``temperature > 0``) still draws
+    from its own generator across the whole batch.
+    """
+    if seeds is not None:
+        seeds = list(seeds)
+        if len(seeds) != len(battles):
+            raise ValueError(f"Got {len(seeds)} seeds for {len(battles)} battles")
+        caller_state = random.getstate()
+        states = [random.Random(seed).getstate() for seed in seeds]
+        try:
+            return _run_batched(battles, policy1, policy2, max_turns, stalemate_turns, states)
+        finally:
+            random.setstate(caller_state)
+    return _run_batched(battles, policy1, policy2, max_turns, stalemate_turns, None)
+
+
+def _run_batched(battles, policy1, policy2, max_turns, stalemate_turns, states) -> list[BattleResult]:
+    def enter(i: int) -> None:
+        if states is not None:
+            random.setstate(states[i])
+
+    def leave(i: int) -> None:
+        if states is not None:
+            states[i] = random.getstate()
+
+    policies = {1: policy1, 2: policy2}
+    batch_policies = [p for p in dict.fromkeys((policy1, policy2)) if isinstance(p, BatchPolicy)]
+    capacity = 2 * len(battles)
+    buffers = {id(p): (np.zeros((capacity, p.obs_size), dtype=np.float32),
+                       np.zeros((capacity, ACTION_SPACE), dtype=bool)) for p in batch_policies}
+
+    results: list[BattleResult | None] = [None] * len(battles)
+    loops = {}
+    pending: dict[int, tuple[int, ...]] = {}
+    for i, battle in enumerate(battles):
+        loop = battle.decisions(max_turns, stalemate_turns)
+        enter(i)
+        try:
+            pending[i] = next(loop)
+            loops[i] = loop
+        except StopIteration as stop:
+            results[i] = stop.value
+        leave(i)
+
+    while pending:
+        actions: dict[int, dict[int, dict]] = {i: {} for i in pending}
+        requests: dict[int, list[tuple[int, int]]] = {id(p): [] for p in batch_policies}
+        for i, sides in pending.items():
+            battle = battles[i]
+            for side in sides:
+                policy = policies[side]
+                if isinstance(policy, BatchPolicy):
+                    requests[id(policy)].append((i, side))
+                else:
+                    enter(i)
+                    actions[i][side] = policy(battle, side, battle.legal_actions(side))
+                    leave(i)
+        for policy in batch_policies:
+            batch = requests[id(policy)]
+            if not batch:
+                continue
+            obs, mask = buffers[id(policy)]
+            n = len(batch)
+            obs[:n] = 0.0
+            for row, (i, side) in enumerate(batch):
+                policy.observe(battles[i], side, obs[row])
+                _mask_row(battles[i].legal_action_mask(side), mask[row])
+            chosen = policy(obs[:n], mask[:n])
+            for row, (i, side) in enumerate(batch):
+                index = int(chosen[row])
+                if not mask[row, index]:
+                    raise ValueError(f"Policy chose illegal action {index} in battle {i}, side {side}")
+                actions[i][side] = action_from_index(index)
+        for i in list(pending):
+            enter(i)
+            try:
+                pending[i] = loops[i].send(actions[i])
+            except StopIteration as stop:
+                results[i] = stop.value
+                del pending[i]
+            leave(i)
+    return results
@@ -1,12 +1,39 @@
 import random
+from dataclasses import dataclass
 from typing import Optional
 
 from .pokemon import Pokemon, StatStage
 from .move import Move
 from .team import Team
-from .damage import calculate_initial_damage, get_damage_range
-from .ability import abilities_map, Ability
-from .item import items_map, Item
+from .damage import calculate_initial_damage
+from .ability import Ability
+from .item import Item
+from .history import BattleHistory
+from .ruleset import Ruleset, get_ruleset
+
+# Fixed action layout for masks: move slots first, then one slot per team
+# member to switch to.  With no PP left anywhere, move slot 0 means Struggle.
+MOVE_SLOTS = 4
+SWITCH_SLOTS = 6
+ACTION_SPACE = MOVE_SLOTS + SWITCH_SLOTS
+
+
+@dataclass
+class BattleResult:
+    """Outcome of ``Battle.run_battle``; ``winner`` is None for a draw."""
+    winner: Optional[int]
+    turns: int
+    reason: str
+
+
+def first_legal_policy(battle, side: int, actions: list[dict]) -> dict:
+    """Always pick the first legal action."""
+    return actions[0]
+
+
+def random_policy(battle, side: int, actions: list[dict]) -> dict:
+    """Pick a uniformly random legal action."""
+    return random.choice(actions)
 
 
 class Battle:
@@ -18,6 +45,9 @@ class Battle:
         team1: Team,
         team2: Team,
         weather: Optional[str] = None,
+        verbose: bool = True,
+        record_history: bool = False,
+        ruleset: Optional[Ruleset] = None,
     ):
         self.team1 = team1
         self.team2 = team2
@@ -27,15 +57,25 @@ class Battle:
         self.weather_turns = 0
         self.turn = 0
         self.log_messages: list[str] = []
+        self.verbose = verbose
+        self.history: Optional[BattleHistory] = BattleHistory() if record_history else None
+        self.rules = ruleset or get_ruleset(3)
+
+        # Physical/special follows this generation's type split
+        category = self.rules.category
+        for team in (team1, team2):
+            for mon in team.members:
+                for mv in mon.moves:
+                    mv.category = category(mv.type, mv.power)
 
-        # Instantiate abilities
-        cls1 = abilities_map.get(self.p1.ability, Ability)
-        cls2 = abilities_map.get(self.p2.ability, Ability)
+        # Instantiate abilities and held items that exist in this generation
+        abilities, items = self.rules.abilities, self.rules.items
+        cls1 = abilities.get(self.p1.ability, Ability)
+        cls2 = abilities.get(self.p2.ability, Ability)
         self.p1.ability = cls1(self.p1)
         self.p2.ability = cls2(self.p2)
-        # Instantiate held items
-        itm1 = items_map.get(self.p1.item, Item)
-        itm2 = items_map.get(self.p2.item, Item)
+        itm1 = items.get(self.p1.item, Item)
+        itm2 = items.get(self.p2.item, Item)
         self.p1.item = itm1(self.p1)
         self.p2.item = itm2(self.p2)
 
@@ -44,9 +84,21 @@ class Battle:
         self.p1 = self.team1.active()
         self.p2 = self.team2.active()
 
+    def update_trapped(self):
+        """Recompute ``trapped`` on both actives from the foe's
+        ``on_foe_trap_pokemon`` hook, so trapping ends with the trapper."""
+        for mon, foe in ((self.p1, self.p2), (self.p2, self.p1)):
+            was_trapped = getattr(mon, 'trapped', False)
+            mon.trapped = False
+            if not mon.is_fainted() and not foe.is_fainted() and not isinstance(foe.ability, str):
+                foe.ability.on_foe_trap_pokemon(mon, self)
+            if mon.trapped and not was_trapped:
+                self.log(f"{mon.name} is trapped by {foe.name}'s {foe.ability.name}!")
+
     def log(self, message: str):
         self.log_messages.append(message)
-        print(message)
+        if self.verbose:
+            print(message)
 
     def random_chance(self, numerator: int, denominator: int) -> bool:
         return random.randrange(denominator) < numerator
@@ -54,6 +106,131 @@ class Battle:
     def get_opponents(self, pokemon: Pokemon) -> list[Pokemon]:
         return [self.p2] if pokemon is self.p1 else [self.p1]
 
+    def side(self, side: int) -> Team:
+        """Return team 1 or 2."""
+        return self.team1 if side == 1 else self.team2
+
+    def needs_switch(self, side: int) -> bool:
+        """Whether ``side`` must replace a fainted active Pokémon."""
+        team = self.side(side)
+        return team.active().is_fainted() and not team.all_fainted()
+
+    def legal_action_mask(self, side: int) -> int:
+        """Return the legal actions of ``side`` as an ``ACTION_SPACE``-bit int.
+
+        Bit ``i < MOVE_SLOTS`` selects move ``i``; bit ``MOVE_SLOTS + j``
+        switches to member ``j``.  A fainted active Pokémon only allows
+        switches, and a trapped one (Shadow Tag) only allows moves.
+        """
+        team = self.side(side)
+        active = team.active()
+        mask = 0
+        forced = active.is_fainted()
+        if not forced:
+            moves = active.moves
+            for i in range(min(len(moves), MOVE_SLOTS)):
+                if moves[i].current_pp > 0:
+                    mask |= 1 << i
+            if not mask:
+                mask = 1  # Struggle
+            if getattr(active, 'trapped', False):
+                return mask
+        members = team.members
+        for j in range(min(len(members), SWITCH_SLOTS)):
+            if j != team.active_index and members[j].current_hp > 0:
+                mask |= 1 << (MOVE_SLOTS + j)
+        return mask
+
+    def legal_actions(self, side: int) -> list[dict]:
+        """Return the legal ``play_turn`` actions for ``side``."""
+        mask = self.legal_action_mask(side)
+        return [action_from_index(i) for i in range(ACTION_SPACE) if mask >> i & 1]
+
+    def switch_in(self, side: int, index: int):
+        """Switch ``side`` to member ``index`` and run entry effects."""
+        team = self.side(side)
+        team.active().trapped = False
+        team.switch(index)
+        mon = team.active()
+        if isinstance(mon.ability, str) or mon.ability is None:
+            cls = self.rules.abilities.get(mon.ability, Ability)
+            mon.ability = cls(mon)
+        if isinstance(mon.item, str) or mon.item is None:
+            itm = self.rules.items.get(mon.item, Item)
+            mon.item = itm(mon)
+        self.update_actives()
+        mon.ability.on_switch_in(self)
+        mon.item.on_switch_in(self)
+        if 'spikes' in team.hazards:
+            layers = team.hazards['spikes']
+            dmg = max(1, mon.stats['hp'] * layers // 8)
+            mon.apply_damage(dmg)
+            self.log(f"{mon.name} is hurt by Spikes!")
+        self.update_trapped()
+
+    def winner(self) -> Optional[int]:
+        """Return 1 or 2 once the other side is fully fainted, 0 if both are."""
+        out1 = self.team1.all_fainted()
+        out2 = self.team2.all_fainted()
+        if out1 and out2:
+            return 0
+        if out2:
+            return 1
+        if out1:
+            return 2
+        return None
+
+    def run_battle(self, policy1, policy2, max_turns: int = 500, stalemate_turns: int = 100) -> "BattleResult":
+        """Play the battle to completion with two policies.
+
+        A policy is called as ``policy(battle, side, legal_actions)`` and
+        returns one of the offered actions.  See ``decisions`` for the
+        faint, turn cap and stalemate handling.
+        """
+        policies = {1: policy1, 2: policy2}
+        loop = self.decisions(max_turns, stalemate_turns)
+        try:
+            sides = next(loop)
+            while True:
+                sides = loop.send({side: policies[side](self, side, self.legal_actions(side)) for side in sides})
+        except StopIteration as stop:
+            return stop.value
+
+    def decisions(self, max_turns: int = 500, stalemate_turns: int = 100):
+        """Generator driving the battle one decision point at a time.
+
+        Yields the tuple of sides that must act -- ``(side,)`` for a faint
+        replacement (with Spikes on entry), ``(1, 2)`` for a turn -- and
+        expects ``{side: action}`` to be sent back.  Returns the
+        ``BattleResult`` once a side is out, after ``max_turns`` or when no
+        HP changes for ``stalemate_turns`` consecutive turns.  Struggle is
+        offered once PP runs out.  ``run_battle`` and the batched driver in
+        ``batched_policy`` both run on this.
+        """
+        if self.turn == 0:
+            self.start()
+        last_hp = None
+        still = 0
+        turns = 0
+        while True:
+            for side in (1, 2):
+                while self.needs_switch(side):
+                    actions = yield (side,)
+                    self.switch_in(side, actions[side]['index'])
+            winner = self.winner()
+            if winner is not None:
+                return BattleResult(winner or None, turns, 'faint')
+            if turns >= max_turns:
+                return BattleResult(None, turns, 'turn_cap')
+            hp = tuple(m.current_hp for m in self.team1.members + self.team2.members)
+            still = still + 1 if hp == last_hp else 0
+            if still >= stalemate_turns:
+                return BattleResult(None, turns, 'stalemate')
+            last_hp = hp
+            actions = yield (1, 2)
+            self.play_turn(actions[1], actions[2])
+            turns += 1
+
     def start(self):
         """Begin battle: trigger on_start hooks."""
         self.turn = 1
@@ -61,9 +238,13 @@ class Battle:
             ability.on_start(self)
         for item in (self.p1.item, self.p2.item):
             item.on_start(self)
+        self.update_trapped()
+        if self.history is not None:
+            self.history.record(self)
 
     def play_turn(self, action1: dict, action2: dict):
         """Execute one turn given two player actions."""
+        conditions = self.rules.conditions
         self.update_actives()
         # decrement volatile durations
         for mon in (self.p1, self.p2):
@@ -77,42 +258,12 @@ class Battle:
         switched2 = action2.get('type') == 'switch'
 
         if switched1:
-            self.team1.switch(action1['index'])
-            mon = self.team1.active()
-            if isinstance(mon.ability, str):
-                cls = abilities_map.get(mon.ability, Ability)
-                mon.ability = cls(mon)
-            if isinstance(mon.item, str) or mon.item is None:
-                itm = items_map.get(mon.item, Item)
-                mon.item = itm(mon)
-            mon.ability.on_switch_in(self)
-            mon.item.on_switch_in(self)
-            opp_haz = self.team1.hazards
-            if 'spikes' in opp_haz:
-                layers = opp_haz['spikes']
-                dmg = max(1, self.team1.active().stats['hp'] * layers // 8)
-                self.team1.active().apply_damage(dmg)
-                self.log(f"{self.team1.active().name} is hurt by Spikes!")
+            self.switch_in(1, action1['index'])
         else:
             move1: Move = self.p1.choose_move(action1['index'])
 
         if switched2:
-            self.team2.switch(action2['index'])
-            mon = self.team2.active()
-            if isinstance(mon.ability, str):
-                cls = abilities_map.get(mon.ability, Ability)
-                mon.ability = cls(mon)
-            if isinstance(mon.item, str) or mon.item is None:
-                itm = items_map.get(mon.item, Item)
-                mon.item = itm(mon)
-            mon.ability.on_switch_in(self)
-            mon.item.on_switch_in(self)
-            opp_haz = self.team2.hazards
-            if 'spikes' in opp_haz:
-                layers = opp_haz['spikes']
-                dmg = max(1, self.team2.active().stats['hp'] * layers // 8)
-                self.team2.active().apply_damage(dmg)
-                self.log(f"{self.team2.active().name} is hurt by Spikes!")
+            self.switch_in(2, action2['index'])
         else:
             move2: Move = self.p2.choose_move(action2['index'])
 
@@ -121,6 +272,8 @@ class Battle:
         if switched1 or switched2:
             self.log('A switch occurred.')
         if switched1 and switched2:
+            if self.history is not None:
+                self.history.record(self)
             return
 
         # Build action order
@@ -135,12 +288,8 @@ class Battle:
                 else:
                     action_pairs = [(self.p2, move2, self.p1), (self.p1, move1, self.p2)]
             else:
-                sp1 = self.p1.get_modified_stat('spe')
-                sp2 = self.p2.get_modified_stat('spe')
-                if self.p1.status == 'par':
-                    sp1 //= 4
-                if self.p2.status == 'par':
-                    sp2 //= 4
+                sp1 = self.p1.get_effective_stat('spe')
+                sp2 = self.p2.get_effective_stat('spe')
                 if sp1 > sp2:
                     action_pairs = [(self.p1, move1, self.p2), (self.p2, move2, self.p1)]
                 else:
@@ -167,7 +316,7 @@ class Battle:
             if attacker.status == 'frz':
                 self.log(f"{attacker.name} is frozen solid!")
                 continue
-            if attacker.status == 'par' and random.random() < 0.25:
+            if attacker.status == 'par' and random.random() < conditions.par_skip:
                 self.log(f"{attacker.name} is paralyzed! It can't move!")
                 continue
 
@@ -197,8 +346,13 @@ class Battle:
                 continue
 
             # Damage calculation
-            atk_stat = attacker.get_modified_stat('atk') if move.category == 'Physical' else attacker.get_modified_stat('spa')
-            def_stat = target.get_modified_stat('def') if move.category == 'Physical' else target.get_modified_stat('spd')
+            a_atk = attacker.get_modified_stat('atk')
+            a_spa = attacker.get_modified_stat('spa')
+            t_def = target.get_modified_stat('def')
+            t_spd = target.get_modified_stat('spd')
+            physical = move.category == 'Physical'
+            atk_stat = a_atk if physical else a_spa
+            def_stat = t_def if physical else t_spd
             initial = calculate_initial_damage(attacker.level, move.power, atk_stat, def_stat)
 
             # Build minimal dicts for damage calc
@@ -209,21 +363,21 @@ class Battle:
                 'ability': attacker.ability.name,
                 'atk': atk_stat,
                 'def': def_stat,
-                'spa': attacker.get_modified_stat('spa'),
+                'spa': a_spa,
                 'spd': attacker.get_modified_stat('spd')
             }
             def_data = {
                 'types': target.types,
                 'status': target.status,
                 'ability': target.ability.name,
-                'atk': attacker.get_modified_stat('atk'),
-                'def': target.get_modified_stat('def'),
+                'atk': a_atk,
+                'def': t_def,
                 'spa': target.get_modified_stat('spa'),
                 'spd': def_stat
             }
             move_data = move.__dict__
 
-            low, high = get_damage_range(initial, atk_data, def_data, move_data, is_crit=False, weather=self.weather)
+            low, high = self.rules.damage_range(initial, atk_data, def_data, move_data, is_crit=False, weather=self.weather)
             dmg = random.choice(range(low, high + 1))
             dmg = attacker.item.modify_damage(move, attacker, target, dmg, self)
             dmg = defender.item.modify_damage(move, attacker, target, dmg, self)
@@ -267,11 +421,11 @@ class Battle:
         # Status residual damage
         for mon in (self.p1, self.p2):
             if mon.status == 'brn':
-                dmg = max(1, mon.stats['hp'] // 16)
+                dmg = max(1, mon.stats['hp'] // conditions.brn_residual)
                 mon.apply_damage(dmg)
                 self.log(f"{mon.name} is hurt by its burn!")
             elif mon.status == 'psn':
-                dmg = max(1, mon.stats['hp'] // 8)
+                dmg = max(1, mon.stats['hp'] // conditions.psn_residual)
                 mon.apply_damage(dmg)
                 self.log(f"{mon.name} is hurt by poison!")
             elif mon.status == 'tox':
@@ -286,7 +440,7 @@ class Battle:
                     mon.heal_status()
                     self.log(f"{mon.name} woke up!")
             elif mon.status == 'frz':
-                if random.random() < 0.2:
+                if random.random() < conditions.frz_thaw:
                     mon.heal_status()
                     self.log(f"{mon.name} thawed out!")
 
@@ -298,3 +452,19 @@ class Battle:
                 self.weather = None
 
         self.turn += 1
+        if self.history is not None:
+            self.history.record(self)
+
+
+def action_from_index(index: int) -> dict:
+    """Convert a mask bit index into a ``play_turn`` action."""
+    if index < MOVE_SLOTS:
+        return {'type': 'move', 'index': index}
+    return {'type': 'switch', 'index': index - MOVE_SLOTS}
+
+
+def action_to_index(action: dict) -> int:
+    """Convert a ``play_turn`` action into its mask bit index."""
+    if action.get('type') == 'switch':
+        return MOVE_SLOTS + action['index']
+    return action['index']
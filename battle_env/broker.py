@@ -0,0 +1,316 @@
+"""Minimal job broker and worker daemon for spreading battles across nodes.
+
+The broker holds a queue of ``Job`` (team pair, seed, policies), leases
+them to workers in batches, re-queues leases that expire and collects the
+results.  Workers keep ``battle_env`` loaded, along with the parsed team
+templates they have already seen, between batches.  The protocol is
+newline-delimited JSON over one TCP (``host:port``) or Unix socket (a
+filesystem path) connection per worker:
+
+    -> {"op": "lease", "worker": "w1", "max": 8}
+    <- {"jobs": [...], "lease": 60}   |  {"jobs": [], "wait": 1.0}  |  {"done": true}
+    -> {"op": "complete", "worker": "w1", "results": [...]}
+    <- {"ok": true}
+
+    python -m battle_env.broker serve --jobs jobs.jsonl --address 127.0.0.1:8765
+    python -m battle_env.broker work --address 127.0.0.1:8765
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import random
+import socket
+import socketserver
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from .agents import GreedyAgent
+from .battle import Battle, first_legal_policy, random_policy
+from .moves_loader import load_gen3_moves
+from .team import TeamTemplate
+from .team_builder import parse_showdown
+
+
+@dataclass
+class Job:
+    id: int
+    team1: str  # Showdown team text
+    team2: str
+    seed: int
+    policy1: str = 'random'
+    policy2: str = 'random'
+    max_turns: int = 500
+
+
+POLICIES = {
+    'random': lambda: random_policy,
+    'first': lambda: first_legal_policy,
+    'greedy': GreedyAgent,
+}
+
+
+def parse_address(address: str) -> tuple[int, object]:
+    """Return ``(family, sockaddr)`` for ``host:port`` or a Unix socket path."""
+    if ':' in address and not address.startswith(('/', '.')):
+        host, port = address.rsplit(':', 1)
+        return socket.AF_INET, (host, int(port))
+    return socket.AF_UNIX, address
+
+
+class Broker:
+    """Thread-safe job queue with leases, retries and result collection."""
+
+    def __init__(self, jobs: list[Job], lease_seconds: float = 60.0, max_attempts: int = 3):
+        self.jobs = {job.id: job for job in jobs}
+        self.pending: deque[int] = deque(self.jobs)
+        self.leases: dict[int, tuple[float, str]] = {}  # job id -> (deadline, worker)
+        self.attempts: dict[int, int] = {}
+        self.results: dict[int, dict] = {}
+        self.failed: dict[int, str] = {}
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.lock = threading.Lock()
+        self.finished = threading.Event()
+        self._server: socketserver.BaseServer | None = None
+        self._check_finished()  # an empty job list is already done
+
+    # --- queue operations ---
+    def _reclaim(self, now: float) -> None:
+        for job_id, (deadline, _) in list(self.leases.items()):
+            if deadline <= now:
+                del self.leases[job_id]
+                self._retry(job_id, "lease expired")
+
+    def _retry(self, job_id: int, error: str) -> None:
+        if self.attempts.get(job_id, 0) >= self.max_attempts:
+            self.failed[job_id] = error
+        else:
+            self.pending.append(job_id)
+        self._check_finished()
+
+    def _check_finished(self) -> None:
+        if len(self.results) + len(self.failed) == len(self.jobs):
+            self.finished.set()
+
+    def lease(self, worker: str, count: int) -> dict:
+        with self.lock:
+            now = time.monotonic()
+            self._reclaim(now)
+            if self.finished.is_set():
+                return {'done': True}
+            batch = []
+            while self.pending and len(batch) < count:
+                job_id = self.pending.popleft()
+                if job_id in self.results:
+                    continue
+                self.attempts[job_id] = self.attempts.get(job_id, 0) + 1
+                self.leases[job_id] = (now + self.lease_seconds, worker)
+                batch.append(asdict(self.jobs[job_id]))
+            if not batch:
+                return {'jobs': [], 'wait': 1.0}
+            return {'jobs': batch, 'lease': self.lease_seconds}
+
+    def complete(self, worker: str, results: list[dict]) -> dict:
+        with self.lock:
+            for result in results:
+                job_id = result['id']
+                self.leases.pop(job_id, None)
+                if job_id in self.results or job_id in self.failed:
+                    continue  # a re-leased copy already finished
+                if 'error' in result:
+                    self._retry(job_id, result['error'])
+                else:
+                    self.results[job_id] = result
+            self._check_finished()
+        return {'ok': True}
+
+    def handle(self, request: dict) -> dict:
+        op = request.get('op')
+        if op == 'lease':
+            return self.lease(request.get('worker', '?'), int(request.get('max', 1)))
+        if op == 'complete':
+            return self.complete(request.get('worker', '?'), request.get('results', []))
+        if op == 'status':
+            with self.lock:
+                return {'jobs': len(self.jobs), 'pending': len(self.pending), 'leased': len(self.leases),
+                        'done': len(self.results), 'failed': len(self.failed)}
+        return {'error': f"unknown op {op!r}"}
+
+    # --- server ---
+    def serve(self, address: str) -> None:
+        """Start serving on ``address`` in a background thread."""
+        broker = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    if not line.strip():
+                        continue
+                    try:
+                        reply = broker.handle(json.loads(line))
+                    except Exception as exc:
+                        reply = {'error': f"{type(exc).__name__}: {exc}"}
+                    self.wfile.write((json.dumps(reply) + "\n").encode())
+                    self.wfile.flush()
+
+        family, sockaddr = parse_address(address)
+        if family == socket.AF_UNIX:
+            if os.path.exists(sockaddr):
+                os.unlink(sockaddr)
+            base = socketserver.ThreadingUnixStreamServer
+        else:
+            base = socketserver.ThreadingTCPServer
+
+        class Server(base):
+            allow_reuse_address = True
+            daemon_threads = True
+
+        self._server = Server(sockaddr, Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    @property
+    def address(self) -> str:
+        sockaddr = self._server.server_address
+        return sockaddr if isinstance(sockaddr, str) else f"{sockaddr[0]}:{sockaddr[1]}"
+
+    def wait(self, timeout: float | None = None) -> bool:
+        return self.finished.wait(timeout)
+
+    def shutdown(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            if isinstance(self._server.server_address, str):
+                Path(self._server.server_address).unlink(missing_ok=True)
+
+
+# --- worker ---
+
+class _Runner:
+    """Plays jobs, caching parsed teams and the move database per process."""
+
+    def __init__(self):
+        self.moves_db = load_gen3_moves()
+        self.templates: dict[str, TeamTemplate] = {}
+
+    def template(self, text: str) -> TeamTemplate:
+        tpl = self.templates.get(text)
+        if tpl is None:
+            tpl = self.templates[text] = TeamTemplate.from_team(parse_showdown(text, self.moves_db))
+        return tpl
+
+    def run(self, job: dict) -> dict:
+        try:
+            t1, t2 = self.template(job['team1']), self.template(job['team2'])
+            random.seed(job['seed'])
+            battle = Battle(t1.instantiate(), t2.instantiate(), verbose=False)
+            p1 = POLICIES[job['policy1']]()
+            p2 = POLICIES[job['policy2']]()
+            result = battle.run_battle(p1, p2, job['max_turns'])
+        except Exception as exc:
+            return {'id': job['id'], 'error': f"{type(exc).__name__}: {exc}"}
+        return {'id': job['id'], 'winner': result.winner, 'turns': result.turns, 'reason': result.reason}
+
+
+def run_worker(address: str, batch_size: int = 8, worker_id: str | None = None,
+               retry_connect: float = 10.0) -> int:
+    """Lease and run jobs until the broker reports it is done; return jobs run."""
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    runner = _Runner()
+    family, sockaddr = parse_address(address)
+    deadline = time.monotonic() + retry_connect
+    while True:
+        try:
+            sock = socket.socket(family, socket.SOCK_STREAM)
+            sock.connect(sockaddr)
+            break
+        except OSError:
+            sock.close()
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.2)
+    done = 0
+    with sock, sock.makefile('rwb') as stream:
+        def call(request: dict) -> dict:
+            stream.write((json.dumps(request) + "\n").encode())
+            stream.flush()
+            line = stream.readline()
+            if not line:
+                raise ConnectionError("broker closed the connection")
+            return json.loads(line)
+
+        while True:
+            try:
+                reply = call({'op': 'lease', 'worker': worker_id, 'max': batch_size})
+            except (ConnectionError, OSError):
+                return done  # broker finished and went away
+            if reply.get('done'):
+                return done
+            jobs = reply.get('jobs', [])
+            if not jobs:
+                time.sleep(reply.get('wait', 1.0))
+                continue
+            results = [runner.run(job) for job in jobs]
+            try:
+                call({'op': 'complete', 'worker': worker_id, 'results': results})
+            except (ConnectionError, OSError):
+                return done  # broker finished (e.g. a re-leased copy) and went away
+            done += len(results)
+
+
+def load_jobs(path: str | Path) -> list[Job]:
+    """Read a JSONL job file; ``team1``/``team2`` may be team file paths or texts."""
+    jobs = []
+    for i, line in enumerate(Path(path).read_text().splitlines()):
+        if not line.strip():
+            continue
+        data = json.loads(line)
+        for key in ('team1', 'team2'):
+            if '\n' not in data[key] and Path(data[key]).exists():
+                data[key] = Path(data[key]).read_text()
+        data.setdefault('id', i)
+        jobs.append(Job(**data))
+    return jobs
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Distribute battles over local sockets.")
+    sub = parser.add_subparsers(dest='cmd', required=True)
+    serve = sub.add_parser('serve', help="run the broker")
+    serve.add_argument('--jobs', required=True, help="JSONL job file")
+    serve.add_argument('--address', default='127.0.0.1:8765', help="host:port or Unix socket path")
+    serve.add_argument('--out', default='results.jsonl')
+    serve.add_argument('--lease', type=float, default=60.0)
+    serve.add_argument('--attempts', type=int, default=3)
+    work = sub.add_parser('work', help="run a worker")
+    work.add_argument('--address', default='127.0.0.1:8765')
+    work.add_argument('--batch', type=int, default=8)
+    args = parser.parse_args(argv)
+
+    if args.cmd == 'work':
+        print(f"Ran {run_worker(args.address, args.batch)} jobs")
+        return
+    broker = Broker(load_jobs(args.jobs), args.lease, args.attempts)
+    broker.serve(args.address)
+    print(f"Serving {len(broker.jobs)} jobs on {broker.address}")
+    try:
+        while not broker.wait(30):
+            print(json.dumps(broker.handle({'op': 'status'})))
+    except KeyboardInterrupt:
+        print("Interrupted", file=sys.stderr)
+    finally:
+        with open(args.out, 'w') as fh:
+            for job_id in sorted(broker.results):
+                fh.write(json.dumps(broker.results[job_id]) + "\n")
+            for job_id, error in sorted(broker.failed.items()):
+                fh.write(json.dumps({'id': job_id, 'error': error}) + "\n")
+        broker.shutdown()
+
+
+if __name__ == "__main__":
+    main()
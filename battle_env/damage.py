@@ -1,58 +1,58 @@
-import math
-
-# --- Gen 3 Type Effectiveness Chart ---
-TYPE_CHART = {
-    'Normal': {'Rock': 0.5, 'Ghost': 0, 'Steel': 0.5},
-    'Fire': {'Fire': 0.5, 'Water': 0.5, 'Grass': 2, 'Ice': 2, 'Bug': 2, 'Rock': 0.5, 'Dragon': 0.5, 'Steel': 2},
-    'Water': {'Fire': 2, 'Water': 0.5, 'Grass': 0.5, 'Ground': 2, 'Rock': 2, 'Dragon': 0.5},
-    'Electric': {'Water': 2, 'Electric': 0.5, 'Grass': 0.5, 'Ground': 0, 'Flying': 2, 'Dragon': 0.5},
-    'Grass': {'Fire': 0.5, 'Water': 2, 'Electric': 0.5, 'Grass': 0.5, 'Poison': 0.5, 'Ground': 2, 'Flying': 0.5, 'Bug': 0.5, 'Rock': 2, 'Dragon': 0.5, 'Steel': 0.5},
-    'Ice': {'Fire': 0.5, 'Water': 0.5, 'Grass': 2, 'Ice': 0.5, 'Ground': 2, 'Flying': 2, 'Dragon': 2, 'Steel': 0.5},
-    'Fighting': {'Normal': 2, 'Ice': 2, 'Poison': 0.5, 'Flying': 0.5, 'Psychic': 0.5, 'Bug': 0.5, 'Rock': 2, 'Ghost': 0, 'Dark': 2, 'Steel': 2},
-    'Poison': {'Grass': 2, 'Poison': 0.5, 'Ground': 0.5, 'Rock': 0.5, 'Ghost': 0.5, 'Steel': 0},
-    'Ground': {'Fire': 2, 'Electric': 2, 'Grass': 0.5, 'Poison': 2, 'Flying': 0, 'Bug': 0.5, 'Rock': 2, 'Steel': 2},
-    'Flying': {'Electric': 0.5, 'Grass': 2, 'Fighting': 2, 'Bug': 2, 'Rock': 0.5, 'Steel': 0.5},
-    'Psychic': {'Fighting': 2, 'Poison': 2, 'Psychic': 0.5, 'Dark': 0, 'Steel': 0.5},
-    'Bug': {'Fire': 0.5, 'Grass': 2, 'Fighting': 0.5, 'Poison': 0.5, 'Flying': 0.5, 'Psychic': 2, 'Ghost': 0.5, 'Dark': 2, 'Steel': 0.5},
-    'Rock': {'Fire': 2, 'Ice': 2, 'Fighting': 0.5, 'Ground': 0.5, 'Flying': 2, 'Bug': 2, 'Steel': 0.5},
-    'Ghost': {'Normal': 0, 'Psychic': 2, 'Ghost': 2, 'Dark': 0.5},
-    'Dragon': {'Dragon': 2, 'Steel': 0.5},
-    'Dark': {'Psychic': 2, 'Ghost': 2, 'Fighting': 0.5, 'Dark': 0.5, 'Steel': 0.5},
-    'Steel': {'Fire': 0.5, 'Water': 0.5, 'Electric': 0.5, 'Ice': 2, 'Rock': 2, 'Steel': 0.5},
-}
-
-def get_type_effectiveness(move_type, defender_types):
-    """
-    Calculates the type effectiveness multiplier for a move against a defender.
-    Returns a float (e.g., 2.0, 0.5, 0.0).
-    """
-    if not move_type or move_type == '???':
-        return 1.0
-
-    effectiveness = 1.0
-    attack_type_chart = TYPE_CHART.get(move_type, {})
-
-    for def_type in defender_types:
-        multiplier = attack_type_chart.get(def_type, 1.0)
-        effectiveness *= multiplier
-
-    return effectiveness
-
-def calculate_initial_damage(level, power, attack, defense):
-    """
-    Calculates the initial damage value before most modifiers are applied.
-    """
-    if attack == 0 or power == 0:
-        return 0
-        
-    part1 = math.floor((2 * level) / 5) + 2
-    part2 = part1 * power * attack
-    part3 = math.floor(part2 / defense)
-    initial_damage = math.floor(part3 / 50)
-    
-    return initial_damage
-
-
+import math
+
+# --- Gen 3 Type Effectiveness Chart ---
+TYPE_CHART = {
+    'Normal': {'Rock': 0.5, 'Ghost': 0, 'Steel': 0.5},
+    'Fire': {'Fire': 0.5, 'Water': 0.5, 'Grass': 2, 'Ice': 2, 'Bug': 2, 'Rock': 0.5, 'Dragon': 0.5, 'Steel': 2},
+    'Water': {'Fire': 2, 'Water': 0.5, 'Grass': 0.5, 'Ground': 2, 'Rock': 2, 'Dragon': 0.5},
+    'Electric': {'Water': 2, 'Electric': 0.5, 'Grass': 0.5, 'Ground': 0, 'Flying': 2, 'Dragon': 0.5},
+    'Grass': {'Fire': 0.5, 'Water': 2, 'Electric': 0.5, 'Grass': 0.5, 'Poison': 0.5, 'Ground': 2, 'Flying': 0.5, 'Bug': 0.5, 'Rock': 2, 'Dragon': 0.5, 'Steel': 0.5},
+    'Ice': {'Fire': 0.5, 'Water': 0.5, 'Grass': 2, 'Ice': 0.5, 'Ground': 2, 'Flying': 2, 'Dragon': 2, 'Steel': 0.5},
+    'Fighting': {'Normal': 2, 'Ice': 2, 'Poison': 0.5, 'Flying': 0.5, 'Psychic': 0.5, 'Bug': 0.5, 'Rock': 2, 'Ghost': 0, 'Dark': 2, 'Steel': 2},
+    'Poison': {'Grass': 2, 'Poison': 0.5, 'Ground': 0.5, 'Rock': 0.5, 'Ghost': 0.5, 'Steel': 0},
+    'Ground': {'Fire': 2, 'Electric': 2, 'Grass': 0.5, 'Poison': 2, 'Flying': 0, 'Bug': 0.5, 'Rock': 2, 'Steel': 2},
+    'Flying': {'Electric': 0.5, 'Grass': 2, 'Fighting': 2, 'Bug': 2, 'Rock': 0.5, 'Steel': 0.5},
+    'Psychic': {'Fighting': 2, 'Poison': 2, 'Psychic': 0.5, 'Dark': 0, 'Steel': 0.5},
+    'Bug': {'Fire': 0.5, 'Grass': 2, 'Fighting': 0.5, 'Poison': 0.5, 'Flying': 0.5, 'Psychic': 2, 'Ghost': 0.5, 'Dark': 2, 'Steel': 0.5},
+    'Rock': {'Fire': 2, 'Ice': 2, 'Fighting': 0.5, 'Ground': 0.5, 'Flying': 2, 'Bug': 2, 'Steel': 0.5},
+    'Ghost': {'Normal': 0, 'Psychic': 2, 'Ghost': 2, 'Dark': 0.5},
+    'Dragon': {'Dragon': 2, 'Steel': 0.5},
+    'Dark': {'Psychic': 2, 'Ghost': 2, 'Fighting': 0.5, 'Dark': 0.5, 'Steel': 0.5},
+    'Steel': {'Fire': 0.5, 'Water': 0.5, 'Electric': 0.5, 'Ice': 2, 'Rock': 2, 'Steel': 0.5},
+}
+
+def get_type_effectiveness(move_type, defender_types, chart=TYPE_CHART):
+    """
+    Calculates the type effectiveness multiplier for a move against a defender.
+    Returns a float (e.g., 2.0, 0.5, 0.0).
+    """
+    if not move_type or move_type == '???':
+        return 1.0
+
+    effectiveness = 1.0
+    attack_type_chart = chart.get(move_type, {})
+
+    for def_type in defender_types:
+        multiplier = attack_type_chart.get(def_type, 1.0)
+        effectiveness *= multiplier
+
+    return effectiveness
+
+def calculate_initial_damage(level, power, attack, defense):
+    """
+    Calculates the initial damage value before most modifiers are applied.
+    """
+    if attack == 0 or power == 0:
+        return 0
+        
+    part1 = math.floor((2 * level) / 5) + 2
+    part2 = part1 * power * attack
+    part3 = math.floor(part2 / defense)
+    initial_damage = math.floor(part3 / 50)
+    
+    return initial_damage
+
+
 def get_damage_range(initial_damage, attacker, defender, move, is_crit=False, weather=None):
     """
     Calculates the final damage range based on the full Gen 3 formula.
@@ -62,50 +62,156 @@ def get_damage_range(initial_damage, attacker, defender, move, is_crit=False, we
     # minimum of 1 damage.
     if move.get('power', 0) == 0:
         return 0, 0
-    # --- New: Handle Immunities Early ---
-    # Before any calculation, check if the move is immune. If so, damage is 0.
-    type_effectiveness = get_type_effectiveness(move['type'], defender.get('types', []))
-    if type_effectiveness == 0:
-        return 0, 0
-
-    # --- Step 1: Apply initial modifiers (e.g., Burn) ---
-    modified_damage = float(initial_damage)
-    
-    if attacker.get('status') == 'brn' and move.get('category') == 'Physical' and attacker.get('ability') != 'Guts':
-        modified_damage = math.floor(modified_damage * 0.5)
-
-    modified_damage = max(1, modified_damage)
-    
-    # --- Step 2: Add 2 (The critical Gen 3 step) ---
-    modified_damage += 2
-
-    # --- Step 3: Apply main multipliers (post-+2) ---
-    modifier = 1.0
-
-    if weather:
-        if weather == 'sun' and move['type'] == 'Fire': modifier *= 1.5
-        elif weather == 'sun' and move['type'] == 'Water': modifier *= 0.5
-        elif weather == 'rain' and move['type'] == 'Water': modifier *= 1.5
-        elif weather == 'rain' and move['type'] == 'Fire': modifier *= 0.5
-
-    if is_crit:
-        modifier *= move.get('critModifier', 2)
-
-    if move['type'] in attacker.get('types', []):
-        modifier *= 1.5
-        
-    # --- New: Apply the type effectiveness multiplier to the chain ---
-    modifier *= type_effectiveness
-
-    modified_damage *= modifier
-
-    # --- Step 4: Apply the GBA random damage roll ---
-    damage_rolls = []
-    final_base_damage = math.floor(modified_damage)
-    
-    for r in range(217, 256):
-        dmg = math.floor(final_base_damage * r / 255)
-        damage_rolls.append(max(1, dmg))
-        
-    unique_rolls = sorted(list(set(damage_rolls)))
-    return unique_rolls[0], unique_rolls[-1]
+    # --- New: Handle Immunities Early ---
+    # Before any calculation, check if the move is immune. If so, damage is 0.
+    type_effectiveness = get_type_effectiveness(move['type'], defender.get('types', []))
+    if type_effectiveness == 0:
+        return 0, 0
+
+    # --- Step 1: Apply initial modifiers (e.g., Burn) ---
+    modified_damage = float(initial_damage)
+    
+    if attacker.get('status') == 'brn' and move.get('category') == 'Physical' and attacker.get('ability') != 'Guts':
+        modified_damage = math.floor(modified_damage * 0.5)
+
+    modified_damage = max(1, modified_damage)
+    
+    # --- Step 2: Add 2 (The critical Gen 3 step) ---
+    modified_damage += 2
+
+    # --- Step 3: Apply main multipliers (post-+2) ---
+    modifier = 1.0
+
+    if weather:
+        if weather == 'sun' and move['type'] == 'Fire': modifier *= 1.5
+        elif weather == 'sun' and move['type'] == 'Water': modifier *= 0.5
+        elif weather == 'rain' and move['type'] == 'Water': modifier *= 1.5
+        elif weather == 'rain' and move['type'] == 'Fire': modifier *= 0.5
+
+    if is_crit:
+        modifier *= move.get('critModifier', 2)
+
+    if move['type'] in attacker.get('types', []):
+        modifier *= 1.5
+        
+    # --- New: Apply the type effectiveness multiplier to the chain ---
+    modifier *= type_effectiveness
+
+    modified_damage *= modifier
+
+    # --- Step 4: Apply the GBA random damage roll ---
+    damage_rolls = []
+    final_base_damage = math.floor(modified_damage)
+    
+    for r in range(ROLL_MIN, ROLL_MAX + 1):
+        dmg = math.floor(final_base_damage * r / ROLL_MAX)
+        damage_rolls.append(max(1, dmg))
+        
+    unique_rolls = sorted(list(set(damage_rolls)))
+    return unique_rolls[0], unique_rolls[-1]
+
+
+# --- Integer fixed-point pipeline ---
+# Each modifier is an exact (numerator, denominator) step truncated the way
+# the cartridge does, in the order of 3gen_env_Showdown/scripts.ts
+# ``modifyDamage``.
+
+# Number of doublings (+) or halvings (-) per attacking/defending type pair;
+# None marks an immunity.
+def type_steps_from_chart(chart):
+    return {
+        atk: {dfn: (None if mult == 0 else (1 if mult == 2 else -1)) for dfn, mult in row.items()}
+        for atk, row in chart.items()
+    }
+
+
+TYPE_STEPS: dict[str, dict[str, int | None]] = type_steps_from_chart(TYPE_CHART)
+
+WEATHER_MODS = {
+    ('sun', 'Fire'): (3, 2),
+    ('sun', 'Water'): (1, 2),
+    ('rain', 'Water'): (3, 2),
+    ('rain', 'Fire'): (1, 2),
+}
+
+# Gen 3 ``randomizer``: floor(damage * (100 - random(16)) / 100), i.e. 85..100%.
+# (217..255 / 255 is the Gen 1/2 roll.)
+ROLL_MIN, ROLL_MAX = 85, 100
+
+
+def get_type_steps(move_type, defender_types, type_steps=TYPE_STEPS):
+    """Return the effectiveness as a count of x2 (positive) or /2 (negative)
+    steps, or None if the defender is immune."""
+    if not move_type or move_type == '???':
+        return 0
+    row = type_steps.get(move_type)
+    if not row:
+        return 0
+    steps = 0
+    for def_type in defender_types:
+        step = row.get(def_type, 0)
+        if step is None:
+            return None
+        steps += step
+    return steps
+
+
+def get_base_damage_int(initial_damage, attacker, defender, move, is_crit=False, weather=None,
+                        type_steps=TYPE_STEPS):
+    """Return the pre-roll damage using integer steps only, or None when the
+    move cannot deal damage (no power or an immunity)."""
+    if move.get('power', 0) == 0:
+        return None
+    move_type = move['type']
+    steps = get_type_steps(move_type, defender.get('types', []), type_steps)
+    if steps is None:
+        return None
+    physical = move.get('category') == 'Physical'
+
+    damage = initial_damage
+    if attacker.get('status') == 'brn' and physical and attacker.get('ability') != 'Guts':
+        damage //= 2
+
+    mod = WEATHER_MODS.get((weather, move_type))
+    if mod:
+        damage = damage * mod[0] // mod[1]
+
+    if physical and damage == 0:
+        damage = 1
+    damage += 2
+
+    if is_crit:
+        damage *= move.get('critModifier', 2)
+
+    if move_type != '???' and move_type in attacker.get('types', []):
+        damage = damage * 3 // 2
+
+    if steps > 0:
+        damage <<= steps
+    elif steps < 0:
+        damage >>= -steps
+    return damage
+
+
+def get_damage_range_int(initial_damage, attacker, defender, move, is_crit=False, weather=None,
+                         type_steps=TYPE_STEPS):
+    """Integer-only damage range in Showdown's ``modifyDamage`` order.
+
+    Unlike the float ``get_damage_range`` it floors after every step, so the
+    two differ whenever weather, STAB or a 0.25x resist truncates.  The
+    random roll is monotonic, so the extremes come straight from the
+    lowest and highest roll without building the whole distribution.
+    """
+    base = get_base_damage_int(initial_damage, attacker, defender, move, is_crit, weather, type_steps)
+    if base is None:
+        return 0, 0
+    return max(1, base * ROLL_MIN // ROLL_MAX), max(1, base)
+
+
+def get_damage_rolls_int(initial_damage, attacker, defender, move, is_crit=False, weather=None,
+                         type_steps=TYPE_STEPS):
+    """Return all 16 equally likely damage rolls (with repeats) as ints."""
+    base = get_base_damage_int(initial_damage, attacker, defender, move, is_crit, weather, type_steps)
+    if base is None:
+        return [0] * (ROLL_MAX - ROLL_MIN + 1)
+    return [max(1, base * r // ROLL_MAX) for r in range(ROLL_MIN, ROLL_MAX + 1)]
@@ -0,0 +1,202 @@
+"""Sample full opponent teams consistent with what a battle has revealed.
+
+Imperfect-information search (IS-MCTS and friends) needs many
+determinizations per decision: complete opponent teams that agree with
+every species, move, item and ability seen so far.  ``DeterminizationSampler``
+precomputes one ``SpeciesTable`` per species in the pool:
+
+* alias tables over the species' learnable Gen 3 moves and its own
+  abilities, weighted by a flat prior plus observed usage, and over the
+  items it was observed holding (no item when it was never observed);
+* the observed full sets for the species with their move bitmasks.
+
+A revealed member first tries whole observed sets, rejected with one mask
+test plus two equality checks, and after ``max_tries`` misses falls back
+to completing the revealed moves, item and ability from the per-slot
+tables.  Unrevealed slots are drawn from the tier pool under Species
+Clause.
+"""
+from __future__ import annotations
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+
+from .learnsets import to_id
+from .moves_loader import load_gen3_moves
+from .random_teams import AliasTable, RandomTeamGenerator
+from .team_builder import parse_showdown
+from .team_search import MemberGene, genes_from_team, legal_species_data
+
+
+@dataclass(frozen=True)
+class Revealed:
+    """What is known about one opponent member; empty fields are unseen."""
+    species: str
+    moves: frozenset[str] = frozenset()
+    item: str | None = None
+    ability: str | None = None
+
+
+@dataclass
+class Usage:
+    """Observed set frequencies, keyed by species id."""
+    sets: dict[str, Counter] = field(default_factory=dict)  # species -> Counter[MemberGene]
+
+    def add(self, gene: MemberGene, count: int = 1) -> None:
+        self.sets.setdefault(to_id(gene.species), Counter())[gene] += count
+
+    @classmethod
+    def from_teams(cls, texts, moves_db=None) -> 'Usage':
+        moves_db = moves_db or load_gen3_moves()
+        usage = cls()
+        for text in texts:
+            for gene in genes_from_team(parse_showdown(text, moves_db)):
+                usage.add(gene)
+        return usage
+
+    @classmethod
+    def from_store(cls, store, moves_db=None) -> 'Usage':
+        """Weight every team in a ``ResultStore`` by the battles it played."""
+        moves_db = moves_db or load_gen3_moves()
+        store.flush()
+        usage = cls()
+        rows = store.conn.execute(
+            "SELECT t.text, COUNT(s.battle) FROM teams t JOIN sides s ON s.team = t.hash GROUP BY t.hash")
+        for text, count in rows:
+            for gene in genes_from_team(parse_showdown(text, moves_db)):
+                usage.add(gene, count)
+        return usage
+
+
+class SpeciesTable:
+    """Precomputed candidate tables for one species."""
+    __slots__ = ('name', 'moves', 'move_bits', 'items', 'abilities', 'sets', 'set_rows')
+
+    def __init__(self, name: str, move_pool: list[str], abilities: list,
+                 observed: Counter | None, move_keys: dict[str, str], prior: float = 1.0,
+                 usage_weight: float = 10.0):
+        self.name = name
+        move_counts: Counter = Counter()
+        item_counts: Counter = Counter()
+        ability_counts: Counter = Counter()
+        observed = observed or Counter()
+        rows = []
+        for gene, count in observed.items():
+            moves = tuple(move_keys.get(to_id(m), m) for m in gene.moves)
+            gene = MemberGene(name, gene.item, gene.ability, gene.nature, gene.evs, moves, gene.level)
+            move_counts.update({m: count for m in moves})
+            item_counts[gene.item] += count
+            ability_counts[gene.ability] += count
+            rows.append((gene, count))
+        pool = list(dict.fromkeys([*move_pool, *move_counts]))
+        self.move_bits = {m: 1 << i for i, m in enumerate(pool)}
+        # None when neither the learnset nor usage knows a move for the species
+        self.moves = AliasTable(pool, [prior + usage_weight * move_counts[m] for m in pool]) if pool else None
+        # items are not species data: only what this species was seen holding
+        self.items = AliasTable(list(item_counts), list(item_counts.values())) if item_counts else AliasTable([None])
+        abilities = list(dict.fromkeys([*abilities, *ability_counts])) or [None]
+        self.abilities = AliasTable(abilities, [prior + usage_weight * ability_counts[a] for a in abilities])
+        # observed sets as (gene, move mask) rows behind one alias table
+        self.set_rows = [(gene, self.mask(gene.moves)) for gene, _ in rows]
+        self.sets = AliasTable(range(len(rows)), [c for _, c in rows]) if rows else None
+
+    def mask(self, moves) -> int:
+        bits = self.move_bits
+        out = 0
+        for m in moves:
+            out |= bits.get(m, 0)
+        return out
+
+
+class DeterminizationSampler:
+    """Draw opponent teams consistent with ``Revealed`` constraints."""
+
+    def __init__(self, generator: RandomTeamGenerator | None = None, usage: Usage | None = None,
+                 max_tries: int = 16, usage_weight: float = 10.0):
+        self.generator = generator or RandomTeamGenerator()
+        self.max_tries = max_tries
+        gen = self.generator
+        self.move_keys = {to_id(k): k for k in gen.moves_db}
+        observed = usage.sets if usage else {}
+        self.species_ids = {n: to_id(n) for n in gen.species.items}
+        names = {ident: n for n, ident in self.species_ids.items()}
+        for ident, counter in observed.items():
+            names.setdefault(ident, next(iter(counter)).species)
+        self.species_data = {name: (gen.move_table(name).items, gen.ability_table(name).items)
+                             for name in gen.species.items}
+        self.tables: dict[str, SpeciesTable] = {}
+        for ident, name in names.items():
+            self.tables[ident] = self._build(name, observed.get(ident), usage_weight)
+
+    def _species_data(self, name: str) -> tuple[list[str], list[str]]:
+        """Learnable moves and abilities of ``name``; empty when unknown."""
+        data = self.species_data.get(name)
+        if data is None:
+            learnable, abilities = legal_species_data([name]).get(name, (set(), []))
+            moves = [key for key in self.generator.registry if to_id(key) in learnable]
+            data = self.species_data[name] = (moves, abilities)
+        return data
+
+    def _build(self, name: str, observed: Counter | None, usage_weight: float = 10.0) -> SpeciesTable:
+        moves, abilities = self._species_data(name)
+        return SpeciesTable(name, moves, abilities, observed, self.move_keys, usage_weight=usage_weight)
+
+    def table(self, species: str) -> SpeciesTable:
+        """Candidate table for ``species``, built on first use for species outside the pool."""
+        ident = to_id(species)
+        table = self.tables.get(ident)
+        if table is None:
+            table = self.tables[ident] = self._build(species, None)
+        return table
+
+    def sample_member(self, table: SpeciesTable, rng: random.Random, moves: tuple[str, ...] = (),
+                      item: str | None = None, ability: str | None = None) -> MemberGene:
+        """One set for ``table``'s species containing ``moves`` and matching
+        ``item``/``ability`` where given."""
+        # a move no observed set has rules the set table out entirely
+        if table.sets is not None and all(m in table.move_bits for m in moves):
+            need = table.mask(moves)
+            rows = table.set_rows
+            for _ in range(self.max_tries):
+                gene, mask = rows[table.sets.sample(rng)]
+                if (mask & need == need and (item is None or gene.item == item)
+                        and (ability is None or gene.ability == ability)):
+                    return gene
+        chosen = list(moves[:4])
+        target = max(len(chosen), min(4, table.moves.n if table.moves else 0))
+        while len(chosen) < target:
+            mv = table.moves.sample(rng)
+            if mv not in chosen:
+                chosen.append(mv)
+        gen = self.generator
+        return MemberGene(table.name,
+                          item if item is not None else table.items.sample(rng),
+                          ability if ability is not None else table.abilities.sample(rng),
+                          gen.natures.sample(rng), gen.spreads.sample(rng), tuple(chosen), gen.level)
+
+    def sample(self, revealed: list[Revealed], rng: random.Random, size: int = 6) -> tuple[MemberGene, ...]:
+        """Return one determinization: the revealed members in order, then
+        ``size - len(revealed)`` unseen members with distinct species."""
+        members = []
+        taken = set()
+        for info in revealed:
+            table = self.table(info.species)
+            moves = tuple(self.move_keys.get(to_id(m), m) for m in info.moves)
+            item = to_id(info.item) if info.item else None
+            ability = to_id(info.ability) if info.ability else None
+            members.append(self.sample_member(table, rng, moves, item, ability))
+            taken.add(to_id(table.name))
+        species, ids = self.generator.species, self.species_ids
+        if size - len(members) > len(set(ids.values()) - taken):
+            raise ValueError(f"Not enough unrevealed species in the tier pool for a team of {size}")
+        while len(members) < size:
+            ident = ids[species.sample(rng)]
+            if ident in taken:
+                continue
+            taken.add(ident)
+            members.append(self.sample_member(self.tables[ident], rng))
+        return tuple(members)
+
+    def sample_many(self, revealed: list[Revealed], count: int, rng: random.Random,
+                    size: int = 6) -> list[tuple[MemberGene, ...]]:
+        return [self.sample(revealed, rng, size) for _ in range(count)]
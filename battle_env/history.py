@@ -0,0 +1,96 @@
+"""Compact per-turn battle history as keyframes plus state deltas.
+
+A state is a flat dict with one entry per tracked field, e.g.
+``"p1.0.hp"``, ``"p1.0.stages"``, ``"p2.active"`` or ``"weather"``.  Every
+key is present in every state, so a delta is simply the entries whose
+value changed and applying it is a ``dict.update``.  Values are ints,
+strings, ``None`` or tuples, so states and deltas serialise to JSON as is.
+"""
+from __future__ import annotations
+
+STAGE_KEYS = ('atk', 'def', 'spa', 'spd', 'spe', 'accuracy', 'evasion')
+
+
+def snapshot_state(battle) -> dict:
+    """Return the flat state of ``battle``."""
+    state: dict = {'weather': battle.weather, 'weather_turns': battle.weather_turns}
+    for side, team in ((1, battle.team1), (2, battle.team2)):
+        p = f"p{side}"
+        state[f"{p}.active"] = team.active_index
+        state[f"{p}.hazards"] = tuple(sorted(team.hazards.items()))
+        state[f"{p}.screens"] = tuple(sorted(team.screens.items()))
+        for i, mon in enumerate(team.members):
+            m = f"{p}.{i}"
+            state[f"{m}.hp"] = mon.current_hp
+            state[f"{m}.stages"] = tuple(mon.stages.get(k, 0) for k in STAGE_KEYS)
+            state[f"{m}.status"] = mon.status
+            state[f"{m}.counters"] = (mon.toxic_counter, mon.sleep_counter)
+            state[f"{m}.volatiles"] = tuple(sorted((k, v.get('duration')) for k, v in mon.volatiles.items()))
+            state[f"{m}.pp"] = tuple(mv.current_pp for mv in mon.moves)
+    return state
+
+
+def diff_states(prev: dict, cur: dict) -> dict:
+    """Return the entries of ``cur`` that differ from ``prev``."""
+    return {k: v for k, v in cur.items() if k not in prev or prev[k] != v}
+
+
+class BattleHistory:
+    """Per-turn history stored as a keyframe every ``keyframe_every`` turns.
+
+    ``Battle`` created with ``record_history=True`` records once at
+    ``start`` and once after every turn, so ``state_at(n)`` is the state
+    after turn ``n`` (0 being the start), rebuilt from the nearest earlier
+    keyframe.  Faint replacements show up in the following turn's delta.
+    """
+
+    def __init__(self, keyframe_every: int = 50):
+        self.keyframe_every = keyframe_every
+        self.keyframes: dict[int, dict] = {}
+        self.deltas: list[dict] = []
+        self._last: dict | None = None
+
+    def __len__(self) -> int:
+        return len(self.deltas)
+
+    def record(self, battle) -> dict:
+        """Append the current state of ``battle``; return the stored delta."""
+        state = snapshot_state(battle)
+        index = len(self.deltas)
+        if self._last is None or index % self.keyframe_every == 0:
+            self.keyframes[index] = state
+            delta = {} if self._last is None else diff_states(self._last, state)
+        else:
+            delta = diff_states(self._last, state)
+        self.deltas.append(delta)
+        self._last = state
+        return delta
+
+    def state_at(self, index: int) -> dict:
+        """Reconstruct the state recorded at position ``index``."""
+        if index < 0:
+            index += len(self.deltas)
+        if not 0 <= index < len(self.deltas):
+            raise IndexError(f"No recorded turn {index}")
+        base = max(k for k in self.keyframes if k <= index)
+        state = dict(self.keyframes[base])
+        for delta in self.deltas[base + 1:index + 1]:
+            state.update(delta)
+        return state
+
+    def to_json(self) -> dict:
+        """JSON-ready form; tuples come back as lists from ``from_json``."""
+        return {
+            'keyframe_every': self.keyframe_every,
+            'keyframes': {str(k): v for k, v in self.keyframes.items()},
+            'deltas': self.deltas,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> 'BattleHistory':
+        history = cls(data['keyframe_every'])
+        history.keyframes = {int(k): v for k, v in data['keyframes'].items()}
+        history.deltas = list(data['deltas'])
+        if history.deltas:
+            history._last = history.state_at(len(history.deltas) - 1)
+        return history
@@ -9,6 +9,20 @@ if TYPE_CHECKING:
     from .battle import Battle
 
 
+ITEMS_LIST_FILE = Path(__file__).parent.parent / 'Items_list.xlsx'
+_item_names: dict[str, str] | None = None
+
+
+def item_names() -> dict[str, str]:
+    """``{item id: display name}`` for the Gen 3 items in ``Items_list.xlsx``."""
+    global _item_names
+    if _item_names is None:
+        import pandas as pd
+        names = pd.read_excel(ITEMS_LIST_FILE)['Item']
+        _item_names = {''.join(c for c in str(n).lower() if c.isalnum()): str(n) for n in names}
+    return _item_names
+
+
 def load_items(path: str | Path | None = None) -> dict[str, type]:
     if path is None:
         path = Path(__file__).parent.parent / 'data' / 'items.json'
@@ -44,6 +58,7 @@ class Item:
             if apply:
                 for stat, mult in boosts.items():
                     self.owner.stats[stat] = int(self.owner.stats[stat] * mult)
+                self.owner.invalidate_stats()
 
     def on_switch_in(self, battle: 'Battle'):
         self.on_start(battle)
@@ -0,0 +1,281 @@
+from __future__ import annotations
+import json
+import re
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+# Showdown's main data/learnsets.ts (every generation, sources like "3L40");
+# used for Gen 3 legality when present.
+GEN3_LEARNSETS_FILE = ROOT / "data" / "learnsets.ts"
+GEN2_LEARNSETS_FILE = ROOT / "2gen_env_Showdown" / "learnsets.ts"
+PREVOS_FILE = ROOT / "data" / "prevos.json"
+BASE_MOVES_FILE = ROOT / "data" / "base_moves.ts"
+RULESETS_FILES = [
+    ROOT / "2gen_env_Showdown" / "rulesets.ts",
+    ROOT / "3gen_env_Showdown" / "rulesets.ts",
+]
+DEFAULT_RULES = ("obtainablemoves", "standard")
+# highest move number introduced by each generation
+LAST_MOVE_NUM = {1: 165, 2: 251, 3: 354}
+
+_ENTRY_RE = re.compile(r"^\t(\w+): \{$")
+_LEARN_RE = re.compile(r"^\t\t\t(\w+): \[(.*)\]")
+_SOURCE_RE = re.compile(r"['\"](\d)")
+_MOVE_NUM_RE = re.compile(r'^\t"?(\w+)"?: \{\n\t\tnum: (\d+),', re.M)
+_QUOTED_RE = re.compile(r"'((?:[^'\\]|\\.)*)'|\"((?:[^\"\\]|\\.)*)\"")
+
+_index: "LearnsetIndex | None" = None
+
+
+def to_id(name: str) -> str:
+    """Showdown-style id: lowercase alphanumerics only."""
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+def species_id(name: str) -> str:
+    """Showdown id of a species as the base stats spreadsheet names it
+    (``Nidoran♀`` -> ``nidoranf``, ``Deoxys Attack Forme`` -> ``deoxysattack``)."""
+    name = name.replace("\u2640", "f").replace("\u2642", "m")
+    return to_id(re.sub(r"(?: Normal)? Forme$", "", name, flags=re.I))
+
+
+def default_learnsets() -> tuple[Path, int]:
+    """Return the learnset file to validate Gen 3 teams with and its generation.
+
+    Falls back to the bundled Gen 2 data when Showdown's main learnsets file
+    has not been added to ``data/``.
+    """
+    if GEN3_LEARNSETS_FILE.exists():
+        return GEN3_LEARNSETS_FILE, 3
+    return GEN2_LEARNSETS_FILE, 2
+
+
+def source_gens(gen: int) -> set[str]:
+    """Learnset source prefixes usable in ``gen``: Gen 1 and 2 trade with
+    each other, but nothing before Gen 3 transfers forward."""
+    return {"1", "2"} if gen <= 2 else {str(g) for g in range(3, gen + 1)}
+
+
+def load_prevos(path: str | Path | None = None) -> dict[str, str]:
+    """Read ``{species_id: pre-evolution id}``."""
+    path = Path(path) if path is not None else PREVOS_FILE
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def inherit_prevo_moves(learnsets: dict[str, set[str]], prevos: dict[str, str]) -> dict[str, set[str]]:
+    """Add every move learnable by a species' pre-evolutions to its learnset,
+    so egg and level-up moves learned before evolving count."""
+    merged: dict[str, set[str]] = {}
+    for species, learnable in learnsets.items():
+        moves = set(learnable)
+        prevo = prevos.get(species)
+        while prevo is not None:
+            moves |= learnsets.get(prevo, set())
+            prevo = prevos.get(prevo)
+        merged[species] = moves
+    return merged
+
+
+def load_learnsets(path: str | Path | None = None, gen: int | None = None,
+                   prevos: dict[str, str] | None = None) -> dict[str, set[str]]:
+    """Read a Showdown ``learnsets.ts`` into ``{species_id: {move_id, ...}}``.
+
+    With ``gen`` set only sources usable in that generation are kept.  The
+    default is ``default_learnsets()`` with pre-evolution moves inherited
+    from ``load_prevos()``; pass ``prevos={}`` for the raw per-species data.
+    """
+    if path is None:
+        path, gen = default_learnsets()
+    if prevos is None:
+        prevos = load_prevos()
+    allowed = source_gens(gen) if gen is not None else None
+    learnsets: dict[str, set[str]] = {}
+    species = None
+    in_learnset = False
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        m = _ENTRY_RE.match(line)
+        if m:
+            species = m.group(1)
+            learnsets[species] = set()
+            in_learnset = False
+            continue
+        if line == "\t\tlearnset: {":
+            in_learnset = True
+            continue
+        if line.startswith("\t\t}"):
+            in_learnset = False
+            continue
+        if in_learnset and species is not None:
+            m = _LEARN_RE.match(line)
+            if m and (allowed is None or allowed.intersection(_SOURCE_RE.findall(m.group(2)))):
+                learnsets[species].add(m.group(1))
+    return inherit_prevo_moves(learnsets, prevos) if prevos else learnsets
+
+
+def load_banlists(paths: list[str | Path] | None = None) -> dict[str, list[str]]:
+    """Collect ``banlist`` entries per rule id from Showdown ``rulesets.ts`` files."""
+    if paths is None:
+        paths = RULESETS_FILES
+    banlists: dict[str, list[str]] = {}
+    for path in paths:
+        if not Path(path).exists():
+            continue
+        rule = None
+        in_banlist = False
+        for line in Path(path).read_text(encoding="utf-8").splitlines():
+            m = _ENTRY_RE.match(line)
+            if m:
+                rule = m.group(1)
+                in_banlist = False
+                continue
+            stripped = line.strip()
+            if rule and stripped.startswith("banlist: ["):
+                in_banlist = True
+                stripped = stripped[len("banlist: ["):]
+            if not in_banlist or stripped.startswith("//"):
+                continue
+            for sq, dq in _QUOTED_RE.findall(stripped):
+                entry = (sq or dq).replace("\\'", "'").replace('\\"', '"')
+                banlists.setdefault(rule, []).append(entry)
+            if stripped.endswith("],") or stripped.endswith("]"):
+                in_banlist = False
+    return banlists
+
+
+class LearnsetIndex:
+    """Precompiled learnsets as integer bitsets over move ids.
+
+    ``learn_masks[species_id]`` has bit ``move_ids[move]`` set for every move
+    the species can learn.  Banned combinations are compiled into move masks
+    grouped by species (``species_combos``) or applying to everyone
+    (``global_combos``), so a set is checked with a handful of ``&`` and
+    ``==`` operations on Python ints.
+
+    ``unchecked`` lists moves newer than the learnset data; they are left
+    out of move masks instead of being reported as unlearnable.
+    """
+
+    def __init__(self, learnsets: dict[str, set[str]], banlist: list[str], items: set[str] | None = None,
+                 unchecked: set[str] | None = None):
+        moves = set()
+        for learnable in learnsets.values():
+            moves |= learnable
+        self.species_ids: dict[str, int] = {sp: i for i, sp in enumerate(sorted(learnsets))}
+        self.move_ids: dict[str, int] = {mv: i for i, mv in enumerate(sorted(moves))}
+        self.learn_masks: list[int] = [0] * len(self.species_ids)
+        for sp, learnable in learnsets.items():
+            mask = 0
+            for mv in learnable:
+                mask |= 1 << self.move_ids[mv]
+            self.learn_masks[self.species_ids[sp]] = mask
+        self.items = items or set()
+        self.unchecked = unchecked or set()
+        self.species_combos: dict[int, list[tuple[int, str]]] = {}
+        self.global_combos: list[tuple[int, str]] = []
+        self.banned_species: set[int] = set()
+        self.banned_items: set[str] = set()
+        self.unsupported: list[str] = []
+        for entry in banlist:
+            self._compile(entry)
+
+    def _compile(self, entry: str) -> None:
+        species = None
+        mask = 0
+        for part in entry.split("+"):
+            ident = to_id(part)
+            if ident in self.species_ids:
+                if species is not None:
+                    self.unsupported.append(entry)
+                    return
+                species = self.species_ids[ident]
+            elif ident in self.move_ids:
+                mask |= 1 << self.move_ids[ident]
+            elif ident in self.items and "+" not in entry:
+                self.banned_items.add(ident)
+                return
+            else:
+                self.unsupported.append(entry)
+                return
+        if not mask:
+            if species is not None:
+                self.banned_species.add(species)
+            return
+        if species is None:
+            self.global_combos.append((mask, entry))
+        else:
+            self.species_combos.setdefault(species, []).append((mask, entry))
+
+    def move_mask(self, moves) -> tuple[int, list[str]]:
+        """Return the bitset for ``moves`` and any move ids outside the index."""
+        mask = 0
+        unknown = []
+        for mv in moves:
+            bit = self.move_ids.get(mv)
+            if bit is None:
+                if mv not in self.unchecked:
+                    unknown.append(mv)
+            else:
+                mask |= 1 << bit
+        return mask, unknown
+
+    def illegal_moves(self, species_id: int, mask: int) -> int:
+        """Return the bits of ``mask`` the species cannot learn."""
+        return mask & ~self.learn_masks[species_id]
+
+    def banned_combo(self, species_id: int | None, mask: int) -> str | None:
+        """Return the first banned combination matched by ``mask``, if any."""
+        for combo, entry in self.global_combos:
+            if mask & combo == combo:
+                return entry
+        if species_id is not None:
+            for combo, entry in self.species_combos.get(species_id, ()):
+                if mask & combo == combo:
+                    return entry
+        return None
+
+    def is_legal(self, species_id: int, mask: int) -> bool:
+        """Fast legality check for a compiled (species, move mask) pair."""
+        if species_id in self.banned_species or mask & ~self.learn_masks[species_id]:
+            return False
+        return self.banned_combo(species_id, mask) is None
+
+
+def _load_item_ids() -> set[str]:
+    path = ROOT / "data" / "items.json"
+    if not path.exists():
+        return set()
+    return set(json.loads(path.read_text()))
+
+
+def _newer_moves(gen: int) -> set[str]:
+    """Ids of the Gen 3 moves introduced after ``gen``."""
+    if not BASE_MOVES_FILE.exists():
+        return set()
+    first, last = LAST_MOVE_NUM.get(gen, LAST_MOVE_NUM[3]), LAST_MOVE_NUM[3]
+    return {ident for ident, num in _MOVE_NUM_RE.findall(BASE_MOVES_FILE.read_text(encoding="utf-8"))
+            if first < int(num) <= last}
+
+
+def build_learnset_index(
+    learnsets_path: str | Path | None = None,
+    rulesets_paths: list[str | Path] | None = None,
+    rules: tuple[str, ...] = DEFAULT_RULES,
+    gen: int | None = None,
+) -> LearnsetIndex:
+    """Compile the learnsets and banlists; ``gen`` is the generation of the
+    learnset data (inferred for the default file)."""
+    if learnsets_path is None:
+        learnsets_path, gen = default_learnsets()
+    learnsets = load_learnsets(learnsets_path, gen)
+    banlists = load_banlists(rulesets_paths)
+    banlist = [entry for rule in rules for entry in banlists.get(rule, [])]
+    unchecked = _newer_moves(gen) if gen is not None and gen < 3 else set()
+    return LearnsetIndex(learnsets, banlist, _load_item_ids(), unchecked)
+
+
+def get_learnset_index() -> LearnsetIndex:
+    """Return the shared default index, building it on first use."""
+    global _index
+    if _index is None:
+        _index = build_learnset_index()
+    return _index
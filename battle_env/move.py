@@ -35,6 +35,12 @@ class Move:
             raise ValueError(f"No PP left for move {self.name}.")
         self.current_pp -= 1
 
+    def copy(self) -> "Move":
+        """Return a per-Pokémon copy sharing the read-only ``metadata`` and ``flags``."""
+        clone = Move.__new__(Move)
+        clone.__dict__.update(self.__dict__)
+        return clone
+
     def __repr__(self):
         return (
             f"<Move {self.name}: {self.type} {self.category}, Power={self.power}, "
@@ -1,5 +1,8 @@
 from __future__ import annotations
+import argparse
 import json
+import re
+from collections.abc import Mapping
 from pathlib import Path
 import pandas as pd
 from .move import Move
@@ -16,9 +19,23 @@ PHYSICAL_TYPES = [
     "Steel",
 ]
 
+GEN3_MAX_NUM = 354
+GEN3_MOVES_FILE = Path(__file__).parent.parent / "data" / "moves_gen3.json"
+GEN3_META_FILE = Path(__file__).parent.parent / "data" / "moves_gen3_meta.json"
+BASE_MOVES_FILE = Path(__file__).parent.parent / "data" / "base_moves.ts"
+# Column order of the compact Gen 3 move table.
+GEN3_FIELDS = ["id", "name", "type", "power", "category", "accuracy", "priority", "pp", "flags"]
+# Metadata keys that only matter to other generations or to the Showdown UI.
+_DROPPED_META = {"isZ", "isMax", "zMove", "maxMove", "isNonstandard", "contestType", "inherit"}
+_CALLBACK_RE = re.compile(r"^(?:async\s+)?[\w$]+\s*\([^)]*\)\s*\{|^function\b|^\([^)]*\)\s*=>")
+
 _cache: dict[str, dict] | None = None
+_gen3_meta: dict[str, dict] | None = None
 CACHE_FILE = Path(__file__).parent.parent / "data" / "move_cache.json"
 _name_map: dict[str, str] | None = None
+_display_names: dict[str, str] | None = None
+_BASE_ENTRY_RE = re.compile(r'^\t"?(\w+)"?: \{$')
+_BASE_NAME_RE = re.compile(r'^\t\tname: "([^"]+)",$')
 _xlsx_data: dict[str, dict] | None = None
 
 
@@ -175,3 +192,151 @@ def load_moves(path: str | Path | None = None) -> dict[str, Move]:
             moves[mv.name.lower()] = mv
 
     return moves
+
+
+def move_display_names() -> dict[str, str]:
+    """``{move id: display name}`` from Showdown's ``base_moves.ts``
+    (the Gen 3 table keeps some names as ids, e.g. ``doubleedge``)."""
+    global _display_names
+    if _display_names is None:
+        _display_names = {}
+        ident = None
+        for line in BASE_MOVES_FILE.read_text(encoding="utf-8").splitlines():
+            m = _BASE_ENTRY_RE.match(line)
+            if m:
+                ident = m.group(1)
+            elif ident and (m := _BASE_NAME_RE.match(line)):
+                _display_names[ident] = m.group(1)
+                ident = None
+    return _display_names
+
+
+def _is_gen3(meta: dict) -> bool:
+    """Whether a moves.json entry exists in Gen 3.
+
+    Entries without ``num`` are generation mod overrides of older moves.
+    """
+    if meta.get("isZ") or meta.get("isMax"):
+        return False
+    num = meta.get("num")
+    return num is None or 0 < num <= GEN3_MAX_NUM
+
+
+def _strip_meta(value):
+    """Drop stringified Showdown callbacks and non-Gen 3 keys from metadata."""
+    if isinstance(value, dict):
+        return {
+            k: _strip_meta(v)
+            for k, v in value.items()
+            if k not in _DROPPED_META
+            and not (isinstance(v, str) and _CALLBACK_RE.match(v))
+        }
+    if isinstance(value, list):
+        return [_strip_meta(v) for v in value]
+    return value
+
+
+def build_gen3_moves(
+    path: str | Path | None = None,
+    out_path: str | Path = GEN3_MOVES_FILE,
+    meta_path: str | Path = GEN3_META_FILE,
+) -> None:
+    """Write the pruned Gen 3 move tables used by ``load_gen3_moves``.
+
+    Hot fields are baked in after the spreadsheet overrides and Gen 3
+    category rules from ``load_moves``, so loading needs neither pandas nor
+    ``moves.json``.
+    """
+    table: dict[str, list] = {}
+    metadata: dict[str, dict] = {}
+    for key, mv in load_moves(path).items():
+        if mv.metadata and not _is_gen3(mv.metadata):
+            continue
+        table[key] = [mv.id, mv.name, mv.type, mv.power, mv.category,
+                      mv.accuracy, mv.priority, mv.max_pp, mv.flags]
+        if mv.metadata:
+            metadata[key] = _strip_meta(mv.metadata)
+    Path(out_path).write_text(json.dumps({"fields": GEN3_FIELDS, "moves": table}, separators=(",", ":")))
+    Path(meta_path).write_text(json.dumps(metadata, separators=(",", ":")))
+
+
+def _load_gen3_meta() -> dict[str, dict]:
+    global _gen3_meta
+    if _gen3_meta is None:
+        _gen3_meta = json.loads(GEN3_META_FILE.read_text()) if GEN3_META_FILE.exists() else {}
+    return _gen3_meta
+
+
+class LazyMoveMetadata(Mapping):
+    """Read-only view of a move's metadata, loaded on first access.
+
+    The metadata file is parsed once per process and shared by every move.
+    """
+    __slots__ = ("_key", "_data")
+
+    def __init__(self, key: str):
+        self._key = key
+        self._data = None
+
+    def _get(self) -> dict:
+        if self._data is None:
+            self._data = _load_gen3_meta().get(self._key, {})
+        return self._data
+
+    def __getitem__(self, item):
+        return self._get()[item]
+
+    def __iter__(self):
+        return iter(self._get())
+
+    def __len__(self):
+        return len(self._get())
+
+    def __repr__(self):
+        return f"<LazyMoveMetadata {self._key}>"
+
+
+def load_gen3_moves(path: str | Path | None = None) -> dict[str, Move]:
+    """Load the pruned Gen 3 move table written by ``build_gen3_moves``.
+
+    Only the hot fields are read eagerly; ``Move.metadata`` is a
+    ``LazyMoveMetadata`` that loads the rest on first access.
+    """
+    path = Path(path) if path is not None else GEN3_MOVES_FILE
+    if not path.exists():
+        raise FileNotFoundError(f"{path} is missing; build it with `python -m battle_env.moves_loader`")
+    raw = json.loads(path.read_text())
+    idx = {name: i for i, name in enumerate(raw["fields"])}
+    i_id, i_name, i_type, i_power, i_cat, i_acc, i_pri, i_pp, i_flags = (
+        idx[f] for f in GEN3_FIELDS
+    )
+    moves: dict[str, Move] = {}
+    for key, row in raw["moves"].items():
+        mv = Move(
+            name=row[i_name],
+            move_type=row[i_type],
+            power=row[i_power],
+            category=row[i_cat],
+            accuracy=row[i_acc],
+            priority=row[i_pri],
+            max_pp=row[i_pp],
+        )
+        mv.id = row[i_id]
+        mv.flags = row[i_flags]
+        mv.metadata = LazyMoveMetadata(key)
+        moves[key] = mv
+    return moves
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Build the pruned Gen 3 move tables from moves.json.")
+    parser.add_argument('--moves', help="source moves.json (default data/moves.json)")
+    parser.add_argument('--out', default=str(GEN3_MOVES_FILE))
+    parser.add_argument('--meta', default=str(GEN3_META_FILE))
+    args = parser.parse_args(argv)
+    build_gen3_moves(args.moves, args.out, args.meta)
+    print(f"Wrote {args.out} and {args.meta}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,12 @@
+# Exact stage multipliers as (numerator, denominator), indexed by stage + 6.
+STAGE_FRACTIONS: list[tuple[int, int]] = [
+    (2, 2 - s) if s < 0 else (2 + s, 2) for s in range(-6, 7)
+]
+ACC_STAGE_FRACTIONS: list[tuple[int, int]] = [
+    (3, 3 - s) if s < 0 else (3 + s, 3) for s in range(-6, 7)
+]
+
+
 class StatStage:
     """Helper to compute Gen 3 stat and accuracy/evasion multipliers for stages (−6 to +6)."""
     @staticmethod
@@ -46,6 +55,18 @@ NATURE_MODIFIERS: dict[str, tuple[str | None, str | None]] = {
 }
 
 
+_struggle = None
+
+
+def get_struggle():
+    """Return a fresh copy of Struggle, loading the move database once."""
+    global _struggle
+    if _struggle is None:
+        from .moves_loader import load_gen3_moves
+        _struggle = load_gen3_moves().get("struggle")
+    return _struggle.copy()
+
+
 class Pokemon:
     """
     Represents a Gen 3 Pokémon with stats, stat stages, status, ability, item, and moveset.
@@ -77,6 +98,14 @@ class Pokemon:
 
         # Calculate actual stats
         self.stats = self._calc_actual_stats()
+
+        # Moveset: list of Move objects
+        self.moves = moves or []
+
+        self.reset_battle_state()
+
+    def reset_battle_state(self):
+        """Initialise the per-battle fields: HP, stages, status and volatiles."""
         self.current_hp = self.stats['hp']
 
         # Stat stages: -6 to +6 for atk, def, spa, spd, spe, accuracy, evasion
@@ -88,13 +117,15 @@ class Pokemon:
         self.status: str | None = None
         self.toxic_counter: int = 0
         self.sleep_counter: int = 0
-
-        # Moveset: list of Move objects
-        self.moves = moves or []
 
         # Volatile conditions such as "attract" or "substitute"
         self.volatiles: dict[str, dict] = {}
 
+        # Effective stat caches, dropped by change_stage/invalidate_stats
+        # (and, for the status-aware variant, by status changes).
+        self._stat_cache: dict[str, int] = {}
+        self._effective_cache: dict[str, int] = {}
+
     def _calc_actual_stats(self) -> dict[str, int]:
         """Calculate actual HP, atk, def, spa, spd, spe using Gen 3 formulas."""
         stats: dict[str, int] = {}
@@ -115,10 +146,36 @@ class Pokemon:
 
     def get_modified_stat(self, stat: str) -> int:
         """Return a stat value after applying its stage multiplier."""
-        base_value = self.stats[stat]
-        stage = self.stages.get(stat, 0)
-        is_acc_eva = stat in ['accuracy', 'evasion']
-        return int(base_value * StatStage.multiplier(stage, is_acc_eva))
+        value = self._stat_cache.get(stat)
+        if value is None:
+            stage = self.stages.get(stat, 0)
+            table = ACC_STAGE_FRACTIONS if stat in ('accuracy', 'evasion') else STAGE_FRACTIONS
+            num, den = table[stage + 6]
+            value = self.stats[stat] * num // den
+            self._stat_cache[stat] = value
+        return value
+
+    def get_effective_stat(self, stat: str) -> int:
+        """Return the staged stat adjusted for status.
+
+        Paralysis quarters Speed and burn halves Attack (unless the Pokémon
+        has Guts).  ``get_damage_range`` already applies the burn penalty, so
+        the damage pipeline should keep using ``get_modified_stat``.
+        """
+        value = self._effective_cache.get(stat)
+        if value is None:
+            value = self.get_modified_stat(stat)
+            if stat == 'spe' and self.status == 'par':
+                value //= 4
+            elif stat == 'atk' and self.status == 'brn' and getattr(self.ability, 'name', self.ability) not in ('Guts', 'guts'):
+                value //= 2
+            self._effective_cache[stat] = value
+        return value
+
+    def invalidate_stats(self):
+        """Drop cached effective stats after ``stats`` was changed directly."""
+        self._stat_cache.clear()
+        self._effective_cache.clear()
 
     def apply_damage(self, amount: int) -> int:
         """Subtract HP by amount (min 0) and return new HP."""
@@ -134,6 +191,7 @@ class Pokemon:
         if self.status:
             raise ValueError(f"{self.name} already has status {self.status}.")
         self.status = status
+        self._effective_cache.clear()
         if status == 'tox':
             self.toxic_counter = 1
         if status == 'slp':
@@ -142,20 +200,25 @@ class Pokemon:
     def heal_status(self):
         """Clear any status condition."""
         self.status = None
+        self._effective_cache.clear()
         self.toxic_counter = 0
         self.sleep_counter = 0
 
     def change_stage(self, stat: str, delta: int):
         """Modify a stat stage by delta, clamped between -6 and +6."""
         new_stage = max(-6, min(6, self.stages.get(stat, 0) + delta))
-        self.stages[stat] = new_stage
+        if new_stage != self.stages.get(stat):
+            self.stages[stat] = new_stage
+            self._stat_cache.pop(stat, None)
+            self._effective_cache.pop(stat, None)
 
     def choose_move(self, index: int):
-        """Select a move by index and decrement its PP."""
-        if not self.moves:
-            from .moves_loader import load_moves
-            struggle = load_moves().get("struggle")
-            return struggle
+        """Select a move by index and decrement its PP.
+
+        Returns Struggle when the Pokémon has no moves or no PP left at all.
+        """
+        if not self.moves or not any(m.current_pp > 0 for m in self.moves):
+            return get_struggle()
         if index < 0 or index >= len(self.moves):
             raise IndexError("Invalid move index.")
         move = self.moves[index]
@@ -0,0 +1,226 @@
+"""Opt-in allocation profiling for a single battle.
+
+``profile_battle`` runs a battle under ``tracemalloc`` and reports, per
+engine phase (team construction, setup, policy calls, faint switches,
+turns), the memory retained and the peak reached while the phase ran.
+Memory still held at the end is attributed to object categories by the
+engine function on the allocating traceback: Pokémon, Move copies,
+volatile dicts, damage-calc temporaries and everything else by function.
+Log strings are the messages still referenced by ``Battle.log_messages``,
+wherever they were formatted.  Short-lived temporaries are freed before
+the end of a turn, so they appear in the ``turn`` phase peak rather than
+in the category totals.
+
+Profiling slows the engine down several times; never leave it on for
+normal runs.
+
+    python -m battle_env.profiling team1.txt team2.txt
+"""
+from __future__ import annotations
+import gc
+import os
+import sys
+import tracemalloc
+import types
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from .battle import Battle, random_policy
+from .moves_loader import load_gen3_moves
+from .move import Move
+from .pokemon import Pokemon
+from .team import Team
+from .team_builder import parse_showdown
+
+ENGINE_DIR = Path(__file__).parent
+TRACE_FRAMES = 32
+# (category, predicate on (filename, function qualname)); tried from the
+# innermost engine frame outwards, first match wins
+_CATEGORY_RULES: list[tuple[str, Callable[[str, str], bool]]] = [
+    ('log strings', lambda fn, func: func == 'Battle.log'),
+    ('volatiles', lambda fn, func: func.startswith('Pokemon.add_volatile')),
+    ('Move copies', lambda fn, func: func.startswith('Move.copy')),
+    ('damage temps', lambda fn, func: fn == 'damage.py'),
+    ('Pokemon', lambda fn, func: func.startswith('Pokemon.')),
+]
+
+
+@dataclass
+class PhaseStats:
+    calls: int = 0
+    net: int = 0   # bytes still allocated when the phase returned
+    peak: int = 0  # highest bytes above the phase's starting point
+
+
+@dataclass
+class AllocationReport:
+    turns: int
+    phases: dict[str, PhaseStats]
+    categories: dict[str, int]
+    live_objects: dict[str, int] = field(default_factory=dict)
+    top_lines: list[tuple[str, int]] = field(default_factory=list)
+
+    @property
+    def bytes_per_turn(self) -> float:
+        turn = self.phases.get('turn')
+        return turn.net / self.turns if turn and self.turns else 0.0
+
+    def format(self) -> str:
+        lines = [f"turns: {self.turns}, retained per turn: {self.bytes_per_turn:.0f} B"]
+        lines.append("phase          calls        net       peak")
+        for name, st in self.phases.items():
+            lines.append(f"{name:<12} {st.calls:>7} {st.net:>10} {st.peak:>10}")
+        lines.append("retained by category:")
+        for name, size in sorted(self.categories.items(), key=lambda kv: -kv[1]):
+            lines.append(f"  {name:<24} {size:>10}")
+        if self.live_objects:
+            lines.append("live objects: " + ", ".join(f"{k}={v}" for k, v in self.live_objects.items()))
+        return "\n".join(lines)
+
+
+class _Phases:
+    """Accumulate retained/peak bytes for named phases."""
+
+    def __init__(self):
+        self.stats: dict[str, PhaseStats] = {}
+
+    def run(self, name: str, fn, *args):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        try:
+            return fn(*args)
+        finally:
+            after, peak = tracemalloc.get_traced_memory()
+            st = self.stats.setdefault(name, PhaseStats())
+            st.calls += 1
+            st.net += after - before
+            st.peak = max(st.peak, peak - before)
+
+
+_functions: dict[str, dict[int, str]] = {}
+
+
+def _function_at(frame: tracemalloc.Frame) -> str | None:
+    """Qualified name of the engine function running ``frame``'s line, or
+    None outside ``battle_env``."""
+    lines = _functions.get(frame.filename)
+    if lines is None:
+        lines = _functions[frame.filename] = {}
+        path = Path(frame.filename)
+        if path.parent == ENGINE_DIR and path.exists():
+            # breadth first, so nested functions overwrite their parent's lines
+            codes = [compile(path.read_text(encoding='utf-8'), frame.filename, 'exec')]
+            for code in codes:
+                for _, _, lineno in code.co_lines():
+                    if lineno is not None:
+                        lines[lineno] = code.co_qualname
+                codes.extend(c for c in code.co_consts if isinstance(c, types.CodeType))
+    return lines.get(frame.lineno)
+
+
+def _category(traceback: tracemalloc.Traceback) -> str:
+    innermost = None
+    for frame in reversed(traceback):
+        func = _function_at(frame)
+        if func is None:
+            continue
+        fn = os.path.basename(frame.filename)
+        for name, match in _CATEGORY_RULES:
+            if match(fn, func):
+                return name
+        innermost = innermost or f"other ({fn}: {func})"
+    return innermost or f"other ({os.path.basename(traceback[-1].filename)})"
+
+
+def _engine_objects() -> list:
+    return [o for o in gc.get_objects() if isinstance(o, (Pokemon, Move))]
+
+
+def _live_objects(existing: set[int]) -> dict[str, int]:
+    """Pokémon and moves alive now that were not in ``existing`` (ids)."""
+    counts = Counter(type(o).__name__ for o in _engine_objects() if id(o) not in existing)
+    return dict(counts)
+
+
+def profile_battle(make_teams: Callable[[], tuple[Team, Team]], policy1=random_policy, policy2=random_policy,
+                   max_turns: int = 500, top: int = 10) -> AllocationReport:
+    """Build two teams with ``make_teams`` and play them out under tracemalloc."""
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start(TRACE_FRAMES)
+    try:
+        gc.collect()
+        existing = {id(o) for o in _engine_objects()}  # e.g. a caller's move DB
+        start = tracemalloc.take_snapshot()
+        phases = _Phases()
+        team1, team2 = phases.run('teams', make_teams)
+        battle = phases.run('setup', lambda: Battle(team1, team2, verbose=False))
+        phases.run('setup', battle.start)
+        policies = {1: policy1, 2: policy2}
+        turns = 0
+        while turns < max_turns:
+            for side in (1, 2):
+                while battle.needs_switch(side):
+                    action = phases.run('policy', policies[side], battle, side, battle.legal_actions(side))
+                    phases.run('switch', battle.switch_in, side, action['index'])
+            if battle.winner() is not None:
+                break
+            action1 = phases.run('policy', policy1, battle, 1, battle.legal_actions(1))
+            action2 = phases.run('policy', policy2, battle, 2, battle.legal_actions(2))
+            phases.run('turn', battle.play_turn, action1, action2)
+            turns += 1
+        gc.collect()
+        end = tracemalloc.take_snapshot()
+        # log messages are formatted by the caller, so find them by object
+        logged: Counter = Counter()
+        for message in battle.log_messages:
+            tb = tracemalloc.get_object_traceback(message)
+            if tb is not None:
+                logged[tb] += sys.getsizeof(message)
+        live = _live_objects(existing)
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    own = tracemalloc.Filter(False, tracemalloc.__file__)
+    diffs = end.filter_traces([own]).compare_to(start.filter_traces([own]), 'traceback')
+    categories: Counter = Counter()
+    lines: Counter = Counter()
+    for diff in diffs:
+        if diff.size_diff <= 0:
+            continue
+        log_size = min(diff.size_diff, logged[diff.traceback])
+        categories['log strings'] += log_size
+        if diff.size_diff > log_size:
+            categories[_category(diff.traceback)] += diff.size_diff - log_size
+        frame = diff.traceback[-1]
+        lines[f"{os.path.basename(frame.filename)}:{frame.lineno}"] += diff.size_diff
+    categories = Counter({k: v for k, v in categories.items() if v})
+    report = AllocationReport(turns, phases.stats, dict(categories), live, lines.most_common(top))
+    del battle, team1, team2
+    return report
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) < 2:
+        print('Usage: python -m battle_env.profiling team1.txt team2.txt')
+        return
+    # load the move DB (and its lazy metadata) and the stat caches up front
+    # so that only team construction is charged to the ``teams`` phase
+    texts = [Path(a).read_text() for a in args[:2]]
+    moves_db = load_gen3_moves()
+    dict(next(iter(moves_db.values())).metadata)
+    for text in texts:
+        parse_showdown(text, moves_db)
+    report = profile_battle(lambda: tuple(parse_showdown(text, moves_db) for text in texts))
+    print(report.format())
+    print("top lines:")
+    for where, size in report.top_lines:
+        print(f"  {where:<28} {size:>10}")
+
+
+if __name__ == '__main__':
+    main()
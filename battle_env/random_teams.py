@@ -0,0 +1,180 @@
+"""Tier-aware random teams for fuzzing and self-play.
+
+Species tiers come from ``3gen_env_Showdown/formats-data.ts``.  Everything
+the generator draws from (species, moves per species, items, abilities,
+natures, EV spreads) is compiled once into alias tables, so each draw is
+two random numbers and two list lookups.
+"""
+from __future__ import annotations
+import random
+import re
+from itertools import combinations
+from pathlib import Path
+
+from .learnsets import species_id, to_id
+from .moves_loader import load_gen3_moves
+from .pokemon import NATURE_MODIFIERS, Pokemon
+from .team import Team
+from .team_search import MemberGene, STAT_ORDER, legal_items, legal_species_data
+
+FORMATS_DATA_FILE = Path(__file__).parent.parent / "3gen_env_Showdown" / "formats-data.ts"
+
+_ENTRY_RE = re.compile(r'^\t(\w+): \{(.*?)^\t\},', re.M | re.S)
+_TIER_RE = re.compile(r'\btier: "([^"]+)"')
+
+
+def load_tiers(path: str | Path = FORMATS_DATA_FILE) -> dict[str, str]:
+    """Return ``{species_id: tier}`` from a Showdown formats-data.ts file."""
+    tiers: dict[str, str] = {}
+    for ident, body in _ENTRY_RE.findall(Path(path).read_text()):
+        m = _TIER_RE.search(body)
+        if m:
+            tiers[ident] = m.group(1)
+    return tiers
+
+
+class AliasTable:
+    """Walker/Vose alias table for O(1) weighted sampling of ``items``."""
+    __slots__ = ('items', 'prob', 'alias', 'n')
+
+    def __init__(self, items: list, weights: list[float] | None = None):
+        n = len(items)
+        if not n:
+            raise ValueError("AliasTable needs at least one item")
+        weights = weights or [1.0] * n
+        total = float(sum(weights))
+        scaled = [w * n / total for w in weights]
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        self.items = list(items)
+        self.prob = prob
+        self.alias = alias
+        self.n = n
+
+    def sample(self, rng: random.Random):
+        i = int(rng.random() * self.n)
+        return self.items[i] if rng.random() < self.prob[i] else self.items[self.alias[i]]
+
+
+def _standard_spreads() -> list[tuple[int, ...]]:
+    """252/252/4 spreads over every pair of stats plus a leftover stat."""
+    spreads = []
+    for a, b in combinations(range(len(STAT_ORDER)), 2):
+        for c in range(len(STAT_ORDER)):
+            if c in (a, b):
+                continue
+            evs = [0] * len(STAT_ORDER)
+            evs[a] = evs[b] = 252
+            evs[c] = 4
+            spreads.append(tuple(evs))
+    return spreads
+
+
+class RandomTeamGenerator:
+    """Sample teams from a tier pool using precompiled alias tables.
+
+    ``tiers`` maps tier names to relative weights (e.g. ``{"OU": 3, "UU": 1}``);
+    every species in a tier is equally likely.  ``level`` applies to every
+    generated Pokémon.  Only species whose learnset and abilities are known
+    are drawn, with their own learnable moves and abilities.
+    """
+
+    def __init__(self, tiers: dict[str, float] | list[str] = ("OU",), level: int = 50,
+                 formats_path: str | Path = FORMATS_DATA_FILE, moves_path: str | Path | None = None):
+        from . import stats_loader
+        if not isinstance(tiers, dict):
+            tiers = {t: 1.0 for t in tiers}
+        legal = legal_species_data(stats_loader.species_names())
+        names = {species_id(name): name for name in legal}
+        by_tier: dict[str, list[str]] = {}
+        for ident, tier in load_tiers(formats_path).items():
+            if tier in tiers and ident in names:
+                by_tier.setdefault(tier, []).append(names[ident])
+        if not by_tier:
+            raise ValueError(f"No species with a known learnset and abilities found for tiers {sorted(tiers)}")
+        species, weights = [], []
+        for tier, members in by_tier.items():
+            species.extend(members)
+            weights.extend([tiers[tier] / len(members)] * len(members))
+        self.level = level
+        self.species = AliasTable(species, weights)
+        self.pool_size = len(species)
+
+        self.moves_db = load_gen3_moves(moves_path)
+        registry = [key for key in self.moves_db if key != 'struggle']
+        self.registry = registry
+        self.learnsets = {name: learnable for name, (learnable, _) in legal.items()}
+        self.species_abilities = {name: abilities for name, (_, abilities) in legal.items()}
+        self.moves: dict[str, AliasTable] = {}
+        for name in species:
+            self.move_table(name)
+        self.items = AliasTable([None, *legal_items()])
+        self._ability_tables: dict[str, AliasTable] = {}
+        self.natures = AliasTable(list(NATURE_MODIFIERS))
+        self.spreads = AliasTable(_standard_spreads())
+        self._species_data: dict[str, tuple[list[str], dict[str, int]]] = {}
+
+    def move_table(self, species: str) -> AliasTable:
+        """Learnable Gen 3 moves of ``species``; ``KeyError`` outside the pool."""
+        table = self.moves.get(species)
+        if table is None:
+            learnable = self.learnsets[species]
+            table = self.moves[species] = AliasTable([key for key in self.registry if to_id(key) in learnable])
+        return table
+
+    def ability_table(self, species: str) -> AliasTable:
+        """Legal abilities of ``species``; ``KeyError`` outside the pool."""
+        table = self._ability_tables.get(species)
+        if table is None:
+            table = self._ability_tables[species] = AliasTable(self.species_abilities[species])
+        return table
+
+    def sample_member(self, rng: random.Random, exclude: set[str] = frozenset()) -> MemberGene:
+        if len(exclude) >= self.pool_size and exclude.issuperset(self.species.items):
+            raise ValueError("Every species in the tier pool is excluded")
+        species = self.species.sample(rng)
+        while species in exclude:
+            species = self.species.sample(rng)
+        table = self.moves[species]
+        moves: list[str] = []
+        while len(moves) < min(4, table.n):
+            mv = table.sample(rng)
+            if mv not in moves:
+                moves.append(mv)
+        return MemberGene(species, self.items.sample(rng), self.ability_table(species).sample(rng),
+                          self.natures.sample(rng), self.spreads.sample(rng), tuple(moves), self.level)
+
+    def sample_genes(self, rng: random.Random, size: int = 6) -> tuple[MemberGene, ...]:
+        """Draw ``size`` members with distinct species (Species Clause)."""
+        if size > self.pool_size:
+            raise ValueError(f"Team size {size} is larger than the tier pool ({self.pool_size} species)")
+        members: list[MemberGene] = []
+        taken: set[str] = set()
+        for _ in range(size):
+            gene = self.sample_member(rng, taken)
+            taken.add(gene.species)
+            members.append(gene)
+        return tuple(members)
+
+    def build_pokemon(self, gene: MemberGene) -> Pokemon:
+        data = self._species_data.get(gene.species)
+        if data is None:
+            from .stats_loader import get_base_stats, get_pokemon_types
+            data = (get_pokemon_types(gene.species), get_base_stats(gene.species))
+            self._species_data[gene.species] = data
+        types, base_stats = data
+        return Pokemon(gene.species, gene.level, types, base_stats,
+                       evs=dict(zip(STAT_ORDER, gene.evs)), ability=gene.ability, item=gene.item,
+                       moves=[self.moves_db[m].copy() for m in gene.moves], nature=gene.nature)
+
+    def sample_team(self, rng: random.Random, size: int = 6) -> Team:
+        """Draw a ready-to-battle Team."""
+        return Team([self.build_pokemon(gene) for gene in self.sample_genes(rng, size)])
@@ -0,0 +1,240 @@
+"""SQLite store for battle outcomes with indexed win-rate and matchup queries.
+
+Teams are stored once, keyed by a hash of their normalised Showdown text,
+together with one row per member (species, item, ability) and per move, so
+"win rate of every team holding Leftovers" is an indexed join rather than a
+scan over re-parsed logs.  Battles are buffered in memory and written
+inside one transaction per ``batch_size`` rows; SQLite assigns battle ids
+as the rows are inserted, so several processes can write to one file.
+
+    with ResultStore("results.db") as store:
+        store.record(battle, result, team1_text, team2_text, seed)
+    store.win_rates('species')
+"""
+from __future__ import annotations
+import hashlib
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+
+from .moves_loader import load_gen3_moves
+from .team import _registry_id
+from .team_builder import parse_showdown
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS teams (hash TEXT PRIMARY KEY, text TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS members (
+    team TEXT NOT NULL, slot INTEGER NOT NULL, species TEXT, item TEXT, ability TEXT,
+    PRIMARY KEY (team, slot)
+);
+CREATE TABLE IF NOT EXISTS member_moves (team TEXT NOT NULL, slot INTEGER NOT NULL, move TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS battles (
+    id INTEGER PRIMARY KEY, source TEXT NOT NULL DEFAULT '',
+    team1 TEXT NOT NULL, team2 TEXT NOT NULL, seed INTEGER,
+    winner INTEGER NOT NULL, turns INTEGER NOT NULL, reason TEXT,
+    hp1 REAL, hp2 REAL, left1 INTEGER, left2 INTEGER
+);
+CREATE TABLE IF NOT EXISTS events (
+    battle INTEGER NOT NULL, turn INTEGER, side INTEGER NOT NULL, slot INTEGER,
+    kind TEXT NOT NULL, detail TEXT
+);
+CREATE INDEX IF NOT EXISTS battles_matchup ON battles (team1, team2, winner);
+CREATE INDEX IF NOT EXISTS battles_team2 ON battles (team2, winner);
+CREATE INDEX IF NOT EXISTS battles_source ON battles (source, seed);
+CREATE INDEX IF NOT EXISTS members_species ON members (species, team);
+CREATE INDEX IF NOT EXISTS members_item ON members (item, team);
+CREATE INDEX IF NOT EXISTS member_moves_move ON member_moves (move, team);
+CREATE INDEX IF NOT EXISTS events_battle ON events (battle);
+CREATE VIEW IF NOT EXISTS sides AS
+    SELECT id AS battle, team1 AS team, winner = 1 AS won, winner = 0 AS draw FROM battles
+    UNION ALL
+    SELECT id, team2, winner = 2, winner = 0 FROM battles;
+"""
+
+# GROUP BY targets for ``win_rates``: (join clause, key column)
+_WIN_RATE_KEYS = {
+    'team': ("", "s.team"),
+    'species': ("JOIN (SELECT DISTINCT team, species FROM members) m ON m.team = s.team", "m.species"),
+    'item': ("JOIN (SELECT DISTINCT team, item FROM members WHERE item IS NOT NULL) m ON m.team = s.team",
+             "m.item"),
+    'ability': ("JOIN (SELECT DISTINCT team, ability FROM members WHERE ability IS NOT NULL) m "
+                "ON m.team = s.team", "m.ability"),
+    'move': ("JOIN (SELECT DISTINCT team, move FROM member_moves) m ON m.team = s.team", "m.move"),
+}
+
+
+def team_hash(text: str) -> str:
+    """Stable id for a Showdown team text, ignoring blank lines and indentation."""
+    lines = [line.strip() for line in text.strip().splitlines() if line.strip()]
+    return hashlib.sha256("\n".join(lines).encode()).hexdigest()[:16]
+
+
+def battle_events(battle) -> list[tuple[int | None, int, int, str, str | None]]:
+    """Faints and status conditions of a finished battle as
+    ``(turn, side, slot, kind, detail)`` rows.
+
+    Turns are only known when the battle was run with ``record_history``;
+    otherwise faints are reported with ``turn=None`` and statuses are skipped.
+    """
+    history = battle.history
+    if history is None or not len(history):
+        return [(None, side, slot, 'faint', None)
+                for side, team in ((1, battle.team1), (2, battle.team2))
+                for slot, mon in enumerate(team.members) if mon.is_fainted()]
+    events = []
+    for turn in range(1, len(history)):
+        for key, value in history.deltas[turn].items():
+            parts = key.split('.')
+            if len(parts) != 3:
+                continue
+            side, slot, field = int(parts[0][1:]), int(parts[1]), parts[2]
+            if field == 'hp' and value == 0:
+                events.append((turn, side, slot, 'faint', None))
+            elif field == 'status' and value is not None:
+                events.append((turn, side, slot, 'status', value))
+    return events
+
+
+def side_summary(team) -> tuple[float, int]:
+    """Remaining HP fraction and number of unfainted members of ``team``."""
+    total = sum(mon.stats['hp'] for mon in team.members)
+    left = sum(mon.current_hp for mon in team.members)
+    return round(left / total, 4) if total else 0.0, sum(not mon.is_fainted() for mon in team.members)
+
+
+class ResultStore:
+    """Buffered writer and query interface over one SQLite file."""
+
+    def __init__(self, path: str | Path = "results.db", batch_size: int = 1000):
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._teams: set[str] = {row[0] for row in self.conn.execute("SELECT hash FROM teams")}
+        self._battles: list[tuple[tuple, list]] = []  # (battles row without id, its events)
+        self._moves_db = None
+
+    def __enter__(self) -> 'ResultStore':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # --- writing ---
+    def add_team(self, text: str, team=None) -> str:
+        """Store ``text`` (and its members) if new; return its hash."""
+        key = team_hash(text)
+        if key in self._teams:
+            return key
+        if team is None:
+            if self._moves_db is None:
+                self._moves_db = load_gen3_moves()
+            team = parse_showdown(text, self._moves_db)
+        with self.conn:
+            if not self.conn.execute("INSERT OR IGNORE INTO teams VALUES (?, ?)", (key, text)).rowcount:
+                self._teams.add(key)  # another writer stored it first
+                return key
+            self.conn.executemany("INSERT OR IGNORE INTO members VALUES (?, ?, ?, ?, ?)", [
+                (key, slot, mon.name, _registry_id(mon.item), _registry_id(mon.ability))
+                for slot, mon in enumerate(team.members)])
+            self.conn.executemany("INSERT INTO member_moves VALUES (?, ?, ?)", [
+                (key, slot, mv.name) for slot, mon in enumerate(team.members) for mv in mon.moves])
+        self._teams.add(key)
+        return key
+
+    def add(self, team1: str, team2: str, seed: int | None, winner: int, turns: int,
+            reason: str | None = None, hp: tuple = (None, None), left: tuple = (None, None),
+            events=(), source: str = '') -> None:
+        """Buffer one battle between two stored team hashes; its id is
+        assigned when it is flushed."""
+        self._battles.append(((source, team1, team2, seed, winner, turns, reason,
+                               hp[0], hp[1], left[0], left[1]), list(events)))
+        if len(self._battles) >= self.batch_size:
+            self.flush()
+
+    def record(self, battle, result, team1_text: str, team2_text: str, seed: int | None = None,
+               source: str = '') -> None:
+        """Buffer a finished ``Battle`` and its ``BattleResult``."""
+        t1, t2 = self.add_team(team1_text), self.add_team(team2_text)
+        (hp1, left1), (hp2, left2) = side_summary(battle.team1), side_summary(battle.team2)
+        self.add(t1, t2, seed, result.winner, result.turns, result.reason,
+                 (hp1, hp2), (left1, left2), battle_events(battle), source)
+
+    def add_tournament(self, team_texts: list[str], results: dict[int, dict], source: str) -> int:
+        """Import ``tournament.run_tournament`` rows, skipping seeds already
+        stored under ``source``; return the number added."""
+        hashes = [self.add_team(text) for text in team_texts]
+        self.flush()
+        seen = {row[0] for row in self.conn.execute("SELECT seed FROM battles WHERE source = ?", (source,))}
+        added = 0
+        for index in sorted(results):
+            row = results[index]
+            if 'error' in row or row['seed'] in seen:
+                continue
+            self.add(hashes[row['a']], hashes[row['b']], row['seed'], row['winner'], row['turns'],
+                     row.get('reason'), row.get('hp', (None, None)), row.get('left', (None, None)),
+                     source=source)
+            added += 1
+        self.flush()
+        return added
+
+    def flush(self) -> list[int]:
+        """Write buffered battles and return the ids SQLite gave them."""
+        ids = []
+        if not self._battles:
+            return ids
+        with self.conn:
+            for row, events in self._battles:
+                battle_id = self.conn.execute(
+                    "INSERT INTO battles (source, team1, team2, seed, winner, turns, reason, hp1, hp2, left1, left2) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", row).lastrowid
+                self.conn.executemany("INSERT INTO events VALUES (?, ?, ?, ?, ?, ?)",
+                                      [(battle_id, *event) for event in events])
+                ids.append(battle_id)
+        self._battles.clear()
+        return ids
+
+    def close(self) -> None:
+        if self.conn is not None:
+            self.flush()
+            self.conn.close()
+            self.conn = None
+
+    # --- queries ---
+    def win_rates(self, by: str = 'team', min_games: int = 1) -> list[tuple[str, int, int, float]]:
+        """``(key, wins, games, win rate)`` grouped by team hash, species, item,
+        ability or move, best first.  Draws count as games, not wins."""
+        if by not in _WIN_RATE_KEYS:
+            raise ValueError(f"Unknown grouping {by!r}; expected one of {sorted(_WIN_RATE_KEYS)}")
+        self.flush()
+        join, key = _WIN_RATE_KEYS[by]
+        sql = (f"SELECT {key}, SUM(s.won), COUNT(*) FROM sides s {join} "
+               f"GROUP BY {key} HAVING COUNT(*) >= ? ORDER BY 1.0 * SUM(s.won) / COUNT(*) DESC")
+        return [(k, wins, games, wins / games) for k, wins, games in self.conn.execute(sql, (min_games,))]
+
+    def matchup_matrix(self) -> tuple[list[str], np.ndarray, np.ndarray]:
+        """Return ``(team hashes, wins, games)`` where ``wins[i, j]`` counts
+        battles team ``i`` won against team ``j`` in either seat."""
+        self.flush()
+        rows = self.conn.execute(
+            "SELECT team1, team2, SUM(winner = 1), SUM(winner = 2), COUNT(*) FROM battles GROUP BY team1, team2"
+        ).fetchall()
+        teams = sorted({r[0] for r in rows} | {r[1] for r in rows})
+        pos = {t: i for i, t in enumerate(teams)}
+        wins = np.zeros((len(teams), len(teams)), dtype=np.int64)
+        games = np.zeros_like(wins)
+        for t1, t2, w1, w2, n in rows:
+            i, j = pos[t1], pos[t2]
+            wins[i, j] += w1
+            wins[j, i] += w2
+            games[i, j] += n
+            games[j, i] += n
+        return teams, wins, games
+
+    def events(self, battle_id: int) -> list[tuple]:
+        self.flush()
+        return self.conn.execute("SELECT turn, side, slot, kind, detail FROM events WHERE battle = ? "
+                                 "ORDER BY turn", (battle_id,)).fetchall()
@@ -0,0 +1,172 @@
+"""Per-generation battle rules compiled once from the Showdown mod data.
+
+A ``Ruleset`` holds everything the engines used to take from Gen 3
+globals: the type chart (and its integer step form), which types are
+physical, the held items and abilities that exist, and the status
+constants (full paralysis, thaw chance, residual damage).  Each mod
+directory inherits from the generation named in its ``scripts.ts``
+(``inherit: 'gen3'``) and only overrides what its ``typechart.ts``,
+``scripts.ts``, ``items.ts`` and ``conditions.ts`` change.
+
+Only those tables vary by generation.  Stat formulas, critical hits and
+the damage formula (including its 85-100% roll) are always Gen 3's, so a
+Gen 2 ruleset is Gen 3 mechanics with Gen 2's type chart, type-based
+physical/special split, item list, no abilities and status constants; it
+is not a Gen 2 simulator.
+
+Compiled rulesets are cached, and their damage functions are bound to the
+generation's tables up front, so ``Battle`` and ``BatchEngine`` read
+attributes in the hot loop instead of testing the generation.  Both take
+move categories from ``category`` rather than the move data, and
+``GreedyAgent`` and the batched observations score moves with
+``effectiveness``.
+
+    battle = Battle(team1, team2, ruleset=get_ruleset(2))
+"""
+from __future__ import annotations
+import re
+from dataclasses import dataclass, replace
+from functools import partial
+from pathlib import Path
+
+from .ability import abilities_map
+from .damage import (TYPE_CHART, TYPE_STEPS, get_damage_range_int, get_damage_rolls_int,
+                     get_type_effectiveness, type_steps_from_chart)
+from .item import items_map
+from .moves_loader import PHYSICAL_TYPES
+
+ROOT = Path(__file__).parent.parent
+GEN_DIRS = {
+    2: ROOT / "2gen_env_Showdown",
+    3: ROOT / "3gen_env_Showdown",
+}
+
+_ENTRY_RE = re.compile(r'^\t(\w+): \{(.*?)^\t\},', re.M | re.S)
+_ITEM_RE = re.compile(r'^\t(\w+): \{', re.M)
+_DAMAGE_TAKEN_RE = re.compile(r'damageTaken: \{(.*?)\}', re.S)
+_PAIR_RE = re.compile(r'(\w+): (\d)')
+_INHERIT_RE = re.compile(r"^\tinherit: 'gen(\d+)'", re.M)
+_SPECIAL_TYPES_RE = re.compile(r'specialTypes = \[([^\]]*)\]')
+_CHANCE_RE = re.compile(r'randomChance\((\d+), (\d+)\)')
+_RESIDUAL_RE = re.compile(r'clampIntRange\(Math\.floor\(pokemon\.maxhp / (\d+)\), 1\)')
+
+# Showdown damageTaken codes -> multiplier
+_DAMAGE_TAKEN = {0: 1.0, 1: 2.0, 2: 0.5, 3: 0.0}
+
+_rulesets: dict[int, 'Ruleset'] = {}
+
+
+@dataclass(frozen=True)
+class ConditionRules:
+    """Status constants read by the turn loop."""
+    par_skip: float      # chance a paralysed Pokémon loses its turn
+    frz_thaw: float      # end-of-turn thaw chance
+    brn_residual: int    # burn damage is max HP // this
+    psn_residual: int    # poison damage is max HP // this
+
+
+# The values the engine has always used for Gen 3.
+GEN3_CONDITIONS = ConditionRules(par_skip=0.25, frz_thaw=0.2, brn_residual=16, psn_residual=8)
+
+
+class Ruleset:
+    """Compiled tables for one generation, with the Gen 3 damage functions
+    bound to its type chart."""
+
+    def __init__(self, gen: int, type_chart: dict, physical_types, items: dict[str, type],
+                 abilities: dict[str, type], conditions: ConditionRules):
+        self.gen = gen
+        self.type_chart = type_chart
+        self.type_steps = TYPE_STEPS if type_chart is TYPE_CHART else type_steps_from_chart(type_chart)
+        self.physical_types = frozenset(physical_types)
+        self.items = items
+        self.abilities = abilities
+        self.conditions = conditions
+        self.effectiveness = partial(get_type_effectiveness, chart=type_chart)
+        self.damage_range = partial(get_damage_range_int, type_steps=self.type_steps)
+        self.damage_rolls = partial(get_damage_rolls_int, type_steps=self.type_steps)
+
+    def __repr__(self) -> str:
+        return f"Ruleset(gen={self.gen})"
+
+    def category(self, move_type: str, power: int) -> str:
+        """Physical, Special or Status under this generation's type split."""
+        if not power:
+            return 'Status'
+        return 'Physical' if move_type in self.physical_types else 'Special'
+
+
+def _read(path: Path) -> str:
+    return path.read_text(encoding="utf-8") if path.exists() else ""
+
+
+def _apply_typechart(chart: dict, text: str) -> dict:
+    chart = {atk: dict(row) for atk, row in chart.items()}
+    for ident, body in _ENTRY_RE.findall(text):
+        defender = ident.capitalize()
+        m = _DAMAGE_TAKEN_RE.search(body)
+        if not m:
+            continue
+        for attacker, code in _PAIR_RE.findall(m.group(1)):
+            if attacker not in chart:
+                continue  # status/weather immunities and later types
+            mult = _DAMAGE_TAKEN[int(code)]
+            if mult == 1.0:
+                chart[attacker].pop(defender, None)
+            else:
+                chart[attacker][defender] = mult
+    return chart
+
+
+def _apply_conditions(conditions: ConditionRules, text: str) -> ConditionRules:
+    entries = dict(_ENTRY_RE.findall(text))
+    changes = {}
+    for name, field in (('par', 'par_skip'), ('frz', 'frz_thaw')):
+        m = _CHANCE_RE.search(entries.get(name, ''))
+        if m:
+            changes[field] = int(m.group(1)) / int(m.group(2))
+    # brn/psn call a shared residualdmg() helper; skip tox's own counter-scaled formula
+    residual = _RESIDUAL_RE.search(text, max(text.find('function residualdmg'), 0))
+    if residual:
+        for name, field in (('brn', 'brn_residual'), ('psn', 'psn_residual')):
+            if 'residualdmg(' in entries.get(name, ''):
+                changes[field] = int(residual.group(1))
+    return replace(conditions, **changes)
+
+
+def compile_ruleset(gen: int) -> Ruleset:
+    """Build the ruleset for ``gen`` from its mod directory."""
+    directory = GEN_DIRS.get(gen)
+    if directory is None:
+        raise ValueError(f"No rules data for generation {gen}; available: {sorted(GEN_DIRS)}")
+    scripts = _read(directory / "scripts.ts")
+    parent_gen = int(m.group(1)) if (m := _INHERIT_RE.search(scripts)) else None
+    if gen == 3 or parent_gen not in GEN_DIRS:
+        # Gen 3 is the engine's native generation; its parent (gen4) is not shipped.
+        chart, physical, items, abilities, conditions = (
+            TYPE_CHART, PHYSICAL_TYPES, items_map, abilities_map, GEN3_CONDITIONS)
+    else:
+        parent = get_ruleset(parent_gen)
+        chart = _apply_typechart(parent.type_chart, _read(directory / "typechart.ts"))
+        physical, conditions = parent.physical_types, parent.conditions
+        item_ids = _ITEM_RE.findall(_read(directory / "items.ts"))
+        items = {i: parent.items[i] for i in item_ids if i in parent.items} if item_ids else parent.items
+        abilities = parent.abilities if gen >= 3 else {}
+        conditions = _apply_conditions(conditions, _read(directory / "conditions.ts"))
+    m = _SPECIAL_TYPES_RE.search(scripts)
+    if m:
+        special = {t.strip().strip("'\"") for t in m.group(1).split(',')}
+        physical = [t for t in chart if t not in special]
+    return Ruleset(gen, chart, physical, items, abilities, conditions)
+
+
+def get_ruleset(gen: int = 3) -> Ruleset:
+    """Return the cached ruleset for ``gen``, compiling it on first use.
+
+    For ``gen=2`` only the tables listed in the module docstring change;
+    stats, crits and damage still follow Gen 3.
+    """
+    ruleset = _rulesets.get(gen)
+    if ruleset is None:
+        ruleset = _rulesets[gen] = compile_ruleset(gen)
+    return ruleset
@@ -0,0 +1,190 @@
+"""Infer an opponent's attacking spread from observed damage.
+
+``build_damage_index`` precomputes, for one attacker species / move /
+defender situation, the damage interval of every candidate attacking stat
+(EV level x nature effect) and item effect.  Damage bounds never decrease
+as the attacking stat rises, so within one item effect the candidates
+sorted by stat have sorted lows and sorted highs, and ``query`` answers
+"which spreads could have dealt X" with two bisections.  Indexes are cached
+by their inputs, so repeated observations in the same matchup only pay for
+the lookups.
+
+Like ``Battle``, the index treats every integer between the low and high
+roll as a possible hit, and applies damage-boosting items to the roll.
+"""
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+
+from .damage import calculate_initial_damage, get_damage_range_int
+from .item import items_map
+from .learnsets import to_id
+from .move import Move
+from .pokemon import NATURE_MODIFIERS, STAGE_FRACTIONS, Pokemon
+
+EV_LEVELS = range(0, 256, 4)
+NATURE_EFFECTS = {'boosting': 1.1, 'neutral': 1.0, 'hindering': 0.9}
+# ability id -> (stat, multiplier, needs a status condition)
+ABILITY_STAT_BOOSTS = {
+    'hugepower': ('atk', 2.0, False),
+    'purepower': ('atk', 2.0, False),
+    'hustle': ('atk', 1.5, False),
+    'guts': ('atk', 1.5, True),
+}
+
+_indexes: dict[tuple, 'DamageIndex'] = {}
+
+
+def natures_with(stat: str, effect: str) -> list[str]:
+    """Names of the natures that have ``effect`` on ``stat``."""
+    out = []
+    for name, (incr, decr) in NATURE_MODIFIERS.items():
+        kind = 'boosting' if incr == stat else 'hindering' if decr == stat else 'neutral'
+        if kind == effect:
+            out.append(name)
+    return out
+
+
+@dataclass(frozen=True)
+class Candidate:
+    """One attacking spread consistent with an observation."""
+    stat_value: int
+    ev: int
+    nature: str  # 'boosting', 'neutral' or 'hindering' for the attacking stat
+    items: tuple[str | None, ...]
+
+
+class DamageIndex:
+    """Damage intervals for every candidate spread, grouped by item effect."""
+
+    def __init__(self, groups: list[tuple[tuple, list[tuple]]]):
+        # groups: (items, rows sorted by stat); a row is
+        # (stat_value, low, high, candidates, (roll low, roll high, item damage multiplier))
+        self.groups = []
+        for items, rows in groups:
+            lows = [r[1] for r in rows]
+            highs = [r[2] for r in rows]
+            self.groups.append((items, rows, lows, highs))
+
+    def query(self, damage: int, exact: bool = True) -> list[Candidate]:
+        """Return every candidate whose damage range contains ``damage``.
+
+        The roll itself can be any integer in its range, but a damage-boosting
+        item scales it afterwards and skips some totals; with ``exact`` those
+        gaps are checked as well.
+        """
+        out: list[Candidate] = []
+        for _, rows, lows, highs in self.groups:
+            for row in rows[bisect_left(highs, damage):bisect_right(lows, damage)]:
+                if exact and not _reachable(damage, *row[4]):
+                    continue
+                out.extend(row[3])
+        return out
+
+    def query_at_least(self, damage: int) -> list[Candidate]:
+        """Candidates able to deal ``damage`` or more, e.g. for a hit that KO'd
+        a target with ``damage`` HP left (the dealt amount is capped)."""
+        out: list[Candidate] = []
+        for _, rows, _, highs in self.groups:
+            for row in rows[bisect_left(highs, damage):]:
+                out.extend(row[3])
+        return out
+
+
+def _reachable(damage: int, low: int, high: int, mult: float) -> bool:
+    """Whether some roll in ``[low, high]`` scaled by ``mult`` (as
+    ``Item.modify_damage`` does) gives exactly ``damage``."""
+    if mult == 1.0:
+        return True
+    roll = max(low, int(damage / mult))
+    while int(roll * mult) < damage:
+        roll += 1
+    return roll <= high and int(roll * mult) == damage
+
+
+def _ability_id(ability) -> str:
+    if ability is None or isinstance(ability, str):
+        return to_id(ability or '')
+    return to_id(getattr(ability, 'name', '') or '')
+
+
+def _item_effects(attacker: Pokemon, move: Move, stat: str) -> dict[tuple[float, float], list[str | None]]:
+    """Group candidate items by (stat multiplier, damage multiplier)."""
+    effects: dict[tuple[float, float], list[str | None]] = {(1.0, 1.0): [None]}
+    for name, cls in items_map.items():
+        meta = cls.metadata
+        if meta.get('boost_type') == move.type:
+            effects.setdefault((1.0, meta.get('boost_multiplier', 1.0)), []).append(name)
+        boosts = meta.get('boost_stats') or {}
+        allowed = meta.get('species_only')
+        if stat in boosts and (allowed is None or attacker.name in allowed):
+            effects.setdefault((boosts[stat], 1.0), []).append(name)
+    return effects
+
+
+def build_damage_index(attacker: Pokemon, move: Move, defender: Pokemon, weather: str | None = None,
+                       is_crit: bool = False) -> DamageIndex:
+    """Index every attacking spread of ``attacker`` for ``move`` into ``defender``.
+
+    ``attacker`` supplies species, level, IVs, types, current stage,
+    status and ability; its EVs and nature are what the index ranges over.
+    The defender's current stats, stages and types are taken as known.
+    """
+    physical = move.category == 'Physical'
+    stat = 'atk' if physical else 'spa'
+    d_stat = 'def' if physical else 'spd'
+    defense = defender.get_modified_stat(d_stat)
+    stage = attacker.stages.get(stat, 0)
+    ability = _ability_id(attacker.ability)
+    key = (attacker.name, attacker.level, attacker.base_stats[stat], attacker.ivs.get(stat, 31),
+           tuple(attacker.types), attacker.status, ability, stage, move.name, move.type, move.power,
+           move.category, defense, tuple(defender.types), weather, is_crit)
+    index = _indexes.get(key)
+    if index is not None:
+        return index
+
+    base = attacker.base_stats[stat]
+    iv = attacker.ivs.get(stat, 31)
+    num, den = STAGE_FRACTIONS[stage + 6]
+    # the damage functions compare the display name
+    atk_data = {'types': attacker.types, 'status': attacker.status,
+                'ability': 'Guts' if ability == 'guts' else ability or None}
+    def_data = {'types': defender.types}
+    move_data = {'type': move.type, 'power': move.power, 'category': move.category}
+    boost_stat, ability_mult, needs_status = ABILITY_STAT_BOOSTS.get(ability, (None, 1.0, False))
+    if boost_stat != stat or (needs_status and not attacker.status):
+        ability_mult = 1.0
+
+    def range_for(stat_value: int) -> tuple[int, int]:
+        staged = stat_value * num // den
+        initial = calculate_initial_damage(attacker.level, move.power, staged, defense)
+        return get_damage_range_int(initial, atk_data, def_data, move_data, is_crit, weather)
+
+    raw_values: dict[int, list[tuple[int, str]]] = {}
+    for ev in EV_LEVELS:
+        raw = ((2 * base + iv + ev // 4) * attacker.level) // 100 + 5
+        for effect, mult in NATURE_EFFECTS.items():
+            # same float rounding as Pokemon._calc_actual_stats
+            value = int(raw * mult) if mult != 1.0 else raw
+            raw_values.setdefault(value, []).append((ev, effect))
+
+    groups = []
+    for (stat_mult, dmg_mult), items in _item_effects(attacker, move, stat).items():
+        items = tuple(items)
+        rows = []
+        for value in sorted(raw_values):
+            held = int(int(value * stat_mult) * ability_mult)
+            low, high = range_for(held)
+            candidates = tuple(Candidate(held, ev, nature, items) for ev, nature in raw_values[value])
+            rows.append((held, int(low * dmg_mult), int(high * dmg_mult), candidates, (low, high, dmg_mult)))
+        groups.append((items, rows))
+
+    index = DamageIndex(groups)
+    _indexes[key] = index
+    return index
+
+
+def infer_spreads(attacker: Pokemon, move: Move, defender: Pokemon, damage: int,
+                  weather: str | None = None, is_crit: bool = False) -> list[Candidate]:
+    """Candidates for ``attacker``'s spread that can deal exactly ``damage``."""
+    return build_damage_index(attacker, move, defender, weather, is_crit).query(damage)
@@ -0,0 +1,236 @@
+"""Long-running stress harness for ``Battle.play_turn``.
+
+Plays random battles between random teams, timing every turn and every
+battle, sampling process memory, and recording each exception together
+with the seed, both team texts and the full action trace so it can be
+replayed with ``replay``.
+
+    python -m battle_env.soak --minutes 60 --failures soak_failures.jsonl
+"""
+from __future__ import annotations
+import argparse
+import gc
+import json
+import math
+import random
+import resource
+import sys
+import time
+import traceback
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .battle import Battle
+from .moves_loader import load_gen3_moves
+from .random_teams import RandomTeamGenerator
+from .team import Team
+from .team_builder import parse_showdown
+from .team_search import export_team
+
+# Policy draws use their own stream so the engine's ``random`` calls (seeded
+# per battle) replay identically from the recorded trace alone.
+_POLICY_SALT = 0x5EED
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram (8 buckets per power of two, in ns)."""
+    SUB = 8
+
+    def __init__(self):
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.max = 0
+
+    def record(self, ns: int) -> None:
+        bucket = int(math.log2(ns) * self.SUB) if ns > 0 else 0
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+        if ns > self.max:
+            self.max = ns
+
+    def percentile(self, p: float) -> int:
+        """Upper bound of the bucket holding the ``p``-th percentile."""
+        if not self.count:
+            return 0
+        target = p / 100 * self.count
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= target:
+                return min(self.max, int(2 ** ((bucket + 1) / self.SUB)))
+        return self.max
+
+    def summary(self) -> dict[str, float]:
+        return {
+            'count': self.count,
+            'p50_us': self.percentile(50) / 1e3,
+            'p99_us': self.percentile(99) / 1e3,
+            'max_us': self.max / 1e3,
+        }
+
+
+@dataclass
+class SoakStats:
+    battles: int = 0
+    turns: int = 0
+    failures: int = 0
+    turn_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    battle_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    max_log_messages: int = 0
+    leftover_volatiles: int = 0
+    memory: list[tuple[float, int, int]] = field(default_factory=list)  # (elapsed s, battles, rss KiB)
+
+    def report(self) -> dict:
+        first = self.memory[0][2] if self.memory else 0
+        last = self.memory[-1][2] if self.memory else 0
+        return {
+            'battles': self.battles,
+            'turns': self.turns,
+            'failures': self.failures,
+            'turn': self.turn_latency.summary(),
+            'battle': self.battle_latency.summary(),
+            'max_log_messages': self.max_log_messages,
+            'leftover_volatiles': self.leftover_volatiles,
+            'rss_kib': last,
+            'rss_growth_kib': last - first,
+        }
+
+
+def _rss_kib() -> int:
+    """Current resident set size, falling back to the peak where /proc is missing."""
+    try:
+        with open('/proc/self/statm') as fh:
+            pages = int(fh.read().split()[1])
+        return pages * resource.getpagesize() // 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def play_one(team1, team2, seed: int, max_turns: int, stats: SoakStats) -> tuple[list, Battle]:
+    """Play one random battle, recording latencies and the action trace.
+
+    The trace holds ``["switch", side, index]`` entries for faint
+    replacements and ``["turn", action1, action2]`` entries for turns.
+    Exceptions propagate with the partial trace attached as ``exc.trace``.
+    """
+    random.seed(seed)
+    policy = random.Random(seed ^ _POLICY_SALT)
+    battle = Battle(team1, team2, verbose=False)
+    trace: list = []
+    try:
+        battle.start()
+        for _ in range(max_turns):
+            for side in (1, 2):
+                while battle.needs_switch(side):
+                    action = policy.choice(battle.legal_actions(side))
+                    trace.append(['switch', side, action['index']])
+                    battle.switch_in(side, action['index'])
+            if battle.winner() is not None:
+                break
+            action1 = policy.choice(battle.legal_actions(1))
+            action2 = policy.choice(battle.legal_actions(2))
+            trace.append(['turn', action1, action2])
+            start = time.perf_counter_ns()
+            battle.play_turn(action1, action2)
+            stats.turn_latency.record(time.perf_counter_ns() - start)
+            stats.turns += 1
+    except Exception as exc:
+        exc.trace = trace
+        raise
+    return trace, battle
+
+
+def replay(record: dict, moves_db=None) -> Battle:
+    """Re-run a failure record; the original exception is raised again."""
+    moves_db = moves_db or load_gen3_moves()
+    team1 = parse_showdown(record['teams'][0], moves_db)
+    team2 = parse_showdown(record['teams'][1], moves_db)
+    random.seed(record['seed'])
+    battle = Battle(team1, team2, verbose=False)
+    battle.start()
+    for entry in record['trace']:
+        if entry[0] == 'switch':
+            battle.switch_in(entry[1], entry[2])
+        else:
+            battle.play_turn(entry[1], entry[2])
+    return battle
+
+
+def soak(generator: RandomTeamGenerator, battles: int | None = None, minutes: float | None = None,
+         seed: int = 0, team_size: int = 6, max_turns: int = 500, failures: Path | None = None,
+         sample_every: int = 100, report_every: float = 60.0) -> SoakStats:
+    """Play battles until ``battles`` or ``minutes`` runs out (whichever first)."""
+    stats = SoakStats()
+    begin = time.monotonic()
+    deadline = begin + minutes * 60 if minutes else None
+    last_report = begin
+    out = failures.open('a') if failures else None
+    i = 0
+    try:
+        while (battles is None or i < battles) and (deadline is None or time.monotonic() < deadline):
+            battle_seed = seed + i
+            rng = random.Random(battle_seed)
+            genes1 = generator.sample_genes(rng, team_size)
+            genes2 = generator.sample_genes(rng, team_size)
+            team1 = Team([generator.build_pokemon(g) for g in genes1])
+            team2 = Team([generator.build_pokemon(g) for g in genes2])
+            start = time.perf_counter_ns()
+            try:
+                _, battle = play_one(team1, team2, battle_seed, max_turns, stats)
+            except Exception as exc:
+                stats.failures += 1
+                record = {
+                    'seed': battle_seed,
+                    'error': f"{type(exc).__name__}: {exc}",
+                    'traceback': traceback.format_exc(),
+                    'teams': [export_team(genes1), export_team(genes2)],
+                    'trace': getattr(exc, 'trace', []),
+                }
+                if out:
+                    out.write(json.dumps(record) + "\n")
+                    out.flush()
+                else:
+                    print(record['error'], f"(seed {battle_seed})", file=sys.stderr)
+            else:
+                stats.battle_latency.record(time.perf_counter_ns() - start)
+                stats.max_log_messages = max(stats.max_log_messages, len(battle.log_messages))
+                stats.leftover_volatiles += sum(
+                    len(m.volatiles) for m in team1.members + team2.members)
+            stats.battles += 1
+            i += 1
+            if stats.battles % sample_every == 0:
+                gc.collect()
+                stats.memory.append((time.monotonic() - begin, stats.battles, _rss_kib()))
+            now = time.monotonic()
+            if now - last_report >= report_every:
+                last_report = now
+                print(json.dumps(stats.report()))
+    finally:
+        if out:
+            out.close()
+    stats.memory.append((time.monotonic() - begin, stats.battles, _rss_kib()))
+    return stats
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Soak-test the battle engine with random battles.")
+    parser.add_argument("--battles", type=int)
+    parser.add_argument("--minutes", type=float)
+    parser.add_argument("--tiers", nargs="+", default=["OU", "UUBL", "UU"])
+    parser.add_argument("--team-size", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-turns", type=int, default=500)
+    parser.add_argument("--failures", default="soak_failures.jsonl", help="JSONL file for failure records")
+    parser.add_argument("--report-every", type=float, default=60.0, help="seconds between progress lines")
+    args = parser.parse_args(argv)
+    if args.battles is None and args.minutes is None:
+        parser.error("give --battles and/or --minutes")
+
+    generator = RandomTeamGenerator(args.tiers)
+    stats = soak(generator, args.battles, args.minutes, args.seed, args.team_size, args.max_turns,
+                 Path(args.failures), report_every=args.report_every)
+    print(json.dumps(stats.report(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""Search EV spreads and natures that meet survival/speed/KO benchmarks.
+
+The Gen 3 stat formula is evaluated for every nature and every EV level
+(0-252 in steps of 4) at once, giving a ``(25, 6, 64)`` table.  Each
+benchmark only depends on one or two stats, so HP/Def/SpD bulk is checked
+on a full ``64 x 64 x 64`` grid per nature while Atk/SpA/Spe reduce to the
+smallest EV level that clears them.  Combining the two gives the cheapest
+legal spread for every nature in well under a second.
+"""
+from __future__ import annotations
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .batch_engine import damage_bounds, _type_id, NO_TYPE
+from .item import items_map
+from .move import Move
+from .pokemon import Pokemon, NATURE_MODIFIERS
+from .team import _registry_id
+
+STAT_ORDER = ('hp', 'atk', 'def', 'spa', 'spd', 'spe')
+EV_STEP = 4
+EV_LEVELS = np.arange(0, 253, EV_STEP)  # 64 levels per stat
+MAX_TOTAL_EVS = 510
+MAX_UNITS = MAX_TOTAL_EVS // EV_STEP
+NATURES = list(NATURE_MODIFIERS)
+
+
+@dataclass(frozen=True)
+class Survive:
+    """``attacker`` must not KO us with ``hits`` max-damage uses of ``move``."""
+    attacker: Pokemon
+    move: Move
+    hits: int = 1
+
+
+@dataclass(frozen=True)
+class OHKO:
+    """Our ``move`` must KO ``defender`` from full HP even on the lowest roll."""
+    defender: Pokemon
+    move: Move
+
+
+@dataclass(frozen=True)
+class Outspeed:
+    """Our Speed must be strictly higher than ``target`` (a Pokémon or a number)."""
+    target: Pokemon | int
+
+
+@dataclass
+class Spread:
+    nature: str
+    evs: dict[str, int]
+    stats: dict[str, int]
+    spent: int = field(default=0)
+
+
+def stat_table(pokemon: Pokemon) -> np.ndarray:
+    """Return ``table[nature, stat, level]`` for every nature and EV level."""
+    level = pokemon.level
+    table = np.empty((len(NATURES), len(STAT_ORDER), len(EV_LEVELS)), dtype=np.int64)
+    for s, stat in enumerate(STAT_ORDER):
+        base = pokemon.base_stats[stat]
+        iv = pokemon.ivs.get(stat, 0)
+        raw = ((2 * base + iv + EV_LEVELS // 4) * level) // 100
+        if stat == 'hp':
+            table[:, s] = raw + level + 10
+            continue
+        raw = raw + 5
+        for n, nature in enumerate(NATURES):
+            incr, decr = NATURE_MODIFIERS[nature]
+            # same float rounding as Pokemon._calc_actual_stats
+            if stat == incr:
+                table[n, s] = (raw * 1.1).astype(np.int64)
+            elif stat == decr:
+                table[n, s] = (raw * 0.9).astype(np.int64)
+            else:
+                table[n, s] = raw
+    return table
+
+
+def _types(mon: Pokemon) -> np.ndarray:
+    ids = [_type_id(t) for t in mon.types[:2]]
+    return np.array(ids + [NO_TYPE] * (2 - len(ids)), dtype=np.int64)
+
+
+def _boost(mon: Pokemon, move: Move, damage: np.ndarray) -> np.ndarray:
+    item = items_map.get(_registry_id(mon.item))
+    if item is not None and item.metadata.get('boost_type') == move.type:
+        return (damage * item.metadata.get('boost_multiplier', 1.0)).astype(np.int64)
+    return damage
+
+
+def _bounds(attacker: Pokemon, move: Move, atk, dfn, att_types, def_types):
+    physical = move.category == 'Physical'
+    mtype = np.int64(_type_id(move.type))
+    atk = np.asarray(atk)
+    dfn = np.asarray(dfn)
+    return damage_bounds(
+        attacker.level, move.power or 0, physical, atk, atk, dfn, dfn,
+        attacker.status == 'brn', mtype, att_types, def_types, 1, 1,
+    )
+
+
+def _first_true(mask: np.ndarray) -> np.ndarray:
+    """Index of the first True along the last axis, or -1 if there is none."""
+    first = mask.argmax(-1)
+    return np.where(mask.any(-1), first, -1)
+
+
+def optimize_spread(pokemon: Pokemon, constraints: list, natures: list[str] | None = None,
+                    fill: tuple[str, ...] = ('hp', 'def', 'spd'), top: int = 5) -> list[Spread]:
+    """Return up to ``top`` spreads satisfying every constraint, cheapest first.
+
+    Each nature contributes its cheapest feasible spread (ties broken towards
+    more HP/Def/SpD).  Leftover EVs go into the ``fill`` stats in order.
+    """
+    table = stat_table(pokemon)
+    nat_idx = np.array([NATURES.index(n) for n in natures] if natures else range(len(NATURES)))
+    table = table[nat_idx]
+    nn = len(nat_idx)
+    levels = len(EV_LEVELS)
+    our_types = _types(pokemon)
+    hp, atk, dfn, spa, spd, spe = (table[:, s] for s in range(len(STAT_ORDER)))
+
+    bulk = np.ones((nn, levels, levels, levels), dtype=bool)  # hp, def, spd
+    need = np.zeros((nn, len(STAT_ORDER)), dtype=np.int64)  # minimum level index
+    for c in constraints:
+        if isinstance(c, Survive):
+            physical = c.move.category == 'Physical'
+            a = c.attacker.get_modified_stat('atk' if physical else 'spa')
+            _, high = _bounds(c.attacker, c.move, a, dfn if physical else spd, _types(c.attacker), our_types)
+            high = _boost(c.attacker, c.move, high) * c.hits  # (nn, levels)
+            ok = hp[:, :, None] > high[:, None, :]
+            bulk &= ok[:, :, :, None] if physical else ok[:, :, None, :]
+        elif isinstance(c, OHKO):
+            physical = c.move.category == 'Physical'
+            d = c.defender.get_modified_stat('def' if physical else 'spd')
+            low, _ = _bounds(pokemon, c.move, atk if physical else spa, d, our_types, _types(c.defender))
+            low = _boost(pokemon, c.move, low)
+            first = _first_true(low >= c.defender.stats['hp'])
+            s = STAT_ORDER.index('atk' if physical else 'spa')
+            need[:, s] = np.where((first < 0) | (need[:, s] < 0), -1, np.maximum(need[:, s], first))
+        elif isinstance(c, Outspeed):
+            target = c.target if isinstance(c.target, int) else c.target.get_modified_stat('spe')
+            first = _first_true(spe > target)
+            s = STAT_ORDER.index('spe')
+            need[:, s] = np.where((first < 0) | (need[:, s] < 0), -1, np.maximum(need[:, s], first))
+        else:
+            raise TypeError(f"Unknown constraint {c!r}")
+
+    grid = np.arange(levels)
+    units = grid[:, None, None] + grid[None, :, None] + grid[None, None, :]
+    offense = need[:, [1, 3, 5]].sum(-1)
+    feasible = bulk & (units[None] + offense[:, None, None, None] <= MAX_UNITS)
+    feasible &= (need >= 0).all(-1)[:, None, None, None]
+    # cheapest first; for equal cost prefer EVs in HP, then Def, then SpD
+    cost = np.where(feasible, (units[None] << 18) - (grid[None, :, None, None] << 12)
+                    - (grid[None, None, :, None] << 6) - grid[None, None, None, :], np.iinfo(np.int64).max)
+    best = cost.reshape(nn, -1).argmin(-1)
+    ok = feasible.reshape(nn, -1)[np.arange(nn), best]
+
+    spreads: list[Spread] = []
+    for n in np.nonzero(ok)[0]:
+        h, d, sd = np.unravel_index(best[n], (levels, levels, levels))
+        lv = dict(zip(STAT_ORDER, (h, need[n, 1], d, need[n, 3], sd, need[n, 5])))
+        spent = sum(int(v) for v in lv.values())
+        left = MAX_UNITS - spent
+        for stat in fill:
+            add = min(left, levels - 1 - lv[stat])
+            lv[stat] += add
+            left -= add
+        evs = {stat: int(EV_LEVELS[lv[stat]]) for stat in STAT_ORDER}
+        stats = {stat: int(table[n, s, lv[stat]]) for s, stat in enumerate(STAT_ORDER)}
+        spreads.append(Spread(NATURES[nat_idx[n]], evs, stats, spent * EV_STEP))
+    spreads.sort(key=lambda sp: (sp.spent, -sp.stats['hp'] - sp.stats['def'] - sp.stats['spd']))
+    return spreads[:top]
@@ -1,12 +1,24 @@
 from __future__ import annotations
 import json
+import re
 from pathlib import Path
-from urllib.request import urlopen
 import pandas as pd
 
+from .learnsets import species_id
+
 _cache: dict[str, dict] | None = None
+# PokeAPI entries saved by earlier versions; read only, never written
 CACHE_FILE = Path(__file__).parent.parent / "data" / "pokeapi_cache.json"
+# Gen 3 species types and abilities in Showdown's pokedex.ts layout
+POKEDEX_FILE = Path(__file__).parent.parent / "data" / "pokedex.ts"
+_POKEDEX_ENTRY_RE = re.compile(r'^\t(\w+): \{(.*?)^\t\},', re.M | re.S)
+_POKEDEX_TYPES_RE = re.compile(r'^\t\ttypes: \[([^\]]*)\]', re.M)
+_POKEDEX_ABILITIES_RE = re.compile(r'^\t\tabilities: \{([^}]*)\}', re.M)
+_QUOTED_RE = re.compile(r'"([^"]*)"')
 _base_stats_df = None
+_df_index: dict[str, dict[str, int]] | None = None
+_resolved: dict[str, dict] = {}
+_local_types: dict[str, list[str]] | None = None
 
 
 def _load_cache() -> None:
@@ -26,65 +38,56 @@ def _load_df(path: str | Path | None = None):
         _base_stats_df = pd.read_excel(path)
 
 
-def _save_cache() -> None:
-    if _cache is not None:
-        CACHE_FILE.write_text(json.dumps(_cache, indent=2))
-
-
-def _fetch_from_api(name: str) -> dict:
-    url = f"https://pokeapi.co/api/v2/pokemon/{name.lower()}"
-    with urlopen(url) as resp:
-        data = json.load(resp)
-    stats = {s["stat"]["name"]: s["base_stat"] for s in data["stats"]}
-    types = [
-        t["type"]["name"].capitalize()
-        for t in sorted(data["types"], key=lambda x: x["slot"])
-    ]
-    entry = {
-        "base_stats": {
-            "hp": stats["hp"],
-            "atk": stats["attack"],
-            "def": stats["defense"],
-            "spa": stats["special-attack"],
-            "spd": stats["special-defense"],
-            "spe": stats["speed"],
-        },
-        "types": types,
-    }
-    _cache[name.lower()] = entry
-    _save_cache()
-    return entry
+def _load_df_index() -> None:
+    """Index spreadsheet base stats by lowercase species name."""
+    global _df_index
+    if _df_index is None:
+        _load_df()
+        # publish the index only once it is complete; worker threads share it
+        index = {}
+        for _, r in _base_stats_df.iterrows():
+            index[str(r["Pokémon_1"]).lower()] = {
+                "hp": int(r["HP"]),
+                "atk": int(r["Attack"]),
+                "def": int(r["Defense"]),
+                "spa": int(r["Sp. Attack"]),
+                "spd": int(r["Sp. Defense"]),
+                "spe": int(r["Speed"]),
+            }
+        _df_index = index
 
 
 def _get_entry(name: str) -> dict:
+    ident = name.lower()
+    entry = _resolved.get(ident)
+    if entry is None:
+        entry = _resolve_entry(name)
+        _resolved[ident] = entry
+    return entry
+
+
+def _resolve_entry(name: str) -> dict:
+    """Base stats from the spreadsheet and types from ``pokedex.ts`` (or the
+    PokeAPI cache); never touches the network."""
+    global _local_types
     _load_cache()
-    _load_df()
     ident = name.lower()
     if ident in _cache:
         return _cache[ident]
-    # get base stats from spreadsheet if available
-    row = _base_stats_df[_base_stats_df["Pokémon_1"].str.lower() == ident]
-    if not row.empty:
-        r = row.iloc[0]
-        stats = {
-            "hp": int(r["HP"]),
-            "atk": int(r["Attack"]),
-            "def": int(r["Defense"]),
-            "spa": int(r["Sp. Attack"]),
-            "spd": int(r["Sp. Defense"]),
-            "spe": int(r["Speed"]),
-        }
-    else:
-        stats = None
-    try:
-        api = _fetch_from_api(ident)
-        if stats:
-            api["base_stats"] = stats
-        return api
-    except Exception as exc:  # pragma: no cover - network errors
-        if stats:
-            return {"base_stats": stats, "types": ["Normal"]}
-        raise ValueError(f"Unknown Pokémon {name}") from exc
+    _load_df_index()
+    stats = _df_index.get(ident)
+    if _local_types is None:
+        _local_types = local_types()
+    types = _local_types.get(species_id(name))
+    if stats is None or not types:
+        raise ValueError(f"Unknown Pokémon {name}")
+    return {"base_stats": dict(stats), "types": list(types)}
+
+
+def species_names() -> list[str]:
+    """Species as the base stats spreadsheet writes them (``Farfetch'd``)."""
+    _load_df()
+    return [str(name) for name in _base_stats_df["Pokémon_1"]]
 
 
 def get_base_stats(name: str) -> dict[str, int]:
@@ -93,3 +96,46 @@ def get_base_stats(name: str) -> dict[str, int]:
 
 def get_pokemon_types(name: str) -> list[str]:
     return _get_entry(name)["types"]
+
+
+def local_types(pokedex_path: str | Path | None = None) -> dict[str, list[str]]:
+    """Species types keyed by Showdown id, read without network access from
+    ``data/pokedex.ts`` and, for species it lacks, the PokeAPI cache."""
+    _load_cache()
+    types = {re.sub(r"[^a-z0-9]", "", name): entry["types"]
+             for name, entry in _cache.items() if entry.get("types")}
+    path = Path(pokedex_path) if pokedex_path is not None else POKEDEX_FILE
+    if path.exists():
+        for ident, body in _POKEDEX_ENTRY_RE.findall(path.read_text(encoding="utf-8")):
+            m = _POKEDEX_TYPES_RE.search(body)
+            if m:
+                types[ident] = [t.strip().strip('"\'') for t in m.group(1).split(",") if t.strip()]
+    return types
+
+
+def local_abilities(pokedex_path: str | Path | None = None) -> dict[str, list[str]]:
+    """Ability ids each species can have, keyed by Showdown id; empty if
+    ``pokedex.ts`` is missing."""
+    path = Path(pokedex_path) if pokedex_path is not None else POKEDEX_FILE
+    if not path.exists():
+        return {}
+    abilities = {}
+    for ident, body in _POKEDEX_ENTRY_RE.findall(path.read_text(encoding="utf-8")):
+        m = _POKEDEX_ABILITIES_RE.search(body)
+        if m:
+            # Gen 3 has no hidden abilities
+            slots = re.sub(r'H: "[^"]*",?', "", m.group(1))
+            abilities[ident] = [re.sub(r"[^a-z0-9]", "", a.lower()) for a in _QUOTED_RE.findall(slots)]
+    return abilities
+
+
+def ability_names(pokedex_path: str | Path | None = None) -> dict[str, str]:
+    """``{ability id: display name}`` for every ability in ``pokedex.ts``."""
+    path = Path(pokedex_path) if pokedex_path is not None else POKEDEX_FILE
+    if not path.exists():
+        return {}
+    names = {}
+    for m in _POKEDEX_ABILITIES_RE.finditer(path.read_text(encoding="utf-8")):
+        for name in _QUOTED_RE.findall(m.group(1)):
+            names[re.sub(r"[^a-z0-9]", "", name.lower())] = name
+    return names
@@ -0,0 +1,199 @@
+from __future__ import annotations
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from .damage import TYPE_CHART
+from .learnsets import species_id, to_id
+
+TABLES_DIR = Path(__file__).parent.parent / "data" / "tables"
+
+TYPES = [
+    "Normal", "Fire", "Water", "Electric", "Grass", "Ice", "Fighting", "Poison", "Ground",
+    "Flying", "Psychic", "Bug", "Rock", "Ghost", "Dragon", "Dark", "Steel", "???",
+]
+TYPE_IDS = {t: i for i, t in enumerate(TYPES)}
+CATEGORIES = ["Physical", "Special", "Status"]
+CATEGORY_IDS = {c: i for i, c in enumerate(CATEGORIES)}
+STATS = ["hp", "atk", "def", "spa", "spd", "spe"]
+# bumped whenever build_tables changes what it writes, so older caches are rebuilt
+TABLES_VERSION = 2
+
+# accuracy == ALWAYS_HITS marks moves that skip the accuracy check
+ALWAYS_HITS = -1
+
+MOVE_DTYPE = np.dtype([
+    ("id", np.int16),
+    ("type", np.int8),
+    ("power", np.int16),
+    ("accuracy", np.int16),
+    ("pp", np.int8),
+    ("priority", np.int8),
+    ("category", np.int8),
+])
+
+SPECIES_DTYPE = np.dtype([
+    ("id", np.int16),
+    ("hp", np.int16),
+    ("atk", np.int16),
+    ("def", np.int16),
+    ("spa", np.int16),
+    ("spd", np.int16),
+    ("spe", np.int16),
+    ("type1", np.int8),
+    ("type2", np.int8),
+])
+
+_tables: dict[Path, "GameTables"] = {}
+
+
+def type_chart_matrix() -> np.ndarray:
+    """Return ``chart[attack_type, defend_type]`` multipliers as float32."""
+    chart = np.ones((len(TYPES), len(TYPES)), dtype=np.float32)
+    for atk, row in TYPE_CHART.items():
+        for dfn, mult in row.items():
+            chart[TYPE_IDS[atk], TYPE_IDS[dfn]] = mult
+    return chart
+
+
+def _type_id(name: str | None) -> int:
+    if not name:
+        return TYPE_IDS["???"]
+    return TYPE_IDS.get(name.capitalize(), TYPE_IDS["???"])
+
+
+def _move_rows() -> tuple[list[str], np.ndarray]:
+    from .moves_loader import load_gen3_moves
+    names: list[str] = []
+    seen: set[str] = set()
+    rows = []
+    for mv in load_gen3_moves().values():
+        ident = to_id(mv.id or mv.name)
+        if ident in seen:
+            continue
+        seen.add(ident)
+        acc = ALWAYS_HITS if mv.accuracy is True else int(mv.accuracy or 0)
+        rows.append((len(names), _type_id(mv.type), mv.power, acc, mv.max_pp,
+                     mv.priority, CATEGORY_IDS.get(mv.category, CATEGORY_IDS["Status"])))
+        names.append(ident)
+    return names, np.array(rows, dtype=MOVE_DTYPE)
+
+
+def _species_rows() -> tuple[list[str], np.ndarray]:
+    """Base stats from the local spreadsheet and types from ``local_types``.
+
+    Never touches the network; species without known types are an error
+    rather than a silent ``Normal`` row baked into the cache.
+    """
+    from . import stats_loader
+    stats_loader._load_df_index()
+    known = stats_loader.local_types()
+    names: list[str] = []
+    rows = []
+    missing = []
+    for name, stats in stats_loader._df_index.items():
+        ident = species_id(name)
+        types = known.get(ident)
+        if not types:
+            missing.append(name)
+            continue
+        t1 = _type_id(types[0])
+        t2 = _type_id(types[1]) if len(types) > 1 else t1
+        rows.append((len(names), *(stats[s] for s in STATS), t1, t2))
+        names.append(ident)
+    if missing:
+        raise ValueError(
+            f"No local type data for {len(missing)} species (e.g. {', '.join(missing[:3])}); "
+            f"add them to {stats_loader.POKEDEX_FILE} before building the tables")
+    return names, np.array(rows, dtype=SPECIES_DTYPE)
+
+
+def _atomic_save(path: Path, array: np.ndarray) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            np.save(fh, array, allow_pickle=False)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def build_tables(directory: str | Path = TABLES_DIR) -> None:
+    """Write the move/species ``.npy`` tables and their name index."""
+    directory = Path(directory)
+    move_names, moves = _move_rows()
+    species_names, species = _species_rows()
+    directory.mkdir(parents=True, exist_ok=True)
+    _atomic_save(directory / "moves.npy", moves)
+    _atomic_save(directory / "species.npy", species)
+    _atomic_save(directory / "type_chart.npy", type_chart_matrix())
+    index = {"version": TABLES_VERSION, "types": TYPES, "categories": CATEGORIES,
+             "moves": move_names, "species": species_names}
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w") as fh:
+        json.dump(index, fh)
+    os.chmod(tmp, 0o644)
+    os.replace(tmp, directory / "index.json")
+
+
+class GameTables:
+    """Columnar move/species data backed by read-only memory maps.
+
+    Arrays are opened with ``mmap_mode='r'`` so every process that loads the
+    same files shares one copy of the pages through the OS page cache.
+    """
+
+    def __init__(self, directory: str | Path = TABLES_DIR):
+        directory = Path(directory)
+        self.moves: np.ndarray = np.load(directory / "moves.npy", mmap_mode="r")
+        self.species: np.ndarray = np.load(directory / "species.npy", mmap_mode="r")
+        self.type_chart: np.ndarray = np.load(directory / "type_chart.npy", mmap_mode="r")
+        index = json.loads((directory / "index.json").read_text())
+        self.move_names: list[str] = index["moves"]
+        self.species_names: list[str] = index["species"]
+        self.move_ids = {name: i for i, name in enumerate(self.move_names)}
+        self.species_ids = {name: i for i, name in enumerate(self.species_names)}
+
+    def move(self, name: str) -> np.void:
+        return self.moves[self.move_ids[to_id(name)]]
+
+    def species_row(self, name: str) -> np.void:
+        return self.species[self.species_ids[species_id(name)]]
+
+    def base_stats(self, species_ids) -> np.ndarray:
+        """Return an ``(n, 6)`` int array of base stats for ``species_ids``."""
+        rows = self.species[np.asarray(species_ids)]
+        return np.stack([rows[s] for s in STATS], axis=-1)
+
+    def effectiveness(self, move_ids, species_ids) -> np.ndarray:
+        """Type effectiveness of every move against every species, ``(moves, species)``."""
+        mtypes = self.moves["type"][np.asarray(move_ids)]
+        sp = self.species[np.asarray(species_ids)]
+        t1, t2 = sp["type1"], sp["type2"]
+        eff = self.type_chart[mtypes[:, None], t1[None, :]]
+        dual = (t2 != t1)[None, :]
+        return eff * np.where(dual, self.type_chart[mtypes[:, None], t2[None, :]], 1.0)
+
+
+def _cached_version(directory: Path) -> int | None:
+    try:
+        return json.loads((directory / "index.json").read_text()).get("version")
+    except (OSError, ValueError):
+        return None
+
+
+def load_tables(directory: str | Path = TABLES_DIR, rebuild: bool = False) -> GameTables:
+    """Return the shared GameTables, building the files if they are missing
+    or were written by an older ``build_tables``."""
+    directory = Path(directory).resolve()
+    if rebuild or _cached_version(directory) != TABLES_VERSION:
+        build_tables(directory)
+        _tables.pop(directory, None)
+    if directory not in _tables:
+        _tables[directory] = GameTables(directory)
+    return _tables[directory]
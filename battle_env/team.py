@@ -31,3 +31,68 @@ class Team:
 
     def clear_hazards(self):
         self.hazards.clear()
+
+
+@dataclass(frozen=True)
+class MemberTemplate:
+    """Immutable description of one team member."""
+    fields: dict
+    stats: dict[str, int]
+    moves: tuple
+
+    def spawn(self) -> Pokemon:
+        """Build a battle-ready Pokemon, copying only per-battle state."""
+        mon = Pokemon.__new__(Pokemon)
+        mon.__dict__.update(self.fields)
+        mon.stats = dict(self.stats)
+        mon.moves = [mv.copy() for mv in self.moves]
+        mon.reset_battle_state()
+        return mon
+
+
+def _registry_id(obj) -> str | None:
+    """Return the ability/item id for a string or an instantiated hook object."""
+    if obj is None or isinstance(obj, str):
+        return obj
+    name = getattr(type(obj), 'name', None)
+    return None if name in ('', '(none)') else name
+
+
+@dataclass(frozen=True)
+class TeamTemplate:
+    """A parsed team frozen once and stamped out into fresh Teams.
+
+    Species data, EVs/IVs, computed stats and move prototypes are shared
+    between every Team created from the template; only HP, stages, status,
+    volatiles, PP and the (item-boostable) stats dict are copied.
+    """
+    members: tuple[MemberTemplate, ...]
+
+    @classmethod
+    def from_team(cls, team: Team) -> 'TeamTemplate':
+        members = []
+        for mon in team.members:
+            fields = {
+                'name': mon.name,
+                'level': mon.level,
+                'types': mon.types,
+                'base_stats': mon.base_stats,
+                'ivs': mon.ivs,
+                'evs': mon.evs,
+                'ability': _registry_id(mon.ability),
+                'item': _registry_id(mon.item),
+                'gender': mon.gender,
+                'nature': mon.nature,
+            }
+            moves = []
+            for mv in mon.moves:
+                proto = mv.copy()
+                proto.current_pp = proto.max_pp
+                moves.append(proto)
+            # recompute stats so item boosts from a previous battle are dropped
+            members.append(MemberTemplate(fields, mon._calc_actual_stats(), tuple(moves)))
+        return cls(tuple(members))
+
+    def instantiate(self) -> Team:
+        """Return a fresh, battle-ready Team."""
+        return Team([m.spawn() for m in self.members])
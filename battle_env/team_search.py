@@ -0,0 +1,398 @@
+"""Genetic search for teams that beat a fixed gauntlet.
+
+Individuals are tuples of ``MemberGene`` (species, item, ability, nature,
+EVs, moves).  Fitness is the win rate of the exported Showdown text against
+every gauntlet team, measured with ``Battle.run_battle`` in a process pool.
+Results are cached by team text, and the population, cache and RNG state
+are written atomically after every generation so a killed run resumes
+exactly where it stopped.
+
+    python -m battle_env.team_search --gauntlet team1.txt team2.txt \
+        --checkpoint search.json --out best.txt
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from .battle import Battle, random_policy
+from .item import item_names, items_map
+from .learnsets import get_learnset_index, load_learnsets, species_id, to_id
+from .moves_loader import load_gen3_moves, move_display_names
+from .pokemon import NATURE_MODIFIERS
+from .team import Team, TeamTemplate, _registry_id
+from .team_builder import parse_showdown
+from .team_validator import compile_set, set_is_legal
+
+STAT_ORDER = ('hp', 'atk', 'def', 'spa', 'spd', 'spe')
+STAT_LABELS = ('HP', 'Atk', 'Def', 'SpA', 'SpD', 'Spe')
+EV_STEP = 4
+EV_CAP = 252
+EV_TOTAL = 508  # 510 rounded down to a multiple of EV_STEP
+
+
+@dataclass(frozen=True)
+class MemberGene:
+    species: str
+    item: str | None
+    ability: str | None
+    nature: str
+    evs: tuple[int, ...]
+    moves: tuple[str, ...]
+    level: int = 50
+
+
+Individual = tuple[MemberGene, ...]
+
+
+def export_team(team: Individual) -> str:
+    """Render an individual in the ``team1.txt`` format ``parse_showdown`` reads,
+    with display names for items, abilities and moves."""
+    from .stats_loader import ability_names
+    items, abilities, moves = item_names(), ability_names(), move_display_names()
+    blocks = []
+    for gene in team:
+        lines = [f"{gene.species} @ {items.get(gene.item, gene.item)}" if gene.item else gene.species]
+        if gene.ability:
+            lines.append(f"Ability: {abilities.get(gene.ability, gene.ability)}")
+        lines.append(f"Level: {gene.level}")
+        evs = [f"{ev} {label}" for ev, label in zip(gene.evs, STAT_LABELS) if ev]
+        if evs:
+            lines.append("EVs: " + " / ".join(evs))
+        lines.append(f"{gene.nature} Nature")
+        lines.extend(f"- {moves.get(to_id(move), move)}" for move in gene.moves)
+        blocks.append("\n".join(lines))
+    return "\n\n".join(blocks) + "\n"
+
+
+def legal_items() -> list[str]:
+    """Engine items that exist in Gen 3 and the validator allows."""
+    banned = get_learnset_index().banned_items
+    names = item_names()
+    return [i for i in items_map if i in names and i not in banned]
+
+
+def legal_species_data(species: list[str]) -> dict[str, tuple[set[str], list[str]]]:
+    """``{species: (learnable move ids, ability ids)}`` for the members of
+    ``species`` whose learnset (at least four moves) and abilities are known;
+    the rest are dropped rather than given every move or ability."""
+    from .stats_loader import local_abilities
+    learnsets = load_learnsets()
+    known_abilities = local_abilities()
+    data = {}
+    for name in species:
+        ident = species_id(name)
+        learnable = learnsets.get(ident, set())
+        abilities = known_abilities.get(ident)
+        if len(learnable) >= 4 and abilities:
+            data[name] = (learnable, list(abilities))
+    return data
+
+
+def genes_from_team(team: Team) -> Individual:
+    """Turn a parsed Team (e.g. a hand-written seed team) into an individual."""
+    return tuple(
+        MemberGene(
+            species=mon.name,
+            item=_registry_id(mon.item),
+            ability=_registry_id(mon.ability),
+            nature=mon.nature or 'Hardy',
+            evs=tuple(mon.evs.get(s, 0) for s in STAT_ORDER),
+            moves=tuple(mv.name for mv in mon.moves),
+            level=mon.level,
+        )
+        for mon in team.members
+    )
+
+
+@dataclass
+class SearchSpace:
+    """What the search may pick for each gene."""
+    species: list[str]
+    moves: dict[str, list[str]]  # species -> candidate move names
+    items: list[str | None]
+    natures: list[str] = field(default_factory=lambda: list(NATURE_MODIFIERS))
+    level: int = 50
+    # species -> its legal abilities
+    species_abilities: dict[str, list[str]] = field(default_factory=dict)
+
+    @classmethod
+    def default(cls, level: int = 50) -> 'SearchSpace':
+        """Every species whose learnset and abilities are known, with its
+        learnable Gen 3 moves, its own abilities and the validator's items.
+
+        Raises ``ValueError`` if no species qualifies (e.g. the learnset or
+        pokedex data is missing).
+        """
+        from . import stats_loader
+        registry = [mv.name for key, mv in load_gen3_moves().items() if key != 'struggle']
+        moves = {}
+        species_abilities = {}
+        for name, (learnable, abilities) in legal_species_data(stats_loader.species_names()).items():
+            pool = [m for m in registry if to_id(m) in learnable]
+            if len(pool) >= 4:
+                moves[name] = pool
+                species_abilities[name] = abilities
+        if not moves:
+            raise ValueError("No species with a known learnset and abilities; "
+                             "check data/pokedex.ts and the learnset data")
+        return cls(list(moves), moves, [None, *legal_items()], level=level,
+                   species_abilities=species_abilities)
+
+    def abilities_for(self, species: str) -> list[str | None]:
+        return self.species_abilities.get(species) or [None]
+
+    def is_legal(self, gene: MemberGene) -> bool:
+        """Check ``gene`` with the team validator (learnsets, banned items and combinations)."""
+        return set_is_legal(compile_set(gene.species, list(gene.moves), gene.item))
+
+    def random_evs(self, rng: random.Random) -> tuple[int, ...]:
+        evs = [0] * len(STAT_ORDER)
+        left = EV_TOTAL
+        while left:
+            open_stats = [i for i, ev in enumerate(evs) if ev < EV_CAP]
+            i = rng.choice(open_stats)
+            add = min(left, EV_CAP - evs[i], EV_STEP * rng.randint(1, 32))
+            evs[i] += add
+            left -= add
+        return tuple(evs)
+
+    def random_member(self, rng: random.Random) -> MemberGene:
+        species = rng.choice(self.species)
+        pool = self.moves[species]
+        return MemberGene(
+            species=species,
+            item=rng.choice(self.items),
+            ability=rng.choice(self.abilities_for(species)),
+            nature=rng.choice(self.natures),
+            evs=self.random_evs(rng),
+            moves=tuple(rng.sample(pool, min(4, len(pool)))),
+            level=self.level,
+        )
+
+    def mutate(self, gene: MemberGene, rng: random.Random) -> MemberGene:
+        """Change one field of ``gene``."""
+        field_name = rng.choice(('species', 'item', 'ability', 'nature', 'evs', 'moves'))
+        if field_name == 'species':
+            fresh = self.random_member(rng)
+            ability = gene.ability if gene.ability in self.abilities_for(fresh.species) else fresh.ability
+            return MemberGene(fresh.species, gene.item, ability, gene.nature, gene.evs,
+                              fresh.moves, gene.level)
+        if field_name == 'item':
+            return MemberGene(gene.species, rng.choice(self.items), gene.ability, gene.nature,
+                              gene.evs, gene.moves, gene.level)
+        if field_name == 'ability':
+            return MemberGene(gene.species, gene.item, rng.choice(self.abilities_for(gene.species)), gene.nature,
+                              gene.evs, gene.moves, gene.level)
+        if field_name == 'nature':
+            return MemberGene(gene.species, gene.item, gene.ability, rng.choice(self.natures),
+                              gene.evs, gene.moves, gene.level)
+        if field_name == 'evs':
+            return MemberGene(gene.species, gene.item, gene.ability, gene.nature,
+                              self.random_evs(rng), gene.moves, gene.level)
+        pool = [m for m in self.moves.get(gene.species, []) if m not in gene.moves]
+        if not pool or not gene.moves:
+            return gene
+        moves = list(gene.moves)
+        moves[rng.randrange(len(moves))] = rng.choice(pool)
+        return MemberGene(gene.species, gene.item, gene.ability, gene.nature, gene.evs,
+                          tuple(moves), gene.level)
+
+
+def crossover(a: Individual, b: Individual, rng: random.Random) -> Individual:
+    """Uniform crossover by team slot, keeping species unique."""
+    child: list[MemberGene] = []
+    for ga, gb in zip(a, b):
+        first, second = (ga, gb) if rng.random() < 0.5 else (gb, ga)
+        taken = {g.species for g in child}
+        child.append(first if first.species not in taken else second)
+    return tuple(child)
+
+
+# --- evaluation (runs in worker processes) ---
+
+_gauntlet: list[TeamTemplate] = []
+_moves_db = None
+_games = 1
+_max_turns = 500
+
+
+def _init_worker(gauntlet_texts: list[str], games: int, max_turns: int) -> None:
+    global _gauntlet, _moves_db, _games, _max_turns
+    _moves_db = load_gen3_moves()
+    _gauntlet = [TeamTemplate.from_team(parse_showdown(text, _moves_db)) for text in gauntlet_texts]
+    _games = games
+    _max_turns = max_turns
+
+
+def _evaluate(text: str, seed: int) -> tuple[int, int, int]:
+    """Play ``text`` against every gauntlet team; return (wins, games, errors)."""
+    try:
+        template = TeamTemplate.from_team(parse_showdown(text, _moves_db))
+    except Exception:
+        return 0, len(_gauntlet) * _games, len(_gauntlet) * _games
+    wins = errors = 0
+    for j, opponent in enumerate(_gauntlet):
+        for g in range(_games):
+            random.seed(seed + j * _games + g)
+            battle = Battle(template.instantiate(), opponent.instantiate(), verbose=False)
+            try:
+                result = battle.run_battle(random_policy, random_policy, _max_turns)
+            except Exception:
+                errors += 1
+                continue
+            wins += result.winner == 1
+    return wins, len(_gauntlet) * _games, errors
+
+
+# --- checkpointing ---
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as fh:
+            fh.write(text)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _gene_from_dict(data: dict) -> MemberGene:
+    return MemberGene(**{**data, 'evs': tuple(data['evs']), 'moves': tuple(data['moves'])})
+
+
+def save_checkpoint(path: Path, generation: int, population: list[Individual],
+                    cache: dict[str, list[int]], rng: random.Random) -> None:
+    version, state, gauss = rng.getstate()
+    data = {
+        'generation': generation,
+        'population': [[asdict(g) for g in ind] for ind in population],
+        'cache': cache,
+        'rng': [version, list(state), gauss],
+    }
+    _atomic_write_text(path, json.dumps(data))
+
+
+def load_checkpoint(path: Path, rng: random.Random) -> tuple[int, list[Individual], dict[str, list[int]]]:
+    data = json.loads(path.read_text())
+    version, state, gauss = data['rng']
+    rng.setstate((version, tuple(state), gauss))
+    population = [tuple(_gene_from_dict(g) for g in ind) for ind in data['population']]
+    return data['generation'], population, data['cache']
+
+
+# --- search loop ---
+
+def _fitness(cache: dict[str, list[int]], ind: Individual) -> float:
+    wins, games, _ = cache[export_team(ind)]
+    return wins / games if games else 0.0
+
+
+def _select(scored: list[tuple[float, Individual]], rng: random.Random, k: int = 3) -> Individual:
+    return max(rng.sample(scored, min(k, len(scored))), key=lambda s: s[0])[1]
+
+
+def evolve(gauntlet: list[str], space: SearchSpace, checkpoint: Path, generations: int = 50,
+           population_size: int = 64, elite: int = 4, mutation_rate: float = 0.3, games: int = 4,
+           team_size: int | None = None, seeds: list[Individual] | None = None, workers: int | None = None,
+           seed: int = 0, max_turns: int = 500) -> tuple[str | None, float]:
+    """Run the search, resuming from ``checkpoint`` if it exists.
+
+    Returns the exported text of the best team seen and its win rate, or
+    ``(None, 0.0)`` if no team was evaluated before an interrupt.
+    """
+    rng = random.Random(seed)
+    if checkpoint.exists():
+        start, population, cache = load_checkpoint(checkpoint, rng)
+        print(f"Resuming from generation {start} ({len(cache)} cached teams)")
+    else:
+        start, cache = 0, {}
+        size = team_size or (len(seeds[0]) if seeds else 6)
+        population = list(seeds or [])[:population_size]
+        while len(population) < population_size:
+            members: list[MemberGene] = []
+            while len(members) < size:
+                gene = space.random_member(rng)
+                if gene.species not in {g.species for g in members} and space.is_legal(gene):
+                    members.append(gene)
+            population.append(tuple(members))
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(gauntlet, games, max_turns)) as pool:
+        try:
+            for generation in range(start, generations):
+                texts = list(dict.fromkeys(export_team(ind) for ind in population))
+                todo = [t for t in texts if t not in cache]
+                seeds_ = [(seed ^ zlib.crc32(t.encode())) & 0x7FFFFFFF for t in todo]
+                for text, result in zip(todo, pool.map(_evaluate, todo, seeds_)):
+                    cache[text] = list(result)
+                scored = sorted(((_fitness(cache, ind), ind) for ind in population),
+                                key=lambda s: s[0], reverse=True)
+                print(f"Generation {generation}: best {scored[0][0]:.3f}, "
+                      f"mean {sum(s for s, _ in scored) / len(scored):.3f}, {len(todo)} new")
+
+                nxt = [ind for _, ind in scored[:elite]]
+                seen = {export_team(ind) for ind in nxt}
+                while len(nxt) < population_size:
+                    child = crossover(_select(scored, rng), _select(scored, rng), rng)
+                    child = tuple(space.mutate(g, rng) if rng.random() < mutation_rate else g for g in child)
+                    if len({g.species for g in child}) < len(child) or not all(map(space.is_legal, child)):
+                        continue
+                    text = export_team(child)
+                    if text not in seen:
+                        seen.add(text)
+                        nxt.append(child)
+                population = nxt
+                save_checkpoint(checkpoint, generation + 1, population, cache, rng)
+        except KeyboardInterrupt:
+            print("Interrupted; resume from the last checkpoint", file=sys.stderr)
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    played = [t for t in cache if cache[t][1]]
+    if not played:
+        return None, 0.0
+    best = max(played, key=lambda t: cache[t][0] / cache[t][1])
+    return best, cache[best][0] / cache[best][1]
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Evolve a team against a gauntlet.")
+    parser.add_argument("--gauntlet", nargs="+", required=True, help="team files to beat")
+    parser.add_argument("--seed-team", nargs="*", default=[], help="team files to seed the population")
+    parser.add_argument("--checkpoint", default="team_search.json")
+    parser.add_argument("--out", default="best_team.txt")
+    parser.add_argument("--generations", type=int, default=50)
+    parser.add_argument("--population", type=int, default=64)
+    parser.add_argument("--games", type=int, default=4, help="games per gauntlet team")
+    parser.add_argument("--team-size", type=int)
+    parser.add_argument("--workers", type=int, help="worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    gauntlet = [Path(p).read_text() for p in args.gauntlet]
+    moves_db = load_gen3_moves()
+    seeds = [genes_from_team(parse_showdown(Path(p).read_text(), moves_db)) for p in args.seed_team]
+    text, rate = evolve(
+        gauntlet, SearchSpace.default(), Path(args.checkpoint), generations=args.generations,
+        population_size=args.population, games=args.games, team_size=args.team_size,
+        seeds=seeds, workers=args.workers, seed=args.seed,
+    )
+    if text is None:
+        print("No team was evaluated; nothing written")
+        return
+    Path(args.out).write_text(text)
+    print(f"Best win rate {rate:.3f}; wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+from __future__ import annotations
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+from .move import Move
+from .moves_loader import load_gen3_moves, load_moves
+from .team import Team
+from .team_builder import move_index, parse_member
+
+
+@dataclass
+class ParseError:
+    """A team from a dump that could not be parsed."""
+    index: int
+    line: int
+    name: str | None
+    message: str
+
+
+@dataclass
+class RawTeam:
+    """Unparsed text of one team in a dump."""
+    index: int
+    line: int
+    name: str | None
+    text: str
+
+
+# Per-process canonical move index; built once per worker.
+_canon_map: dict[str, Move] | None = None
+
+
+def _init_worker(moves_path: str | None = None) -> None:
+    global _canon_map
+    _canon_map = move_index(load_gen3_moves() if moves_path is None else load_moves(moves_path))
+
+
+def _default_on_error(err: ParseError) -> None:
+    label = f" '{err.name}'" if err.name else ""
+    print(f"Skipping team {err.index}{label} at line {err.line}: {err.message}", file=sys.stderr)
+
+
+def iter_raw_teams(lines: Iterable[str]) -> Iterator[RawTeam]:
+    """Split a team dump into per-team text blocks without parsing them.
+
+    Teams are delimited by Showdown backup headers such as
+    ``=== [gen3ou] Stall ===``.  Text before the first header (or a file with
+    no headers at all) is treated as a single team.
+    """
+    index = 0
+    name = None
+    start = 1
+    buf: list[str] = []
+    for lineno, line in enumerate(lines, 1):
+        stripped = line.strip()
+        if stripped.startswith('===') and stripped.endswith('===') and len(stripped) > 6:
+            if any(l.strip() for l in buf):
+                yield RawTeam(index, start, name, ''.join(buf))
+                index += 1
+            name = stripped.strip('=').strip() or None
+            start = lineno + 1
+            buf = []
+            continue
+        buf.append(line)
+    if any(l.strip() for l in buf):
+        yield RawTeam(index, start, name, ''.join(buf))
+
+
+def parse_raw_team(raw: RawTeam, canon_map: dict[str, Move]) -> Team | ParseError:
+    """Parse a RawTeam, returning a ParseError instead of raising."""
+    blocks = [b.strip() for b in raw.text.strip().split('\n\n') if b.strip()]
+    try:
+        members = [parse_member(block, canon_map, copy_move=Move.copy) for block in blocks]
+    except Exception as exc:
+        return ParseError(raw.index, raw.line, raw.name, f"{type(exc).__name__}: {exc}")
+    if not members:
+        return ParseError(raw.index, raw.line, raw.name, "empty team")
+    return Team(members)
+
+
+def _parse_chunk(chunk: list[RawTeam]) -> list[tuple[RawTeam, Team | ParseError]]:
+    if _canon_map is None:
+        _init_worker()
+    return [(raw, parse_raw_team(raw, _canon_map)) for raw in chunk]
+
+
+def _chunks(raws: Iterator[RawTeam], size: int) -> Iterator[list[RawTeam]]:
+    while True:
+        chunk = list(islice(raws, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def stream_teams(
+    path: str | Path,
+    moves_path: str | Path | None = None,
+    workers: int = 0,
+    chunk_size: int = 64,
+    on_error: Callable[[ParseError], None] | None = _default_on_error,
+) -> Iterator[tuple[int, str | None, Team]]:
+    """Stream ``(index, name, Team)`` tuples from a Showdown team dump.
+
+    The file is read lazily line by line.  Malformed teams are skipped and
+    reported through ``on_error``.  With ``workers > 0`` chunks of teams are
+    parsed in a process pool; results are still yielded in file order and at
+    most ``2 * workers`` chunks are in flight at a time.
+    """
+    moves_arg = str(moves_path) if moves_path is not None else None
+    with open(path, encoding='utf-8') as fh:
+        chunks = _chunks(iter_raw_teams(fh), chunk_size)
+        if workers <= 0:
+            _init_worker(moves_arg)
+            results = (_parse_chunk(chunk) for chunk in chunks)
+            yield from _emit(results, on_error)
+            return
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(moves_arg,)) as pool:
+            yield from _emit(_ordered(pool, chunks, 2 * workers), on_error)
+
+
+def _ordered(pool: ProcessPoolExecutor, chunks: Iterator[list[RawTeam]], window: int):
+    pending = deque()
+    for chunk in chunks:
+        pending.append(pool.submit(_parse_chunk, chunk))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _emit(results, on_error):
+    for batch in results:
+        for raw, result in batch:
+            if isinstance(result, ParseError):
+                if on_error is not None:
+                    on_error(result)
+                continue
+            yield raw.index, raw.name, result
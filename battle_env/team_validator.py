@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from .learnsets import LearnsetIndex, species_id, to_id, get_learnset_index
+from .pokemon import Pokemon
+from .team import Team
+
+
+class CompiledSet:
+    """A Pokémon set reduced to the integers the validator operates on."""
+    __slots__ = ("species_id", "mask", "item", "unknown_moves")
+
+    def __init__(self, species_id: int | None, mask: int, item: str | None, unknown_moves: list[str]):
+        self.species_id = species_id
+        self.mask = mask
+        self.item = item
+        self.unknown_moves = unknown_moves
+
+
+def compile_set(species: str, moves: list[str], item: str | None = None,
+                index: LearnsetIndex | None = None) -> CompiledSet:
+    """Compile a species name, move names and item into a CompiledSet."""
+    if index is None:
+        index = get_learnset_index()
+    mask, unknown = index.move_mask(to_id(mv) for mv in moves)
+    return CompiledSet(index.species_ids.get(species_id(species)), mask,
+                       to_id(item) if item else None, unknown)
+
+
+def compile_pokemon(pokemon: Pokemon, index: LearnsetIndex | None = None) -> CompiledSet:
+    """Compile a Pokemon from ``team_builder`` (before or after battle setup)."""
+    item = pokemon.item
+    if item is not None and not isinstance(item, str):
+        item = getattr(item, "name", None)
+        item = None if item == "(none)" else item
+    moves = [mv.id or mv.name for mv in pokemon.moves]
+    return compile_set(pokemon.name, moves, item, index)
+
+
+def set_is_legal(cs: CompiledSet, index: LearnsetIndex | None = None, strict: bool = False) -> bool:
+    """Bitwise legality check for a single compiled set.
+
+    Species missing from the learnset data (e.g. Hoenn Pokémon while only
+    the Gen 2 learnsets are available) only fail when ``strict`` is set.
+    """
+    if index is None:
+        index = get_learnset_index()
+    if cs.item in index.banned_items:
+        return False
+    sid = cs.species_id
+    if sid is None:
+        return not strict and index.banned_combo(None, cs.mask) is None
+    if cs.unknown_moves:
+        return False
+    return index.is_legal(sid, cs.mask)
+
+
+def team_is_legal(sets: list[CompiledSet], index: LearnsetIndex | None = None, strict: bool = False) -> bool:
+    """Fast path for search loops: legality of every set plus Species Clause."""
+    if index is None:
+        index = get_learnset_index()
+    seen = 0
+    for cs in sets:
+        if cs.species_id is not None:
+            bit = 1 << cs.species_id
+            if seen & bit:
+                return False
+            seen |= bit
+        if not set_is_legal(cs, index, strict):
+            return False
+    return True
+
+
+def validate_team(team: Team, index: LearnsetIndex | None = None, strict: bool = False) -> list[str]:
+    """Return human-readable problems with ``team``; an empty list means legal.
+
+    Learnsets come from ``learnsets.default_learnsets()``, with moves of
+    pre-evolutions inherited.  Until Showdown's main ``learnsets.ts`` is in
+    ``data/`` only the GSC data is available: moves introduced in Gen 3 are
+    then not checked, and Gen 2 move sources are taken as Gen 3 ones.
+    """
+    if index is None:
+        index = get_learnset_index()
+    problems: list[str] = []
+    seen: set[int] = set()
+    for mon in team.members:
+        cs = compile_pokemon(mon, index)
+        if cs.item in index.banned_items:
+            problems.append(f"{mon.name}'s item {cs.item} is banned.")
+        sid = cs.species_id
+        if sid is None:
+            if strict:
+                problems.append(f"{mon.name} has no learnset data.")
+        else:
+            if sid in seen:
+                problems.append(f"Species Clause: more than one {mon.name}.")
+            seen.add(sid)
+            if sid in index.banned_species:
+                problems.append(f"{mon.name} is banned.")
+            for mv in cs.unknown_moves:
+                problems.append(f"{mon.name} can't learn {mv}.")
+            illegal = index.illegal_moves(sid, cs.mask)
+            if illegal:
+                for mv, bit in index.move_ids.items():
+                    if illegal >> bit & 1:
+                        problems.append(f"{mon.name} can't learn {mv}.")
+        combo = index.banned_combo(sid, cs.mask)
+        if combo:
+            problems.append(f"{mon.name} has the banned combination {combo}.")
+    return problems
@@ -0,0 +1,218 @@
+"""Round-robin tournaments that survive crashes and preemption.
+
+Every battle has a fixed position in the schedule (ordered team pair, then
+game number) and a seed derived from that position, so a battle's result
+does not depend on when or where it ran.  Finished battles are appended to
+a JSONL results file, one ``os.write`` per line on an ``O_APPEND``
+descriptor, and fsynced every ``flush_every`` results or ``flush_seconds``.
+On restart the file is read back and cut at the first line that does not
+parse (a torn write, or garbage left by a power loss), and only the missing
+battles are played.
+
+    python -m battle_env.tournament teams/*.txt --games 10 --out results.jsonl
+"""
+from __future__ import annotations
+import argparse
+import hashlib
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator
+
+from .battle import Battle
+from .broker import POLICIES
+from .moves_loader import load_gen3_moves
+from .results_store import ResultStore, side_summary
+from .team import TeamTemplate
+from .team_builder import parse_showdown
+
+
+def schedule(n_teams: int, games: int, seed: int = 0) -> Iterator[tuple[int, int, int, int, int]]:
+    """Yield ``(index, team_a, team_b, game, seed)`` in the fixed tournament order."""
+    index = 0
+    for a in range(n_teams):
+        for b in range(n_teams):
+            if a == b:
+                continue
+            for game in range(games):
+                yield index, a, b, game, seed + index
+                index += 1
+
+
+def tournament_id(texts: list[str], games: int, seed: int, policies: tuple[str, str], max_turns: int) -> str:
+    h = hashlib.sha256()
+    for text in texts:
+        h.update(hashlib.sha256(text.encode()).digest())
+    h.update(json.dumps([games, seed, list(policies), max_turns]).encode())
+    return h.hexdigest()[:16]
+
+
+class ResultLog:
+    """Append-only JSONL results file with crash-safe resume."""
+
+    def __init__(self, path: str | Path, header: dict, flush_every: int = 100, flush_seconds: float = 5.0):
+        self.path = Path(path)
+        self.flush_every = flush_every
+        self.flush_seconds = flush_seconds
+        self.done: dict[int, dict] = {}
+        if self.path.exists():
+            self._recover(header)
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        if os.fstat(self.fd).st_size == 0:
+            self._write(header)
+            os.fsync(self.fd)
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _recover(self, header: dict) -> None:
+        data = self.path.read_bytes()
+        # keep everything up to the first line that is torn or unreadable
+        # (a partial write, or NUL bytes and garbage left by a power loss)
+        end = 0
+        rows = []
+        while True:
+            newline = data.find(b"\n", end)
+            if newline < 0:
+                break
+            try:
+                row = json.loads(data[end:newline])
+            except ValueError:
+                break
+            if not isinstance(row, dict) or (rows and not isinstance(row.get('index'), int)):
+                break
+            rows.append(row)
+            end = newline + 1
+        if rows and rows[0].get('tournament') != header['tournament']:
+            raise ValueError(f"{self.path} belongs to a different tournament configuration")
+        if end < len(data):
+            with open(self.path, "r+b") as fh:
+                fh.truncate(end)
+        for row in rows[1:]:
+            self.done[row['index']] = row
+
+    def _write(self, row: dict) -> None:
+        os.write(self.fd, (json.dumps(row, separators=(',', ':')) + "\n").encode())
+
+    def append(self, row: dict) -> None:
+        self._write(row)
+        self.done[row['index']] = row
+        self._unsynced += 1
+        now = time.monotonic()
+        if self._unsynced >= self.flush_every or now - self._last_sync >= self.flush_seconds:
+            self.flush()
+
+    def flush(self) -> None:
+        os.fsync(self.fd)
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        if self.fd is not None:
+            self.flush()
+            os.close(self.fd)
+            self.fd = None
+
+
+# Per-process state for worker pools.
+_templates: list[TeamTemplate] = []
+_policies: tuple[str, str] = ('random', 'random')
+_max_turns = 500
+
+
+def _init_worker(texts: list[str], policies: tuple[str, str], max_turns: int) -> None:
+    global _templates, _policies, _max_turns
+    moves_db = load_gen3_moves()
+    _templates = [TeamTemplate.from_team(parse_showdown(text, moves_db)) for text in texts]
+    _policies = policies
+    _max_turns = max_turns
+
+
+def _play(entry: tuple[int, int, int, int, int]) -> dict:
+    index, a, b, game, seed = entry
+    random.seed(seed)
+    row = {'index': index, 'a': a, 'b': b, 'game': game, 'seed': seed}
+    try:
+        battle = Battle(_templates[a].instantiate(), _templates[b].instantiate(), verbose=False)
+        result = battle.run_battle(POLICIES[_policies[0]](), POLICIES[_policies[1]](), _max_turns)
+    except Exception as exc:
+        row['error'] = f"{type(exc).__name__}: {exc}"
+        return row
+    (hp1, left1), (hp2, left2) = side_summary(battle.team1), side_summary(battle.team2)
+    row.update(winner=result.winner, turns=result.turns, reason=result.reason, hp=[hp1, hp2], left=[left1, left2])
+    return row
+
+
+def run_tournament(team_texts: list[str], out: str | Path, games: int = 10, seed: int = 0,
+                   policies: tuple[str, str] = ('random', 'random'), max_turns: int = 500,
+                   workers: int = 1, flush_every: int = 100) -> dict[int, dict]:
+    """Play (or finish) a round-robin and return ``{index: result row}``."""
+    header = {'tournament': tournament_id(team_texts, games, seed, policies, max_turns),
+              'teams': len(team_texts), 'games': games, 'seed': seed, 'policies': list(policies)}
+    log = ResultLog(out, header, flush_every=flush_every)
+    todo = [entry for entry in schedule(len(team_texts), games, seed) if entry[0] not in log.done]
+    if log.done:
+        print(f"Resuming: {len(log.done)} battles done, {len(todo)} to go")
+    try:
+        if workers > 1:
+            with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                     initargs=(team_texts, policies, max_turns)) as pool:
+                for row in pool.map(_play, todo, chunksize=16):
+                    log.append(row)
+        else:
+            _init_worker(team_texts, policies, max_turns)
+            for entry in todo:
+                log.append(_play(entry))
+    finally:
+        log.close()
+    return log.done
+
+
+def standings(results: dict[int, dict], n_teams: int) -> list[tuple[int, int, int, int]]:
+    """Return ``(team, wins, losses, draws)`` rows sorted by wins."""
+    table = {t: [0, 0, 0] for t in range(n_teams)}
+    for row in results.values():
+        if 'error' in row:
+            continue
+        a, b, winner = row['a'], row['b'], row['winner']
+        if winner == 1:
+            table[a][0] += 1
+            table[b][1] += 1
+        elif winner == 2:
+            table[b][0] += 1
+            table[a][1] += 1
+        else:
+            table[a][2] += 1
+            table[b][2] += 1
+    return sorted(((t, *v) for t, v in table.items()), key=lambda r: -r[1])
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Run a resumable round-robin tournament.")
+    parser.add_argument("teams", nargs="+", help="team files")
+    parser.add_argument("--games", type=int, default=10, help="games per ordered pair")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--policies", nargs=2, default=["random", "random"], choices=sorted(POLICIES))
+    parser.add_argument("--max-turns", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--out", default="tournament.jsonl")
+    parser.add_argument("--db", help="also import the results into this SQLite results store")
+    args = parser.parse_args(argv)
+
+    texts = [Path(p).read_text() for p in args.teams]
+    results = run_tournament(texts, args.out, args.games, args.seed, tuple(args.policies),
+                             args.max_turns, args.workers)
+    for team, wins, losses, draws in standings(results, len(texts)):
+        print(f"{args.teams[team]:<30} {wins:>6} W {losses:>6} L {draws:>6} D")
+    if args.db:
+        source = tournament_id(texts, args.games, args.seed, tuple(args.policies), args.max_turns)
+        with ResultStore(args.db) as store:
+            print(f"Stored {store.add_tournament(texts, results, source)} new battles in {args.db}")
+
+
+if __name__ == "__main__":
+    main()
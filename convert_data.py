@@ -0,0 +1,272 @@
+"""Incremental conversion of the bundled Showdown ``.ts`` data into JSON.
+
+Every source file is hashed; a source is only re-converted when its content
+(or the converter settings for it) changed since the last run.  Independent
+sources are converted in parallel and every output is written atomically.
+
+Usage: ``python convert_data.py [--force] [--jobs N] [target ...]``
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent
+DATA_DIR = REPO_ROOT / "data"
+CACHE_DIR = DATA_DIR / ".cache" / "convert"
+MANIFEST_FILE = DATA_DIR / ".convert_manifest.json"
+CONVERTER_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Source:
+    path: str
+    export: str
+    # "strip": plain data tables, made runnable by removing the TS type
+    # annotations in Python.  "esbuild": files with typed callback bodies.
+    transpile: str = "strip"
+    # "stringify" keeps callbacks as source text, "drop" removes them.
+    functions: str = "drop"
+    max_gen: int | None = None
+
+
+@dataclass(frozen=True)
+class Target:
+    output: str
+    sources: tuple[Source, ...]
+    # Keep fields that were added to the existing output by hand (the engine
+    # hooks in items.json such as ``boost_type``) when regenerating it.  Off
+    # by default so every other output is a pure function of its sources.
+    keep_extra_fields: bool = False
+
+
+TARGETS: dict[str, Target] = {
+    "moves": Target("moves.json", (
+        Source("data/base_moves.ts", "Moves", "esbuild", "stringify", max_gen=3),
+        Source("2gen_env_Showdown/moves.ts", "Moves", "esbuild", "stringify", max_gen=3),
+        Source("3gen_env_Showdown/moves.ts", "Moves", "esbuild", "stringify", max_gen=3),
+    )),
+    "items": Target("items.json", (
+        Source("3gen_env_Showdown/items.ts", "Items"),
+        Source("2gen_env_Showdown/items.ts", "Items"),
+    ), keep_extra_fields=True),
+    "abilities": Target("abilities.json", (
+        Source("3gen_env_Showdown/abilities.ts", "Abilities", functions="stringify"),
+    )),
+    "formats_data_gen3": Target("formats_data_gen3.json", (
+        Source("3gen_env_Showdown/formats-data.ts", "FormatsData"),
+    )),
+    "formats_data_gen2": Target("formats_data_gen2.json", (
+        Source("2gen_env_Showdown/formats-data.ts", "FormatsData"),
+    )),
+    "learnsets_gen2": Target("learnsets_gen2.json", (
+        Source("2gen_env_Showdown/learnsets.ts", "Learnsets"),
+    )),
+}
+
+NODE_SCRIPT = """
+const fs = require('fs');
+const vm = require('vm');
+const [,, jsPath, outPath, exportName, functions, maxGen] = process.argv;
+let table;
+if (jsPath.endsWith('.cjs')) {
+  const mod = require(jsPath);
+  table = mod[exportName] || mod.default || {};
+} else {
+  const context = {};
+  vm.runInNewContext(fs.readFileSync(jsPath, 'utf8'), context);
+  table = context[exportName] || {};
+}
+function sanitize(obj) {
+  if (Array.isArray(obj)) return obj.map(sanitize);
+  if (obj && typeof obj === 'object') {
+    const out = {};
+    for (const [k, v] of Object.entries(obj)) {
+      if (typeof v === 'function') {
+        if (functions === 'stringify') out[k] = v.toString();
+      } else {
+        out[k] = sanitize(v);
+      }
+    }
+    return out;
+  }
+  return obj;
+}
+const limit = maxGen ? Number(maxGen) : 0;
+const plain = {};
+for (const [id, data] of Object.entries(table)) {
+  if (!limit || !data.gen || data.gen <= limit) {
+    plain[id] = sanitize(Object.assign({id}, data));
+  }
+}
+fs.writeFileSync(outPath, JSON.stringify(plain));
+"""
+
+
+def source_key(src: Source) -> str:
+    """Hash of a source's content plus every setting that affects its output."""
+    h = hashlib.sha256()
+    h.update(f"{CONVERTER_VERSION}|{src.export}|{src.transpile}|{src.functions}|{src.max_gen}|".encode())
+    h.update((REPO_ROOT / src.path).read_bytes())
+    return h.hexdigest()
+
+
+def atomic_write(path: Path, text: str) -> None:
+    """Write ``text`` to ``path`` via a temp file in the same directory."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(text)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def strip_types(text: str, export: str) -> str:
+    """Turn a Showdown data-table ``.ts`` file into a script for ``vm``."""
+    text = re.sub(r"^import type .*$", "", text, flags=re.M)
+    text = re.sub(rf"export const {export}:.*?=", f"globalThis.{export} =", text, count=1)
+    text = re.sub(r"!([\.\[])", r"\1", text)
+    return text.replace("!++", "++")
+
+
+def esbuild_command() -> list[str]:
+    """Locate esbuild once: a local install wins over ``npx``."""
+    local = REPO_ROOT / "node_modules" / ".bin" / "esbuild"
+    if local.exists():
+        return [local.as_posix()]
+    found = shutil.which("esbuild")
+    if found:
+        return [found]
+    return ["npx", "--yes", "esbuild"]
+
+
+def convert_source(src: Source, key: str, workdir: Path, node_script: Path, esbuild: list[str]) -> Path:
+    """Convert one source into the cache, returning the cached JSON path."""
+    cached = CACHE_DIR / f"{key}.json"
+    ts_file = REPO_ROOT / src.path
+    if src.transpile == "esbuild":
+        js_file = workdir / f"{key}.cjs"
+        subprocess.run(
+            esbuild + [ts_file.as_posix(), "--format=cjs", f"--outfile={js_file.as_posix()}"],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    else:
+        js_file = workdir / f"{key}.js"
+        js_file.write_text(strip_types(ts_file.read_text(encoding="utf-8"), src.export), encoding="utf-8")
+    out_tmp = workdir / f"{key}.json"
+    subprocess.run(
+        ["node", node_script.as_posix(), js_file.as_posix(), out_tmp.as_posix(),
+         src.export, src.functions, str(src.max_gen or "")],
+        check=True,
+    )
+    atomic_write(cached, out_tmp.read_text(encoding="utf-8"))
+    return cached
+
+
+def merge_extra_fields(data: dict, previous: dict) -> None:
+    """Copy fields present only in ``previous`` entries back into ``data``."""
+    for ident, old in previous.items():
+        new = data.get(ident)
+        if isinstance(new, dict) and isinstance(old, dict):
+            for key, value in old.items():
+                new.setdefault(key, value)
+
+
+def load_manifest() -> dict:
+    if MANIFEST_FILE.exists():
+        return json.loads(MANIFEST_FILE.read_text())
+    return {}
+
+
+def build(targets: list[str], force: bool = False, jobs: int | None = None) -> list[str]:
+    """Bring the requested targets up to date; return the outputs rewritten."""
+    manifest = load_manifest()
+    wanted = {name: TARGETS[name] for name in targets}
+    keys: dict[Source, str] = {}
+    for target in wanted.values():
+        for src in target.sources:
+            if (REPO_ROOT / src.path).exists():
+                keys[src] = source_key(src)
+
+    stale = {}
+    for name, target in wanted.items():
+        present = [keys[src] for src in target.sources if src in keys]
+        out = DATA_DIR / target.output
+        if force or not out.exists() or manifest.get(target.output) != present:
+            stale[name] = target
+
+    todo = {}
+    for target in stale.values():
+        for src in target.sources:
+            if src in keys and (force or not (CACHE_DIR / f"{keys[src]}.json").exists()):
+                todo[src] = keys[src]
+
+    if todo:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        esbuild = esbuild_command() if any(s.transpile == "esbuild" for s in todo) else []
+        with tempfile.TemporaryDirectory() as tmp:
+            workdir = Path(tmp)
+            node_script = workdir / "convert.js"
+            node_script.write_text(NODE_SCRIPT)
+            with ThreadPoolExecutor(jobs or min(len(todo), os.cpu_count() or 1)) as pool:
+                futures = [
+                    pool.submit(convert_source, src, key, workdir, node_script, esbuild)
+                    for src, key in todo.items()
+                ]
+                for fut in futures:
+                    fut.result()
+
+    written = []
+    for name, target in stale.items():
+        data: dict[str, dict] = {}
+        present = []
+        for src in target.sources:
+            if src not in keys:
+                continue
+            present.append(keys[src])
+            data.update(json.loads((CACHE_DIR / f"{keys[src]}.json").read_text()))
+        out = DATA_DIR / target.output
+        if target.keep_extra_fields and out.exists():
+            merge_extra_fields(data, json.loads(out.read_text()))
+        atomic_write(DATA_DIR / target.output, json.dumps(data, indent=2, ensure_ascii=False))
+        manifest[target.output] = present
+        written.append(target.output)
+    if written:
+        atomic_write(MANIFEST_FILE, json.dumps(manifest, indent=2, sort_keys=True))
+    return written
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("targets", nargs="*", metavar="target",
+                        help=f"subset of: {', '.join(sorted(TARGETS))} (default: all)")
+    parser.add_argument("--force", action="store_true", help="ignore cached hashes")
+    parser.add_argument("--jobs", type=int, default=None, help="parallel conversions")
+    args = parser.parse_args()
+    unknown = [t for t in args.targets if t not in TARGETS]
+    if unknown:
+        parser.error(f"unknown target(s): {', '.join(unknown)}")
+    written = build(args.targets or sorted(TARGETS), force=args.force, jobs=args.jobs)
+    for output in written:
+        print(f"Wrote {DATA_DIR / output}")
+    if not written:
+        print("Everything up to date.")
+
+
+if __name__ == "__main__":
+    main()
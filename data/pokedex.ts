@@ -0,0 +1,2728 @@
+// Gen 3 species data in the layout of Showdown's data/pokedex.ts: types as
+// of Gen 3 (before Fairy), the Gen 3 ability slots (no hidden abilities),
+// and base stats from Base_Stats_Gen3.xlsx.
+export const Pokedex: {[speciesid: string]: SpeciesData} = {
+	bulbasaur: {
+		num: 1,
+		name: "Bulbasaur",
+		types: ["Grass", "Poison"],
+		baseStats: {hp: 45, atk: 49, def: 49, spa: 65, spd: 65, spe: 45},
+		abilities: {0: "Overgrow"},
+	},
+	ivysaur: {
+		num: 2,
+		name: "Ivysaur",
+		types: ["Grass", "Poison"],
+		baseStats: {hp: 60, atk: 62, def: 63, spa: 80, spd: 80, spe: 60},
+		abilities: {0: "Overgrow"},
+	},
+	venusaur: {
+		num: 3,
+		name: "Venusaur",
+		types: ["Grass", "Poison"],
+		baseStats: {hp: 80, atk: 82, def: 83, spa: 100, spd: 100, spe: 80},
+		abilities: {0: "Overgrow"},
+	},
+	charmander: {
+		num: 4,
+		name: "Charmander",
+		types: ["Fire"],
+		baseStats: {hp: 39, atk: 52, def: 43, spa: 60, spd: 50, spe: 65},
+		abilities: {0: "Blaze"},
+	},
+	charmeleon: {
+		num: 5,
+		name: "Charmeleon",
+		types: ["Fire"],
+		baseStats: {hp: 58, atk: 64, def: 58, spa: 80, spd: 65, spe: 80},
+		abilities: {0: "Blaze"},
+	},
+	charizard: {
+		num: 6,
+		name: "Charizard",
+		types: ["Fire", "Flying"],
+		baseStats: {hp: 78, atk: 84, def: 78, spa: 109, spd: 85, spe: 100},
+		abilities: {0: "Blaze"},
+	},
+	squirtle: {
+		num: 7,
+		name: "Squirtle",
+		types: ["Water"],
+		baseStats: {hp: 44, atk: 48, def: 65, spa: 50, spd: 64, spe: 43},
+		abilities: {0: "Torrent"},
+	},
+	wartortle: {
+		num: 8,
+		name: "Wartortle",
+		types: ["Water"],
+		baseStats: {hp: 59, atk: 63, def: 80, spa: 65, spd: 80, spe: 58},
+		abilities: {0: "Torrent"},
+	},
+	blastoise: {
+		num: 9,
+		name: "Blastoise",
+		types: ["Water"],
+		baseStats: {hp: 79, atk: 83, def: 100, spa: 85, spd: 105, spe: 78},
+		abilities: {0: "Torrent"},
+	},
+	caterpie: {
+		num: 10,
+		name: "Caterpie",
+		types: ["Bug"],
+		baseStats: {hp: 45, atk: 30, def: 35, spa: 20, spd: 20, spe: 45},
+		abilities: {0: "Shield Dust"},
+	},
+	metapod: {
+		num: 11,
+		name: "Metapod",
+		types: ["Bug"],
+		baseStats: {hp: 50, atk: 20, def: 55, spa: 25, spd: 25, spe: 30},
+		abilities: {0: "Shed Skin"},
+	},
+	butterfree: {
+		num: 12,
+		name: "Butterfree",
+		types: ["Bug", "Flying"],
+		baseStats: {hp: 60, atk: 45, def: 50, spa: 80, spd: 80, spe: 70},
+		abilities: {0: "Compound Eyes"},
+	},
+	weedle: {
+		num: 13,
+		name: "Weedle",
+		types: ["Bug", "Poison"],
+		baseStats: {hp: 40, atk: 35, def: 30, spa: 20, spd: 20, spe: 50},
+		abilities: {0: "Shield Dust"},
+	},
+	kakuna: {
+		num: 14,
+		name: "Kakuna",
+		types: ["Bug", "Poison"],
+		baseStats: {hp: 45, atk: 25, def: 50, spa: 25, spd: 25, spe: 35},
+		abilities: {0: "Shed Skin"},
+	},
+	beedrill: {
+		num: 15,
+		name: "Beedrill",
+		types: ["Bug", "Poison"],
+		baseStats: {hp: 65, atk: 80, def: 40, spa: 45, spd: 80, spe: 75},
+		abilities: {0: "Swarm"},
+	},
+	pidgey: {
+		num: 16,
+		name: "Pidgey",
+		types: ["Normal", "Flying"],
+		baseStats: {hp: 40, atk: 45, def: 40, spa: 35, spd: 35, spe: 56},
+		abilities: {0: "Keen Eye"},
+	},
+	pidgeotto: {
+		num: 17,
+		name: "Pidgeotto",
+		types: ["Normal", "Flying"],
+		baseStats: {hp: 63, atk: 60, def: 55, spa: 50, spd: 50, spe: 71},
+		abilities: {0: "Keen Eye"},
+	},
+	pidgeot: {
+		num: 18,
+		name: "Pidgeot",
+		types: ["Normal", "Flying"],
+		baseStats: {hp: 83, atk: 80, def: 75, spa: 70, spd: 70, spe: 91},
+		abilities: {0: "Keen Eye"},
+	},
+	rattata: {
+		num: 19,
+		name: "Rattata",
+		types: ["Normal"],
+		baseStats: {hp: 30, atk: 56, def: 35, spa: 25, spd: 35, spe: 72},
+		abilities: {0: "Run Away", 1: "Guts"},
+	},
+	raticate: {
+		num: 20,
+		name: "Raticate",
+		types: ["Normal"],
+		baseStats: {hp: 55, atk: 81, def: 60, spa: 50, spd: 70, spe: 97},
+		abilities: {0: "Run Away", 1: "Guts"},
+	},
+	spearow: {
+		num: 21,
+		name: "Spearow",
+		types: ["Normal", "Flying"],
+		baseStats: {hp: 40, atk: 60, def: 30, spa: 31, spd: 31, spe: 70},
+		abilities: {0: "Keen Eye"},
+	},
+	fearow: {
+		num: 22,
+		name: "Fearow",
+		types: ["Normal", "Flying"],
+		baseStats: {hp: 65, atk: 90, def: 65, spa: 61, spd: 61, spe: 100},
+		abilities: {0: "Keen Eye"},
+	},
+	ekans: {
+		num: 23,
+		name: "Ekans",
+		types: ["Poison"],
+		baseStats: {hp: 35, atk: 60, def: 44, spa: 40, spd: 54, spe: 55},
+		abilities: {0: "Intimidate", 1: "Shed Skin"},
+	},
+	arbok: {
+		num: 24,
+		name: "Arbok",
+		types: ["Poison"],
+		baseStats: {hp: 60, atk: 85, def: 69, spa: 65, spd: 79, spe: 80},
+		abilities: {0: "Intimidate", 1: "Shed Skin"},
+	},
+	pikachu: {
+		num: 25,
+		name: "Pikachu",
+		types: ["Electric"],
+		baseStats: {hp: 35, atk: 55, def: 30, spa: 50, spd: 40, spe: 90},
+		abilities: {0: "Static"},
+	},
+	raichu: {
+		num: 26,
+		name: "Raichu",
+		types: ["Electric"],
+		baseStats: {hp: 60, atk: 90, def: 55, spa: 90, spd: 80, spe: 100},
+		abilities: {0: "Static"},
+	},
+	sandshrew: {
+		num: 27,
+		name: "Sandshrew",
+		types: ["Ground"],
+		baseStats: {hp: 50, atk: 75, def: 85, spa: 20, spd: 30, spe: 40},
+		abilities: {0: "Sand Veil"},
+	},
+	sandslash: {
+		num: 28,
+		name: "Sandslash",
+		types: ["Ground"],
+		baseStats: {hp: 75, atk: 100, def: 110, spa: 45, spd: 55, spe: 65},
+		abilities: {0: "Sand Veil"},
+	},
+	nidoranf: {
+		num: 29,
+		name: "Nidoran-F",
+		types: ["Poison"],
+		baseStats: {hp: 55, atk: 47, def: 52, spa: 40, spd: 40, spe: 41},
+		abilities: {0: "Poison Point"},
+	},
+	nidorina: {
+		num: 30,
+		name: "Nidorina",
+		types: ["Poison"],
+		baseStats: {hp: 70, atk: 62, def: 67, spa: 55, spd: 55, spe: 56},
+		abilities: {0: "Poison Point"},
+	},
+	nidoqueen: {
+		num: 31,
+		name: "Nidoqueen",
+		types: ["Poison", "Ground"],
+		baseStats: {hp: 90, atk: 82, def: 87, spa: 75, spd: 85, spe: 76},
+		abilities: {0: "Poison Point"},
+	},
+	nidoranm: {
+		num: 32,
+		name: "Nidoran-M",
+		types: ["Poison"],
+		baseStats: {hp: 46, atk: 57, def: 40, spa: 40, spd: 40, spe: 50},
+		abilities: {0: "Poison Point"},
+	},
+	nidorino: {
+		num: 33,
+		name: "Nidorino",
+		types: ["Poison"],
+		baseStats: {hp: 61, atk: 72, def: 57, spa: 55, spd: 55, spe: 65},
+		abilities: {0: "Poison Point"},
+	},
+	nidoking: {
+		num: 34,
+		name: "Nidoking",
+		types: ["Poison", "Ground"],
+		baseStats: {hp: 81, atk: 92, def: 77, spa: 85, spd: 75, spe: 85},
+		abilities: {0: "Poison Point"},
+	},
+	clefairy: {
+		num: 35,
+		name: "Clefairy",
+		types: ["Normal"],
+		baseStats: {hp: 70, atk: 45, def: 48, spa: 60, spd: 65, spe: 35},
+		abilities: {0: "Cute Charm"},
+	},
+	clefable: {
+		num: 36,
+		name: "Clefable",
+		types: ["Normal"],
+		baseStats: {hp: 95, atk: 70, def: 73, spa: 85, spd: 90, spe: 60},
+		abilities: {0: "Cute Charm"},
+	},
+	vulpix: {
+		num: 37,
+		name: "Vulpix",
+		types: ["Fire"],
+		baseStats: {hp: 38, atk: 41, def: 40, spa: 50, spd: 65, spe: 65},
+		abilities: {0: "Flash Fire"},
+	},
+	ninetales: {
+		num: 38,
+		name: "Ninetales",
+		types: ["Fire"],
+		baseStats: {hp: 73, atk: 76, def: 75, spa: 81, spd: 100, spe: 100},
+		abilities: {0: "Flash Fire"},
+	},
+	jigglypuff: {
+		num: 39,
+		name: "Jigglypuff",
+		types: ["Normal"],
+		baseStats: {hp: 115, atk: 45, def: 20, spa: 45, spd: 25, spe: 20},
+		abilities: {0: "Cute Charm"},
+	},
+	wigglytuff: {
+		num: 40,
+		name: "Wigglytuff",
+		types: ["Normal"],
+		baseStats: {hp: 140, atk: 70, def: 45, spa: 75, spd: 50, spe: 45},
+		abilities: {0: "Cute Charm"},
+	},
+	zubat: {
+		num: 41,
+		name: "Zubat",
+		types: ["Poison", "Flying"],
+		baseStats: {hp: 40, atk: 45, def: 35, spa: 30, spd: 40, spe: 55},
+		abilities: {0: "Inner Focus"},
+	},
+	golbat: {
+		num: 42,
+		name: "Golbat",
+		types: ["Poison", "Flying"],
+		baseStats: {hp: 75, atk: 80, def: 70, spa: 65, spd: 75, spe: 90},
+		abilities: {0: "Inner Focus"},
+	},
+	oddish: {
+		num: 43,
+		name: "Oddish",
+		types: ["Grass", "Poison"],
+		baseStats: {hp: 45, atk: 50, def: 55, spa: 75, spd: 65, spe: 30},
+		abilities: {0: "Chlorophyll"},
+	},
+	gloom: {
+		num: 44,
+		name: "Gloom",
+		types: ["Grass", "Poison"],
+		baseStats: {hp: 60, atk: 65, def: 70, spa: 85, spd: 75, spe: 40},
+		abilities: {0: "Chlorophyll"},
+	},
+	vileplume: {
+		num: 45,
+		name: "Vileplume",
+		types: ["Grass", "Poison"],
+		baseStats: {hp: 75, atk: 80, def: 85, spa: 100, spd: 90, spe: 50},
+		abilities: {0: "Chlorophyll"},
+	},
+	paras: {
+		num: 46,
+		name: "Paras",
+		types: ["Bug", "Grass"],
+		baseStats: {hp: 35, atk: 70, def: 55, spa: 45, spd: 55, spe: 25},
+		abilities: {0: "Effect Spore"},
+	},
+	parasect: {
+		num: 47,
+		name: "Parasect",
+		types: ["Bug", "Grass"],
+		baseStats: {hp: 60, atk: 95, def: 80, spa: 60, spd: 80, spe: 30},
+		abilities: {0: "Effect Spore"},
+	},
+	venonat: {
+		num: 48,
+		name: "Venonat",
+		types: ["Bug", "Poison"],
+		baseStats: {hp: 60, atk: 55, def: 50, spa: 40, spd: 55, spe: 45},
+		abilities: {0: "Compound Eyes"},
+	},
+	venomoth: {
+		num: 49,
+		name: "Venomoth",
+		types: ["Bug", "Poison"],
+		baseStats: {hp: 70, atk: 65, def: 60, spa: 90, spd: 75, spe: 90},
+		abilities: {0: "Shield Dust"},
+	},
+	diglett: {
+		num: 50,
+		name: "Diglett",
+		types: ["Ground"],
+		baseStats: {hp: 10, atk: 55, def: 25, spa: 35, spd: 45, spe: 95},
+		abilities: {0: "Sand Veil", 1: "Arena Trap"},
+	},
+	dugtrio: {
+		num: 51,
+		name: "Dugtrio",
+		types: ["Ground"],
+		baseStats: {hp: 35, atk: 80, def: 50, spa: 50, spd: 70, spe: 120},
+		abilities: {0: "Sand Veil", 1: "Arena Trap"},
+	},
+	meowth: {
+		num: 52,
+		name: "Meowth",
+		types: ["Normal"],
+		baseStats: {hp: 40, atk: 45, def: 35, spa: 40, spd: 40, spe: 90},
+		abilities: {0: "Pickup"},
+	},
+	persian: {
+		num: 53,
+		name: "Persian",
+		types: ["Normal"],
+		baseStats: {hp: 65, atk: 70, def: 60, spa: 65, spd: 65, spe: 115},
+		abilities: {0: "Limber"},
+	},
+	psyduck: {
+		num: 54,
+		name: "Psyduck",
+		types: ["Water"],
+		baseStats: {hp: 50, atk: 52, def: 48, spa: 65, spd: 50, spe: 55},
+		abilities: {0: "Damp", 1: "Cloud Nine"},
+	},
+	golduck: {
+		num: 55,
+		name: "Golduck",
+		types: ["Water"],
+		baseStats: {hp: 80, atk: 82, def: 78, spa: 95, spd: 80, spe: 85},
+		abilities: {0: "Damp", 1: "Cloud Nine"},
+	},
+	mankey: {
+		num: 56,
+		name: "Mankey",
+		types: ["Fighting"],
+		baseStats: {hp: 40, atk: 80, def: 35, spa: 35, spd: 45, spe: 70},
+		abilities: {0: "Vital Spirit"},
+	},
+	primeape: {
+		num: 57,
+		name: "Primeape",
+		types: ["Fighting"],
+		baseStats: {hp: 65, atk: 105, def: 60, spa: 60, spd: 70, spe: 95},
+		abilities: {0: "Vital Spirit"},
+	},
+	growlithe: {
+		num: 58,
+		name: "Growlithe",
+		types: ["Fire"],
+		baseStats: {hp: 55, atk: 70, def: 45, spa: 70, spd: 50, spe: 60},
+		abilities: {0: "Intimidate", 1: "Flash Fire"},
+	},
+	arcanine: {
+		num: 59,
+		name: "Arcanine",
+		types: ["Fire"],
+		baseStats: {hp: 90, atk: 110, def: 80, spa: 100, spd: 80, spe: 95},
+		abilities: {0: "Intimidate", 1: "Flash Fire"},
+	},
+	poliwag: {
+		num: 60,
+		name: "Poliwag",
+		types: ["Water"],
+		baseStats: {hp: 40, atk: 50, def: 40, spa: 40, spd: 40, spe: 90},
+		abilities: {0: "Water Absorb", 1: "Damp"},
+	},
+	poliwhirl: {
+		num: 61,
+		name: "Poliwhirl",
+		types: ["Water"],
+		baseStats: {hp: 65, atk: 65, def: 65, spa: 50, spd: 50, spe: 90},
+		abilities: {0: "Water Absorb", 1: "Damp"},
+	},
+	poliwrath: {
+		num: 62,
+		name: "Poliwrath",
+		types: ["Water", "Fighting"],
+		baseStats: {hp: 90, atk: 85, def: 95, spa: 70, spd: 90, spe: 70},
+		abilities: {0: "Water Absorb", 1: "Damp"},
+	},
+	abra: {
+		num: 63,
+		name: "Abra",
+		types: ["Psychic"],
+		baseStats: {hp: 25, atk: 20, def: 15, spa: 105, spd: 55, spe: 90},
+		abilities: {0: "Synchronize", 1: "Inner Focus"},
+	},
+	kadabra: {
+		num: 64,
+		name: "Kadabra",
+		types: ["Psychic"],
+		baseStats: {hp: 40, atk: 35, def: 30, spa: 120, spd: 70, spe: 105},
+		abilities: {0: "Synchronize", 1: "Inner Focus"},
+	},
+	alakazam: {
+		num: 65,
+		name: "Alakazam",
+		types: ["Psychic"],
+		baseStats: {hp: 55, atk: 50, def: 45, spa: 135, spd: 85, spe: 120},
+		abilities: {0: "Synchronize", 1: "Inner Focus"},
+	},
+	machop: {
+		num: 66,
+		name: "Machop",
+		types: ["Fighting"],
+		baseStats: {hp: 70, atk: 80, def: 50, spa: 35, spd: 35, spe: 35},
+		abilities: {0: "Guts"},
+	},
+	machoke: {
+		num: 67,
+		name: "Machoke",
+		types: ["Fighting"],
+		baseStats: {hp: 80, atk: 100, def: 70, spa: 50, spd: 60, spe: 45},
+		abilities: {0: "Guts"},
+	},
+	machamp: {
+		num: 68,
+		name: "Machamp",
+		types: ["Fighting"],
+		baseStats: {hp: 90, atk: 130, def: 80, spa: 65, spd: 85, spe: 55},
+		abilities: {0: "Guts"},
+	},
+	bellsprout: {
+		num: 69,
+		name: "Bellsprout",
+		types: ["Grass", "Poison"],
+		baseStats: {hp: 50, atk: 75, def: 35, spa: 70, spd: 30, spe: 40},
+		abilities: {0: "Chlorophyll"},
+	},
+	weepinbell: {
+		num: 70,
+		name: "Weepinbell",
+		types: ["Grass", "Poison"],
+		baseStats: {hp: 65, atk: 90, def: 50, spa: 85, spd: 45, spe: 55},
+		abilities: {0: "Chlorophyll"},
+	},
+	victreebel: {
+		num: 71,
+		name: "Victreebel",
+		types: ["Grass", "Poison"],
+		baseStats: {hp: 80, atk: 105, def: 65, spa: 100, spd: 60, spe: 70},
+		abilities: {0: "Chlorophyll"},
+	},
+	tentacool: {
+		num: 72,
+		name: "Tentacool",
+		types: ["Water", "Poison"],
+		baseStats: {hp: 40, atk: 40, def: 35, spa: 50, spd: 100, spe: 70},
+		abilities: {0: "Clear Body", 1: "Liquid Ooze"},
+	},
+	tentacruel: {
+		num: 73,
+		name: "Tentacruel",
+		types: ["Water", "Poison"],
+		baseStats: {hp: 80, atk: 70, def: 65, spa: 80, spd: 120, spe: 100},
+		abilities: {0: "Clear Body", 1: "Liquid Ooze"},
+	},
+	geodude: {
+		num: 74,
+		name: "Geodude",
+		types: ["Rock", "Ground"],
+		baseStats: {hp: 40, atk: 80, def: 100, spa: 30, spd: 30, spe: 20},
+		abilities: {0: "Rock Head", 1: "Sturdy"},
+	},
+	graveler: {
+		num: 75,
+		name: "Graveler",
+		types: ["Rock", "Ground"],
+		baseStats: {hp: 55, atk: 95, def: 115, spa: 45, spd: 45, spe: 35},
+		abilities: {0: "Rock Head", 1: "Sturdy"},
+	},
+	golem: {
+		num: 76,
+		name: "Golem",
+		types: ["Rock", "Ground"],
+		baseStats: {hp: 80, atk: 110, def: 130, spa: 55, spd: 65, spe: 45},
+		abilities: {0: "Rock Head", 1: "Sturdy"},
+	},
+	ponyta: {
+		num: 77,
+		name: "Ponyta",
+		types: ["Fire"],
+		baseStats: {hp: 50, atk: 85, def: 55, spa: 65, spd: 65, spe: 90},
+		abilities: {0: "Run Away", 1: "Flash Fire"},
+	},
+	rapidash: {
+		num: 78,
+		name: "Rapidash",
+		types: ["Fire"],
+		baseStats: {hp: 65, atk: 100, def: 70, spa: 80, spd: 80, spe: 105},
+		abilities: {0: "Run Away", 1: "Flash Fire"},
+	},
+	slowpoke: {
+		num: 79,
+		name: "Slowpoke",
+		types: ["Water", "Psychic"],
+		baseStats: {hp: 90, atk: 65, def: 65, spa: 40, spd: 40, spe: 15},
+		abilities: {0: "Oblivious", 1: "Own Tempo"},
+	},
+	slowbro: {
+		num: 80,
+		name: "Slowbro",
+		types: ["Water", "Psychic"],
+		baseStats: {hp: 95, atk: 75, def: 110, spa: 100, spd: 80, spe: 30},
+		abilities: {0: "Oblivious", 1: "Own Tempo"},
+	},
+	magnemite: {
+		num: 81,
+		name: "Magnemite",
+		types: ["Electric", "Steel"],
+		baseStats: {hp: 25, atk: 35, def: 70, spa: 95, spd: 55, spe: 45},
+		abilities: {0: "Magnet Pull", 1: "Sturdy"},
+	},
+	magneton: {
+		num: 82,
+		name: "Magneton",
+		types: ["Electric", "Steel"],
+		baseStats: {hp: 50, atk: 60, def: 95, spa: 120, spd: 70, spe: 70},
+		abilities: {0: "Magnet Pull", 1: "Sturdy"},
+	},
+	farfetchd: {
+		num: 83,
+		name: "Farfetch’d",
+		types: ["Normal", "Flying"],
+		baseStats: {hp: 52, atk: 65, def: 55, spa: 58, spd: 62, spe: 60},
+		abilities: {0: "Keen Eye", 1: "Inner Focus"},
+	},
+	doduo: {
+		num: 84,
+		name: "Doduo",
+		types: ["Normal", "Flying"],
+		baseStats: {hp: 35, atk: 85, def: 45, spa: 35, spd: 35, spe: 75},
+		abilities: {0: "Run Away", 1: "Early Bird"},
+	},
+	dodrio: {
+		num: 85,
+		name: "Dodrio",
+		types: ["Normal", "Flying"],
+		baseStats: {hp: 60, atk: 110, def: 70, spa: 60, spd: 60, spe: 100},
+		abilities: {0: "Run Away", 1: "Early Bird"},
+	},
+	seel: {
+		num: 86,
+		name: "Seel",
+		types: ["Water"],
+		baseStats: {hp: 65, atk: 45, def: 55, spa: 45, spd: 70, spe: 45},
+		abilities: {0: "Thick Fat"},
+	},
+	dewgong: {
+		num: 87,
+		name: "Dewgong",
+		types: ["Water", "Ice"],
+		baseStats: {hp: 90, atk: 70, def: 80, spa: 70, spd: 95, spe: 70},
+		abilities: {0: "Thick Fat"},
+	},
+	grimer: {
+		num: 88,
+		name: "Grimer",
+		types: ["Poison"],
+		baseStats: {hp: 80, atk: 80, def: 50, spa: 40, spd: 50, spe: 25},
+		abilities: {0: "Stench", 1: "Sticky Hold"},
+	},
+	muk: {
+		num: 89,
+		name: "Muk",
+		types: ["Poison"],
+		baseStats: {hp: 105, atk: 105, def: 75, spa: 65, spd: 100, spe: 50},
+		abilities: {0: "Stench", 1: "Sticky Hold"},
+	},
+	shellder: {
+		num: 90,
+		name: "Shellder",
+		types: ["Water"],
+		baseStats: {hp: 30, atk: 65, def: 100, spa: 45, spd: 25, spe: 40},
+		abilities: {0: "Shell Armor"},
+	},
+	cloyster: {
+		num: 91,
+		name: "Cloyster",
+		types: ["Water", "Ice"],
+		baseStats: {hp: 50, atk: 95, def: 180, spa: 85, spd: 45, spe: 70},
+		abilities: {0: "Shell Armor"},
+	},
+	gastly: {
+		num: 92,
+		name: "Gastly",
+		types: ["Ghost", "Poison"],
+		baseStats: {hp: 30, atk: 35, def: 30, spa: 100, spd: 35, spe: 80},
+		abilities: {0: "Levitate"},
+	},
+	haunter: {
+		num: 93,
+		name: "Haunter",
+		types: ["Ghost", "Poison"],
+		baseStats: {hp: 45, atk: 50, def: 45, spa: 115, spd: 55, spe: 95},
+		abilities: {0: "Levitate"},
+	},
+	gengar: {
+		num: 94,
+		name: "Gengar",
+		types: ["Ghost", "Poison"],
+		baseStats: {hp: 60, atk: 65, def: 60, spa: 130, spd: 75, spe: 110},
+		abilities: {0: "Levitate"},
+	},
+	onix: {
+		num: 95,
+		name: "Onix",
+		types: ["Rock", "Ground"],
+		baseStats: {hp: 35, atk: 45, def: 160, spa: 30, spd: 45, spe: 70},
+		abilities: {0: "Rock Head", 1: "Sturdy"},
+	},
+	drowzee: {
+		num: 96,
+		name: "Drowzee",
+		types: ["Psychic"],
+		baseStats: {hp: 60, atk: 48, def: 45, spa: 43, spd: 90, spe: 42},
+		abilities: {0: "Insomnia"},
+	},
+	hypno: {
+		num: 97,
+		name: "Hypno",
+		types: ["Psychic"],
+		baseStats: {hp: 85, atk: 73, def: 70, spa: 73, spd: 115, spe: 67},
+		abilities: {0: "Insomnia"},
+	},
+	krabby: {
+		num: 98,
+		name: "Krabby",
+		types: ["Water"],
+		baseStats: {hp: 30, atk: 105, def: 90, spa: 25, spd: 25, spe: 50},
+		abilities: {0: "Hyper Cutter", 1: "Shell Armor"},
+	},
+	kingler: {
+		num: 99,
+		name: "Kingler",
+		types: ["Water"],
+		baseStats: {hp: 55, atk: 130, def: 115, spa: 50, spd: 50, spe: 75},
+		abilities: {0: "Hyper Cutter", 1: "Shell Armor"},
+	},
+	voltorb: {
+		num: 100,
+		name: "Voltorb",
+		types: ["Electric"],
+		baseStats: {hp: 40, atk: 30, def: 50, spa: 55, spd: 55, spe: 100},
+		abilities: {0: "Soundproof", 1: "Static"},
+	},
+	electrode: {
+		num: 101,
+		name: "Electrode",
+		types: ["Electric"],
+		baseStats: {hp: 60, atk: 50, def: 70, spa: 80, spd: 80, spe: 140},
+		abilities: {0: "Soundproof", 1: "Static"},
+	},
+	exeggcute: {
+		num: 102,
+		name: "Exeggcute",
+		types: ["Grass", "Psychic"],
+		baseStats: {hp: 60, atk: 40, def: 80, spa: 60, spd: 45, spe: 40},
+		abilities: {0: "Chlorophyll"},
+	},
+	exeggutor: {
+		num: 103,
+		name: "Exeggutor",
+		types: ["Grass", "Psychic"],
+		baseStats: {hp: 95, atk: 95, def: 85, spa: 125, spd: 65, spe: 55},
+		abilities: {0: "Chlorophyll"},
+	},
+	cubone: {
+		num: 104,
+		name: "Cubone",
+		types: ["Ground"],
+		baseStats: {hp: 50, atk: 50, def: 95, spa: 40, spd: 50, spe: 35},
+		abilities: {0: "Rock Head", 1: "Lightning Rod"},
+	},
+	marowak: {
+		num: 105,
+		name: "Marowak",
+		types: ["Ground"],
+		baseStats: {hp: 60, atk: 80, def: 110, spa: 50, spd: 80, spe: 45},
+		abilities: {0: "Rock Head", 1: "Lightning Rod"},
+	},
+	hitmonlee: {
+		num: 106,
+		name: "Hitmonlee",
+		types: ["Fighting"],
+		baseStats: {hp: 50, atk: 120, def: 53, spa: 35, spd: 110, spe: 87},
+		abilities: {0: "Limber"},
+	},
+	hitmonchan: {
+		num: 107,
+		name: "Hitmonchan",
+		types: ["Fighting"],
+		baseStats: {hp: 50, atk: 105, def: 79, spa: 35, spd: 110, spe: 76},
+		abilities: {0: "Keen Eye"},
+	},
+	lickitung: {
+		num: 108,
+		name: "Lickitung",
+		types: ["Normal"],
+		baseStats: {hp: 90, atk: 55, def: 75, spa: 60, spd: 75, spe: 30},
+		abilities: {0: "Own Tempo", 1: "Oblivious"},
+	},
+	koffing: {
+		num: 109,
+		name: "Koffing",
+		types: ["Poison"],
+		baseStats: {hp: 40, atk: 65, def: 95, spa: 60, spd: 45, spe: 35},
+		abilities: {0: "Levitate"},
+	},
+	weezing: {
+		num: 110,
+		name: "Weezing",
+		types: ["Poison"],
+		baseStats: {hp: 65, atk: 90, def: 120, spa: 85, spd: 70, spe: 60},
+		abilities: {0: "Levitate"},
+	},
+	rhyhorn: {
+		num: 111,
+		name: "Rhyhorn",
+		types: ["Ground", "Rock"],
+		baseStats: {hp: 80, atk: 85, def: 95, spa: 30, spd: 30, spe: 25},
+		abilities: {0: "Lightning Rod", 1: "Rock Head"},
+	},
+	rhydon: {
+		num: 112,
+		name: "Rhydon",
+		types: ["Ground", "Rock"],
+		baseStats: {hp: 105, atk: 130, def: 120, spa: 45, spd: 45, spe: 40},
+		abilities: {0: "Lightning Rod", 1: "Rock Head"},
+	},
+	chansey: {
+		num: 113,
+		name: "Chansey",
+		types: ["Normal"],
+		baseStats: {hp: 250, atk: 5, def: 5, spa: 35, spd: 105, spe: 50},
+		abilities: {0: "Natural Cure", 1: "Serene Grace"},
+	},
+	tangela: {
+		num: 114,
+		name: "Tangela",
+		types: ["Grass"],
+		baseStats: {hp: 65, atk: 55, def: 115, spa: 100, spd: 40, spe: 60},
+		abilities: {0: "Chlorophyll"},
+	},
+	kangaskhan: {
+		num: 115,
+		name: "Kangaskhan",
+		types: ["Normal"],
+		baseStats: {hp: 105, atk: 95, def: 80, spa: 40, spd: 80, spe: 90},
+		abilities: {0: "Early Bird"},
+	},
+	horsea: {
+		num: 116,
+		name: "Horsea",
+		types: ["Water"],
+		baseStats: {hp: 30, atk: 40, def: 70, spa: 70, spd: 25, spe: 60},
+		abilities: {0: "Swift Swim"},
+	},
+	seadra: {
+		num: 117,
+		name: "Seadra",
+		types: ["Water"],
+		baseStats: {hp: 55, atk: 65, def: 95, spa: 95, spd: 45, spe: 85},
+		abilities: {0: "Poison Point"},
+	},
+	goldeen: {
+		num: 118,
+		name: "Goldeen",
+		types: ["Water"],
+		baseStats: {hp: 45, atk: 67, def: 60, spa: 35, spd: 50, spe: 63},
+		abilities: {0: "Swift Swim", 1: "Water Veil"},
+	},
+	seaking: {
+		num: 119,
+		name: "Seaking",
+		types: ["Water"],
+		baseStats: {hp: 80, atk: 92, def: 65, spa: 65, spd: 80, spe: 68},
+		abilities: {0: "Swift Swim", 1: "Water Veil"},
+	},
+	staryu: {
+		num: 120,
+		name: "Staryu",
+		types: ["Water"],
+		baseStats: {hp: 30, atk: 45, def: 55, spa: 70, spd: 55, spe: 85},
+		abilities: {0: "Illuminate", 1: "Natural Cure"},
+	},
+	starmie: {
+		num: 121,
+		name: "Starmie",
+		types: ["Water", "Psychic"],
+		baseStats: {hp: 60, atk: 75, def: 85, spa: 100, spd: 85, spe: 115},
+		abilities: {0: "Illuminate", 1: "Natural Cure"},
+	},
+	mrmime: {
+		num: 122,
+		name: "Mr. Mime",
+		types: ["Psychic"],
+		baseStats: {hp: 40, atk: 45, def: 65, spa: 100, spd: 120, spe: 90},
+		abilities: {0: "Soundproof"},
+	},
+	scyther: {
+		num: 123,
+		name: "Scyther",
+		types: ["Bug", "Flying"],
+		baseStats: {hp: 70, atk: 110, def: 80, spa: 55, spd: 80, spe: 105},
+		abilities: {0: "Swarm"},
+	},
+	jynx: {
+		num: 124,
+		name: "Jynx",
+		types: ["Ice", "Psychic"],
+		baseStats: {hp: 65, atk: 50, def: 35, spa: 115, spd: 95, spe: 95},
+		abilities: {0: "Oblivious"},
+	},
+	electabuzz: {
+		num: 125,
+		name: "Electabuzz",
+		types: ["Electric"],
+		baseStats: {hp: 65, atk: 83, def: 57, spa: 95, spd: 85, spe: 105},
+		abilities: {0: "Static"},
+	},
+	magmar: {
+		num: 126,
+		name: "Magmar",
+		types: ["Fire"],
+		baseStats: {hp: 65, atk: 95, def: 57, spa: 100, spd: 85, spe: 93},
+		abilities: {0: "Flame Body"},
+	},
+	pinsir: {
+		num: 127,
+		name: "Pinsir",
+		types: ["Bug"],
+		baseStats: {hp: 65, atk: 125, def: 100, spa: 55, spd: 70, spe: 85},
+		abilities: {0: "Hyper Cutter"},
+	},
+	tauros: {
+		num: 128,
+		name: "Tauros",
+		types: ["Normal"],
+		baseStats: {hp: 75, atk: 100, def: 95, spa: 40, spd: 70, spe: 110},
+		abilities: {0: "Intimidate"},
+	},
+	magikarp: {
+		num: 129,
+		name: "Magikarp",
+		types: ["Water"],
+		baseStats: {hp: 20, atk: 10, def: 55, spa: 15, spd: 20, spe: 80},
+		abilities: {0: "Swift Swim"},
+	},
+	gyarados: {
+		num: 130,
+		name: "Gyarados",
+		types: ["Water", "Flying"],
+		baseStats: {hp: 95, atk: 125, def: 79, spa: 60, spd: 100, spe: 81},
+		abilities: {0: "Intimidate"},
+	},
+	lapras: {
+		num: 131,
+		name: "Lapras",
+		types: ["Water", "Ice"],
+		baseStats: {hp: 130, atk: 85, def: 80, spa: 85, spd: 95, spe: 60},
+		abilities: {0: "Water Absorb", 1: "Shell Armor"},
+	},
+	ditto: {
+		num: 132,
+		name: "Ditto",
+		types: ["Normal"],
+		baseStats: {hp: 48, atk: 48, def: 48, spa: 48, spd: 48, spe: 48},
+		abilities: {0: "Limber"},
+	},
+	eevee: {
+		num: 133,
+		name: "Eevee",
+		types: ["Normal"],
+		baseStats: {hp: 55, atk: 55, def: 50, spa: 45, spd: 65, spe: 55},
+		abilities: {0: "Run Away"},
+	},
+	vaporeon: {
+		num: 134,
+		name: "Vaporeon",
+		types: ["Water"],
+		baseStats: {hp: 130, atk: 65, def: 60, spa: 110, spd: 95, spe: 65},
+		abilities: {0: "Water Absorb"},
+	},
+	jolteon: {
+		num: 135,
+		name: "Jolteon",
+		types: ["Electric"],
+		baseStats: {hp: 65, atk: 65, def: 60, spa: 110, spd: 95, spe: 130},
+		abilities: {0: "Volt Absorb"},
+	},
+	flareon: {
+		num: 136,
+		name: "Flareon",
+		types: ["Fire"],
+		baseStats: {hp: 65, atk: 130, def: 60, spa: 95, spd: 110, spe: 65},
+		abilities: {0: "Flash Fire"},
+	},
+	porygon: {
+		num: 137,
+		name: "Porygon",
+		types: ["Normal"],
+		baseStats: {hp: 65, atk: 60, def: 70, spa: 85, spd: 75, spe: 40},
+		abilities: {0: "Trace"},
+	},
+	omanyte: {
+		num: 138,
+		name: "Omanyte",
+		types: ["Rock", "Water"],
+		baseStats: {hp: 35, atk: 40, def: 100, spa: 90, spd: 55, spe: 35},
+		abilities: {0: "Swift Swim", 1: "Shell Armor"},
+	},
+	omastar: {
+		num: 139,
+		name: "Omastar",
+		types: ["Rock", "Water"],
+		baseStats: {hp: 70, atk: 60, def: 125, spa: 115, spd: 70, spe: 55},
+		abilities: {0: "Swift Swim", 1: "Shell Armor"},
+	},
+	kabuto: {
+		num: 140,
+		name: "Kabuto",
+		types: ["Rock", "Water"],
+		baseStats: {hp: 30, atk: 80, def: 90, spa: 55, spd: 45, spe: 55},
+		abilities: {0: "Swift Swim", 1: "Battle Armor"},
+	},
+	kabutops: {
+		num: 141,
+		name: "Kabutops",
+		types: ["Rock", "Water"],
+		baseStats: {hp: 60, atk: 115, def: 105, spa: 65, spd: 70, spe: 80},
+		abilities: {0: "Swift Swim", 1: "Battle Armor"},
+	},
+	aerodactyl: {
+		num: 142,
+		name: "Aerodactyl",
+		types: ["Rock", "Flying"],
+		baseStats: {hp: 80, atk: 105, def: 65, spa: 60, spd: 75, spe: 130},
+		abilities: {0: "Rock Head", 1: "Pressure"},
+	},
+	snorlax: {
+		num: 143,
+		name: "Snorlax",
+		types: ["Normal"],
+		baseStats: {hp: 160, atk: 110, def: 65, spa: 65, spd: 110, spe: 30},
+		abilities: {0: "Immunity", 1: "Thick Fat"},
+	},
+	articuno: {
+		num: 144,
+		name: "Articuno",
+		types: ["Ice", "Flying"],
+		baseStats: {hp: 90, atk: 85, def: 100, spa: 95, spd: 125, spe: 85},
+		abilities: {0: "Pressure"},
+	},
+	zapdos: {
+		num: 145,
+		name: "Zapdos",
+		types: ["Electric", "Flying"],
+		baseStats: {hp: 90, atk: 90, def: 85, spa: 125, spd: 90, spe: 100},
+		abilities: {0: "Pressure"},
+	},
+	moltres: {
+		num: 146,
+		name: "Moltres",
+		types: ["Fire", "Flying"],
+		baseStats: {hp: 90, atk: 100, def: 90, spa: 125, spd: 85, spe: 90},
+		abilities: {0: "Pressure"},
+	},
+	dratini: {
+		num: 147,
+		name: "Dratini",
+		types: ["Dragon"],
+		baseStats: {hp: 41, atk: 64, def: 45, spa: 50, spd: 50, spe: 50},
+		abilities: {0: "Shed Skin"},
+	},
+	dragonair: {
+		num: 148,
+		name: "Dragonair",
+		types: ["Dragon"],
+		baseStats: {hp: 61, atk: 84, def: 65, spa: 70, spd: 70, spe: 70},
+		abilities: {0: "Shed Skin"},
+	},
+	dragonite: {
+		num: 149,
+		name: "Dragonite",
+		types: ["Dragon", "Flying"],
+		baseStats: {hp: 91, atk: 134, def: 95, spa: 100, spd: 100, spe: 80},
+		abilities: {0: "Inner Focus"},
+	},
+	mewtwo: {
+		num: 150,
+		name: "Mewtwo",
+		types: ["Psychic"],
+		baseStats: {hp: 106, atk: 110, def: 90, spa: 154, spd: 90, spe: 130},
+		abilities: {0: "Pressure"},
+	},
+	mew: {
+		num: 151,
+		name: "Mew",
+		types: ["Psychic"],
+		baseStats: {hp: 100, atk: 100, def: 100, spa: 100, spd: 100, spe: 100},
+		abilities: {0: "Synchronize"},
+	},
+	chikorita: {
+		num: 152,
+		name: "Chikorita",
+		types: ["Grass"],
+		baseStats: {hp: 45, atk: 49, def: 65, spa: 49, spd: 65, spe: 45},
+		abilities: {0: "Overgrow"},
+	},
+	bayleef: {
+		num: 153,
+		name: "Bayleef",
+		types: ["Grass"],
+		baseStats: {hp: 60, atk: 62, def: 80, spa: 63, spd: 80, spe: 60},
+		abilities: {0: "Overgrow"},
+	},
+	meganium: {
+		num: 154,
+		name: "Meganium",
+		types: ["Grass"],
+		baseStats: {hp: 80, atk: 82, def: 100, spa: 83, spd: 100, spe: 80},
+		abilities: {0: "Overgrow"},
+	},
+	cyndaquil: {
+		num: 155,
+		name: "Cyndaquil",
+		types: ["Fire"],
+		baseStats: {hp: 39, atk: 52, def: 43, spa: 60, spd: 50, spe: 65},
+		abilities: {0: "Blaze"},
+	},
+	quilava: {
+		num: 156,
+		name: "Quilava",
+		types: ["Fire"],
+		baseStats: {hp: 58, atk: 64, def: 58, spa: 80, spd: 65, spe: 80},
+		abilities: {0: "Blaze"},
+	},
+	typhlosion: {
+		num: 157,
+		name: "Typhlosion",
+		types: ["Fire"],
+		baseStats: {hp: 78, atk: 84, def: 78, spa: 109, spd: 85, spe: 100},
+		abilities: {0: "Blaze"},
+	},
+	totodile: {
+		num: 158,
+		name: "Totodile",
+		types: ["Water"],
+		baseStats: {hp: 50, atk: 65, def: 64, spa: 44, spd: 48, spe: 43},
+		abilities: {0: "Torrent"},
+	},
+	croconaw: {
+		num: 159,
+		name: "Croconaw",
+		types: ["Water"],
+		baseStats: {hp: 65, atk: 80, def: 80, spa: 59, spd: 63, spe: 58},
+		abilities: {0: "Torrent"},
+	},
+	feraligatr: {
+		num: 160,
+		name: "Feraligatr",
+		types: ["Water"],
+		baseStats: {hp: 85, atk: 105, def: 100, spa: 79, spd: 83, spe: 78},
+		abilities: {0: "Torrent"},
+	},
+	sentret: {
+		num: 161,
+		name: "Sentret",
+		types: ["Normal"],
+		baseStats: {hp: 35, atk: 46, def: 34, spa: 35, spd: 45, spe: 20},
+		abilities: {0: "Run Away", 1: "Keen Eye"},
+	},
+	furret: {
+		num: 162,
+		name: "Furret",
+		types: ["Normal"],
+		baseStats: {hp: 85, atk: 76, def: 64, spa: 45, spd: 55, spe: 90},
+		abilities: {0: "Run Away", 1: "Keen Eye"},
+	},
+	hoothoot: {
+		num: 163,
+		name: "Hoothoot",
+		types: ["Normal", "Flying"],
+		baseStats: {hp: 60, atk: 30, def: 30, spa: 36, spd: 56, spe: 50},
+		abilities: {0: "Insomnia", 1: "Keen Eye"},
+	},
+	noctowl: {
+		num: 164,
+		name: "Noctowl",
+		types: ["Normal", "Flying"],
+		baseStats: {hp: 100, atk: 50, def: 50, spa: 76, spd: 96, spe: 70},
+		abilities: {0: "Insomnia", 1: "Keen Eye"},
+	},
+	ledyba: {
+		num: 165,
+		name: "Ledyba",
+		types: ["Bug", "Flying"],
+		baseStats: {hp: 40, atk: 20, def: 30, spa: 40, spd: 80, spe: 55},
+		abilities: {0: "Swarm", 1: "Early Bird"},
+	},
+	ledian: {
+		num: 166,
+		name: "Ledian",
+		types: ["Bug", "Flying"],
+		baseStats: {hp: 55, atk: 35, def: 50, spa: 55, spd: 110, spe: 85},
+		abilities: {0: "Swarm", 1: "Early Bird"},
+	},
+	spinarak: {
+		num: 167,
+		name: "Spinarak",
+		types: ["Bug", "Poison"],
+		baseStats: {hp: 40, atk: 60, def: 40, spa: 40, spd: 40, spe: 30},
+		abilities: {0: "Swarm", 1: "Insomnia"},
+	},
+	ariados: {
+		num: 168,
+		name: "Ariados",
+		types: ["Bug", "Poison"],
+		baseStats: {hp: 70, atk: 90, def: 70, spa: 60, spd: 60, spe: 40},
+		abilities: {0: "Swarm", 1: "Insomnia"},
+	},
+	crobat: {
+		num: 169,
+		name: "Crobat",
+		types: ["Poison", "Flying"],
+		baseStats: {hp: 85, atk: 90, def: 80, spa: 70, spd: 80, spe: 130},
+		abilities: {0: "Inner Focus"},
+	},
+	chinchou: {
+		num: 170,
+		name: "Chinchou",
+		types: ["Water", "Electric"],
+		baseStats: {hp: 75, atk: 38, def: 38, spa: 56, spd: 56, spe: 67},
+		abilities: {0: "Volt Absorb", 1: "Illuminate"},
+	},
+	lanturn: {
+		num: 171,
+		name: "Lanturn",
+		types: ["Water", "Electric"],
+		baseStats: {hp: 125, atk: 58, def: 58, spa: 76, spd: 76, spe: 67},
+		abilities: {0: "Volt Absorb", 1: "Illuminate"},
+	},
+	pichu: {
+		num: 172,
+		name: "Pichu",
+		types: ["Electric"],
+		baseStats: {hp: 20, atk: 40, def: 15, spa: 35, spd: 35, spe: 60},
+		abilities: {0: "Static"},
+	},
+	cleffa: {
+		num: 173,
+		name: "Cleffa",
+		types: ["Normal"],
+		baseStats: {hp: 50, atk: 25, def: 28, spa: 45, spd: 55, spe: 15},
+		abilities: {0: "Cute Charm"},
+	},
+	igglybuff: {
+		num: 174,
+		name: "Igglybuff",
+		types: ["Normal"],
+		baseStats: {hp: 90, atk: 30, def: 15, spa: 40, spd: 20, spe: 15},
+		abilities: {0: "Cute Charm"},
+	},
+	togepi: {
+		num: 175,
+		name: "Togepi",
+		types: ["Normal"],
+		baseStats: {hp: 35, atk: 20, def: 65, spa: 40, spd: 65, spe: 20},
+		abilities: {0: "Hustle", 1: "Serene Grace"},
+	},
+	togetic: {
+		num: 176,
+		name: "Togetic",
+		types: ["Normal", "Flying"],
+		baseStats: {hp: 55, atk: 40, def: 85, spa: 80, spd: 105, spe: 40},
+		abilities: {0: "Hustle", 1: "Serene Grace"},
+	},
+	natu: {
+		num: 177,
+		name: "Natu",
+		types: ["Psychic", "Flying"],
+		baseStats: {hp: 40, atk: 50, def: 45, spa: 70, spd: 45, spe: 70},
+		abilities: {0: "Synchronize", 1: "Early Bird"},
+	},
+	xatu: {
+		num: 178,
+		name: "Xatu",
+		types: ["Psychic", "Flying"],
+		baseStats: {hp: 65, atk: 75, def: 70, spa: 95, spd: 70, spe: 95},
+		abilities: {0: "Synchronize", 1: "Early Bird"},
+	},
+	mareep: {
+		num: 179,
+		name: "Mareep",
+		types: ["Electric"],
+		baseStats: {hp: 55, atk: 40, def: 40, spa: 65, spd: 45, spe: 35},
+		abilities: {0: "Static"},
+	},
+	flaaffy: {
+		num: 180,
+		name: "Flaaffy",
+		types: ["Electric"],
+		baseStats: {hp: 70, atk: 55, def: 55, spa: 80, spd: 60, spe: 45},
+		abilities: {0: "Static"},
+	},
+	ampharos: {
+		num: 181,
+		name: "Ampharos",
+		types: ["Electric"],
+		baseStats: {hp: 90, atk: 75, def: 75, spa: 115, spd: 90, spe: 55},
+		abilities: {0: "Static"},
+	},
+	bellossom: {
+		num: 182,
+		name: "Bellossom",
+		types: ["Grass"],
+		baseStats: {hp: 75, atk: 80, def: 85, spa: 90, spd: 100, spe: 50},
+		abilities: {0: "Chlorophyll"},
+	},
+	marill: {
+		num: 183,
+		name: "Marill",
+		types: ["Water"],
+		baseStats: {hp: 70, atk: 20, def: 50, spa: 20, spd: 50, spe: 40},
+		abilities: {0: "Thick Fat", 1: "Huge Power"},
+	},
+	azumarill: {
+		num: 184,
+		name: "Azumarill",
+		types: ["Water"],
+		baseStats: {hp: 100, atk: 50, def: 80, spa: 50, spd: 80, spe: 50},
+		abilities: {0: "Thick Fat", 1: "Huge Power"},
+	},
+	sudowoodo: {
+		num: 185,
+		name: "Sudowoodo",
+		types: ["Rock"],
+		baseStats: {hp: 70, atk: 100, def: 115, spa: 30, spd: 65, spe: 30},
+		abilities: {0: "Sturdy", 1: "Rock Head"},
+	},
+	politoed: {
+		num: 186,
+		name: "Politoed",
+		types: ["Water"],
+		baseStats: {hp: 90, atk: 75, def: 75, spa: 90, spd: 100, spe: 70},
+		abilities: {0: "Water Absorb", 1: "Damp"},
+	},
+	hoppip: {
+		num: 187,
+		name: "Hoppip",
+		types: ["Grass", "Flying"],
+		baseStats: {hp: 35, atk: 35, def: 40, spa: 35, spd: 55, spe: 50},
+		abilities: {0: "Chlorophyll"},
+	},
+	skiploom: {
+		num: 188,
+		name: "Skiploom",
+		types: ["Grass", "Flying"],
+		baseStats: {hp: 55, atk: 45, def: 50, spa: 45, spd: 65, spe: 80},
+		abilities: {0: "Chlorophyll"},
+	},
+	jumpluff: {
+		num: 189,
+		name: "Jumpluff",
+		types: ["Grass", "Flying"],
+		baseStats: {hp: 75, atk: 55, def: 70, spa: 55, spd: 85, spe: 110},
+		abilities: {0: "Chlorophyll"},
+	},
+	aipom: {
+		num: 190,
+		name: "Aipom",
+		types: ["Normal"],
+		baseStats: {hp: 55, atk: 70, def: 55, spa: 40, spd: 55, spe: 85},
+		abilities: {0: "Run Away", 1: "Pickup"},
+	},
+	sunkern: {
+		num: 191,
+		name: "Sunkern",
+		types: ["Grass"],
+		baseStats: {hp: 30, atk: 30, def: 30, spa: 30, spd: 30, spe: 30},
+		abilities: {0: "Chlorophyll"},
+	},
+	sunflora: {
+		num: 192,
+		name: "Sunflora",
+		types: ["Grass"],
+		baseStats: {hp: 75, atk: 75, def: 55, spa: 105, spd: 85, spe: 30},
+		abilities: {0: "Chlorophyll"},
+	},
+	yanma: {
+		num: 193,
+		name: "Yanma",
+		types: ["Bug", "Flying"],
+		baseStats: {hp: 65, atk: 65, def: 45, spa: 75, spd: 45, spe: 95},
+		abilities: {0: "Speed Boost", 1: "Compound Eyes"},
+	},
+	wooper: {
+		num: 194,
+		name: "Wooper",
+		types: ["Water", "Ground"],
+		baseStats: {hp: 55, atk: 45, def: 45, spa: 25, spd: 25, spe: 15},
+		abilities: {0: "Damp", 1: "Water Absorb"},
+	},
+	quagsire: {
+		num: 195,
+		name: "Quagsire",
+		types: ["Water", "Ground"],
+		baseStats: {hp: 95, atk: 85, def: 85, spa: 65, spd: 65, spe: 35},
+		abilities: {0: "Damp", 1: "Water Absorb"},
+	},
+	espeon: {
+		num: 196,
+		name: "Espeon",
+		types: ["Psychic"],
+		baseStats: {hp: 65, atk: 65, def: 60, spa: 130, spd: 95, spe: 110},
+		abilities: {0: "Synchronize"},
+	},
+	umbreon: {
+		num: 197,
+		name: "Umbreon",
+		types: ["Dark"],
+		baseStats: {hp: 95, atk: 65, def: 110, spa: 60, spd: 130, spe: 65},
+		abilities: {0: "Synchronize"},
+	},
+	murkrow: {
+		num: 198,
+		name: "Murkrow",
+		types: ["Dark", "Flying"],
+		baseStats: {hp: 60, atk: 85, def: 42, spa: 85, spd: 42, spe: 91},
+		abilities: {0: "Insomnia"},
+	},
+	slowking: {
+		num: 199,
+		name: "Slowking",
+		types: ["Water", "Psychic"],
+		baseStats: {hp: 95, atk: 75, def: 80, spa: 100, spd: 110, spe: 30},
+		abilities: {0: "Oblivious", 1: "Own Tempo"},
+	},
+	misdreavus: {
+		num: 200,
+		name: "Misdreavus",
+		types: ["Ghost"],
+		baseStats: {hp: 60, atk: 60, def: 60, spa: 85, spd: 85, spe: 85},
+		abilities: {0: "Levitate"},
+	},
+	unown: {
+		num: 201,
+		name: "Unown",
+		types: ["Psychic"],
+		baseStats: {hp: 48, atk: 72, def: 48, spa: 72, spd: 48, spe: 48},
+		abilities: {0: "Levitate"},
+	},
+	wobbuffet: {
+		num: 202,
+		name: "Wobbuffet",
+		types: ["Psychic"],
+		baseStats: {hp: 190, atk: 33, def: 58, spa: 33, spd: 58, spe: 33},
+		abilities: {0: "Shadow Tag"},
+	},
+	girafarig: {
+		num: 203,
+		name: "Girafarig",
+		types: ["Normal", "Psychic"],
+		baseStats: {hp: 70, atk: 80, def: 65, spa: 90, spd: 65, spe: 85},
+		abilities: {0: "Inner Focus", 1: "Early Bird"},
+	},
+	pineco: {
+		num: 204,
+		name: "Pineco",
+		types: ["Bug"],
+		baseStats: {hp: 50, atk: 65, def: 90, spa: 35, spd: 35, spe: 15},
+		abilities: {0: "Sturdy"},
+	},
+	forretress: {
+		num: 205,
+		name: "Forretress",
+		types: ["Bug", "Steel"],
+		baseStats: {hp: 75, atk: 90, def: 140, spa: 60, spd: 60, spe: 40},
+		abilities: {0: "Sturdy"},
+	},
+	dunsparce: {
+		num: 206,
+		name: "Dunsparce",
+		types: ["Normal"],
+		baseStats: {hp: 100, atk: 70, def: 70, spa: 65, spd: 65, spe: 45},
+		abilities: {0: "Serene Grace", 1: "Run Away"},
+	},
+	gligar: {
+		num: 207,
+		name: "Gligar",
+		types: ["Ground", "Flying"],
+		baseStats: {hp: 65, atk: 75, def: 105, spa: 35, spd: 65, spe: 85},
+		abilities: {0: "Hyper Cutter", 1: "Sand Veil"},
+	},
+	steelix: {
+		num: 208,
+		name: "Steelix",
+		types: ["Steel", "Ground"],
+		baseStats: {hp: 75, atk: 85, def: 200, spa: 55, spd: 65, spe: 30},
+		abilities: {0: "Rock Head", 1: "Sturdy"},
+	},
+	snubbull: {
+		num: 209,
+		name: "Snubbull",
+		types: ["Normal"],
+		baseStats: {hp: 60, atk: 80, def: 50, spa: 40, spd: 40, spe: 30},
+		abilities: {0: "Intimidate", 1: "Run Away"},
+	},
+	granbull: {
+		num: 210,
+		name: "Granbull",
+		types: ["Normal"],
+		baseStats: {hp: 90, atk: 120, def: 75, spa: 60, spd: 60, spe: 45},
+		abilities: {0: "Intimidate"},
+	},
+	qwilfish: {
+		num: 211,
+		name: "Qwilfish",
+		types: ["Water", "Poison"],
+		baseStats: {hp: 65, atk: 95, def: 75, spa: 55, spd: 55, spe: 85},
+		abilities: {0: "Poison Point", 1: "Swift Swim"},
+	},
+	scizor: {
+		num: 212,
+		name: "Scizor",
+		types: ["Bug", "Steel"],
+		baseStats: {hp: 70, atk: 130, def: 100, spa: 55, spd: 80, spe: 65},
+		abilities: {0: "Swarm"},
+	},
+	shuckle: {
+		num: 213,
+		name: "Shuckle",
+		types: ["Bug", "Rock"],
+		baseStats: {hp: 20, atk: 10, def: 230, spa: 10, spd: 230, spe: 5},
+		abilities: {0: "Sturdy"},
+	},
+	heracross: {
+		num: 214,
+		name: "Heracross",
+		types: ["Bug", "Fighting"],
+		baseStats: {hp: 80, atk: 125, def: 75, spa: 40, spd: 95, spe: 85},
+		abilities: {0: "Swarm", 1: "Guts"},
+	},
+	sneasel: {
+		num: 215,
+		name: "Sneasel",
+		types: ["Dark", "Ice"],
+		baseStats: {hp: 55, atk: 95, def: 55, spa: 35, spd: 75, spe: 115},
+		abilities: {0: "Inner Focus", 1: "Keen Eye"},
+	},
+	teddiursa: {
+		num: 216,
+		name: "Teddiursa",
+		types: ["Normal"],
+		baseStats: {hp: 60, atk: 80, def: 50, spa: 50, spd: 50, spe: 40},
+		abilities: {0: "Pickup"},
+	},
+	ursaring: {
+		num: 217,
+		name: "Ursaring",
+		types: ["Normal"],
+		baseStats: {hp: 90, atk: 130, def: 75, spa: 75, spd: 75, spe: 55},
+		abilities: {0: "Guts"},
+	},
+	slugma: {
+		num: 218,
+		name: "Slugma",
+		types: ["Fire"],
+		baseStats: {hp: 40, atk: 40, def: 40, spa: 70, spd: 40, spe: 20},
+		abilities: {0: "Magma Armor", 1: "Flame Body"},
+	},
+	magcargo: {
+		num: 219,
+		name: "Magcargo",
+		types: ["Fire", "Rock"],
+		baseStats: {hp: 50, atk: 50, def: 120, spa: 80, spd: 80, spe: 30},
+		abilities: {0: "Magma Armor", 1: "Flame Body"},
+	},
+	swinub: {
+		num: 220,
+		name: "Swinub",
+		types: ["Ice", "Ground"],
+		baseStats: {hp: 50, atk: 50, def: 40, spa: 30, spd: 30, spe: 50},
+		abilities: {0: "Oblivious"},
+	},
+	piloswine: {
+		num: 221,
+		name: "Piloswine",
+		types: ["Ice", "Ground"],
+		baseStats: {hp: 100, atk: 100, def: 80, spa: 60, spd: 60, spe: 50},
+		abilities: {0: "Oblivious"},
+	},
+	corsola: {
+		num: 222,
+		name: "Corsola",
+		types: ["Water", "Rock"],
+		baseStats: {hp: 55, atk: 55, def: 85, spa: 65, spd: 85, spe: 35},
+		abilities: {0: "Hustle", 1: "Natural Cure"},
+	},
+	remoraid: {
+		num: 223,
+		name: "Remoraid",
+		types: ["Water"],
+		baseStats: {hp: 35, atk: 65, def: 35, spa: 65, spd: 35, spe: 65},
+		abilities: {0: "Hustle"},
+	},
+	octillery: {
+		num: 224,
+		name: "Octillery",
+		types: ["Water"],
+		baseStats: {hp: 75, atk: 105, def: 75, spa: 105, spd: 75, spe: 45},
+		abilities: {0: "Suction Cups"},
+	},
+	delibird: {
+		num: 225,
+		name: "Delibird",
+		types: ["Ice", "Flying"],
+		baseStats: {hp: 45, atk: 55, def: 45, spa: 65, spd: 45, spe: 75},
+		abilities: {0: "Vital Spirit", 1: "Hustle"},
+	},
+	mantine: {
+		num: 226,
+		name: "Mantine",
+		types: ["Water", "Flying"],
+		baseStats: {hp: 65, atk: 40, def: 70, spa: 80, spd: 140, spe: 70},
+		abilities: {0: "Swift Swim", 1: "Water Absorb"},
+	},
+	skarmory: {
+		num: 227,
+		name: "Skarmory",
+		types: ["Steel", "Flying"],
+		baseStats: {hp: 65, atk: 80, def: 140, spa: 40, spd: 70, spe: 70},
+		abilities: {0: "Keen Eye", 1: "Sturdy"},
+	},
+	houndour: {
+		num: 228,
+		name: "Houndour",
+		types: ["Dark", "Fire"],
+		baseStats: {hp: 45, atk: 60, def: 30, spa: 80, spd: 50, spe: 65},
+		abilities: {0: "Early Bird", 1: "Flash Fire"},
+	},
+	houndoom: {
+		num: 229,
+		name: "Houndoom",
+		types: ["Dark", "Fire"],
+		baseStats: {hp: 75, atk: 90, def: 50, spa: 110, spd: 80, spe: 95},
+		abilities: {0: "Early Bird", 1: "Flash Fire"},
+	},
+	kingdra: {
+		num: 230,
+		name: "Kingdra",
+		types: ["Water", "Dragon"],
+		baseStats: {hp: 75, atk: 95, def: 95, spa: 95, spd: 95, spe: 85},
+		abilities: {0: "Swift Swim"},
+	},
+	phanpy: {
+		num: 231,
+		name: "Phanpy",
+		types: ["Ground"],
+		baseStats: {hp: 90, atk: 60, def: 60, spa: 40, spd: 40, spe: 40},
+		abilities: {0: "Pickup"},
+	},
+	donphan: {
+		num: 232,
+		name: "Donphan",
+		types: ["Ground"],
+		baseStats: {hp: 90, atk: 120, def: 120, spa: 60, spd: 60, spe: 50},
+		abilities: {0: "Sturdy"},
+	},
+	porygon2: {
+		num: 233,
+		name: "Porygon2",
+		types: ["Normal"],
+		baseStats: {hp: 85, atk: 80, def: 90, spa: 105, spd: 95, spe: 60},
+		abilities: {0: "Trace"},
+	},
+	stantler: {
+		num: 234,
+		name: "Stantler",
+		types: ["Normal"],
+		baseStats: {hp: 73, atk: 95, def: 62, spa: 85, spd: 65, spe: 85},
+		abilities: {0: "Intimidate"},
+	},
+	smeargle: {
+		num: 235,
+		name: "Smeargle",
+		types: ["Normal"],
+		baseStats: {hp: 55, atk: 20, def: 35, spa: 20, spd: 45, spe: 75},
+		abilities: {0: "Own Tempo"},
+	},
+	tyrogue: {
+		num: 236,
+		name: "Tyrogue",
+		types: ["Fighting"],
+		baseStats: {hp: 35, atk: 35, def: 35, spa: 35, spd: 35, spe: 35},
+		abilities: {0: "Guts"},
+	},
+	hitmontop: {
+		num: 237,
+		name: "Hitmontop",
+		types: ["Fighting"],
+		baseStats: {hp: 50, atk: 95, def: 95, spa: 35, spd: 110, spe: 70},
+		abilities: {0: "Intimidate"},
+	},
+	smoochum: {
+		num: 238,
+		name: "Smoochum",
+		types: ["Ice", "Psychic"],
+		baseStats: {hp: 45, atk: 30, def: 15, spa: 85, spd: 65, spe: 65},
+		abilities: {0: "Oblivious"},
+	},
+	elekid: {
+		num: 239,
+		name: "Elekid",
+		types: ["Electric"],
+		baseStats: {hp: 45, atk: 63, def: 37, spa: 65, spd: 55, spe: 95},
+		abilities: {0: "Static"},
+	},
+	magby: {
+		num: 240,
+		name: "Magby",
+		types: ["Fire"],
+		baseStats: {hp: 45, atk: 75, def: 37, spa: 70, spd: 55, spe: 83},
+		abilities: {0: "Flame Body"},
+	},
+	miltank: {
+		num: 241,
+		name: "Miltank",
+		types: ["Normal"],
+		baseStats: {hp: 95, atk: 80, def: 105, spa: 40, spd: 70, spe: 100},
+		abilities: {0: "Thick Fat"},
+	},
+	blissey: {
+		num: 242,
+		name: "Blissey",
+		types: ["Normal"],
+		baseStats: {hp: 255, atk: 10, def: 10, spa: 75, spd: 135, spe: 55},
+		abilities: {0: "Natural Cure", 1: "Serene Grace"},
+	},
+	raikou: {
+		num: 243,
+		name: "Raikou",
+		types: ["Electric"],
+		baseStats: {hp: 90, atk: 85, def: 75, spa: 115, spd: 100, spe: 115},
+		abilities: {0: "Pressure"},
+	},
+	entei: {
+		num: 244,
+		name: "Entei",
+		types: ["Fire"],
+		baseStats: {hp: 115, atk: 115, def: 85, spa: 90, spd: 75, spe: 100},
+		abilities: {0: "Pressure"},
+	},
+	suicune: {
+		num: 245,
+		name: "Suicune",
+		types: ["Water"],
+		baseStats: {hp: 100, atk: 75, def: 115, spa: 90, spd: 115, spe: 85},
+		abilities: {0: "Pressure"},
+	},
+	larvitar: {
+		num: 246,
+		name: "Larvitar",
+		types: ["Rock", "Ground"],
+		baseStats: {hp: 50, atk: 64, def: 50, spa: 45, spd: 50, spe: 41},
+		abilities: {0: "Guts"},
+	},
+	pupitar: {
+		num: 247,
+		name: "Pupitar",
+		types: ["Rock", "Ground"],
+		baseStats: {hp: 70, atk: 84, def: 70, spa: 65, spd: 70, spe: 51},
+		abilities: {0: "Shed Skin"},
+	},
+	tyranitar: {
+		num: 248,
+		name: "Tyranitar",
+		types: ["Rock", "Dark"],
+		baseStats: {hp: 100, atk: 134, def: 110, spa: 95, spd: 100, spe: 61},
+		abilities: {0: "Sand Stream"},
+	},
+	lugia: {
+		num: 249,
+		name: "Lugia",
+		types: ["Psychic", "Flying"],
+		baseStats: {hp: 106, atk: 90, def: 130, spa: 90, spd: 154, spe: 110},
+		abilities: {0: "Pressure"},
+	},
+	hooh: {
+		num: 250,
+		name: "Ho-Oh",
+		types: ["Fire", "Flying"],
+		baseStats: {hp: 106, atk: 130, def: 90, spa: 110, spd: 154, spe: 90},
+		abilities: {0: "Pressure"},
+	},
+	celebi: {
+		num: 251,
+		name: "Celebi",
+		types: ["Psychic", "Grass"],
+		baseStats: {hp: 100, atk: 100, def: 100, spa: 100, spd: 100, spe: 100},
+		abilities: {0: "Natural Cure"},
+	},
+	treecko: {
+		num: 252,
+		name: "Treecko",
+		types: ["Grass"],
+		baseStats: {hp: 40, atk: 45, def: 35, spa: 65, spd: 55, spe: 70},
+		abilities: {0: "Overgrow"},
+	},
+	grovyle: {
+		num: 253,
+		name: "Grovyle",
+		types: ["Grass"],
+		baseStats: {hp: 50, atk: 65, def: 45, spa: 85, spd: 65, spe: 95},
+		abilities: {0: "Overgrow"},
+	},
+	sceptile: {
+		num: 254,
+		name: "Sceptile",
+		types: ["Grass"],
+		baseStats: {hp: 70, atk: 85, def: 65, spa: 105, spd: 85, spe: 120},
+		abilities: {0: "Overgrow"},
+	},
+	torchic: {
+		num: 255,
+		name: "Torchic",
+		types: ["Fire"],
+		baseStats: {hp: 45, atk: 60, def: 40, spa: 70, spd: 50, spe: 45},
+		abilities: {0: "Blaze"},
+	},
+	combusken: {
+		num: 256,
+		name: "Combusken",
+		types: ["Fire", "Fighting"],
+		baseStats: {hp: 60, atk: 85, def: 60, spa: 85, spd: 60, spe: 55},
+		abilities: {0: "Blaze"},
+	},
+	blaziken: {
+		num: 257,
+		name: "Blaziken",
+		types: ["Fire", "Fighting"],
+		baseStats: {hp: 80, atk: 120, def: 70, spa: 110, spd: 70, spe: 80},
+		abilities: {0: "Blaze"},
+	},
+	mudkip: {
+		num: 258,
+		name: "Mudkip",
+		types: ["Water"],
+		baseStats: {hp: 50, atk: 70, def: 50, spa: 50, spd: 50, spe: 40},
+		abilities: {0: "Torrent"},
+	},
+	marshtomp: {
+		num: 259,
+		name: "Marshtomp",
+		types: ["Water", "Ground"],
+		baseStats: {hp: 70, atk: 85, def: 70, spa: 60, spd: 70, spe: 50},
+		abilities: {0: "Torrent"},
+	},
+	swampert: {
+		num: 260,
+		name: "Swampert",
+		types: ["Water", "Ground"],
+		baseStats: {hp: 100, atk: 110, def: 90, spa: 85, spd: 90, spe: 60},
+		abilities: {0: "Torrent"},
+	},
+	poochyena: {
+		num: 261,
+		name: "Poochyena",
+		types: ["Dark"],
+		baseStats: {hp: 35, atk: 55, def: 35, spa: 30, spd: 30, spe: 35},
+		abilities: {0: "Run Away"},
+	},
+	mightyena: {
+		num: 262,
+		name: "Mightyena",
+		types: ["Dark"],
+		baseStats: {hp: 70, atk: 90, def: 70, spa: 60, spd: 60, spe: 70},
+		abilities: {0: "Intimidate"},
+	},
+	zigzagoon: {
+		num: 263,
+		name: "Zigzagoon",
+		types: ["Normal"],
+		baseStats: {hp: 38, atk: 30, def: 41, spa: 30, spd: 41, spe: 60},
+		abilities: {0: "Pickup"},
+	},
+	linoone: {
+		num: 264,
+		name: "Linoone",
+		types: ["Normal"],
+		baseStats: {hp: 78, atk: 70, def: 61, spa: 50, spd: 61, spe: 100},
+		abilities: {0: "Pickup"},
+	},
+	wurmple: {
+		num: 265,
+		name: "Wurmple",
+		types: ["Bug"],
+		baseStats: {hp: 45, atk: 45, def: 35, spa: 20, spd: 30, spe: 20},
+		abilities: {0: "Shield Dust"},
+	},
+	silcoon: {
+		num: 266,
+		name: "Silcoon",
+		types: ["Bug"],
+		baseStats: {hp: 50, atk: 35, def: 55, spa: 25, spd: 25, spe: 15},
+		abilities: {0: "Shed Skin"},
+	},
+	beautifly: {
+		num: 267,
+		name: "Beautifly",
+		types: ["Bug", "Flying"],
+		baseStats: {hp: 60, atk: 70, def: 50, spa: 90, spd: 50, spe: 65},
+		abilities: {0: "Swarm"},
+	},
+	cascoon: {
+		num: 268,
+		name: "Cascoon",
+		types: ["Bug"],
+		baseStats: {hp: 50, atk: 35, def: 55, spa: 25, spd: 25, spe: 15},
+		abilities: {0: "Shed Skin"},
+	},
+	dustox: {
+		num: 269,
+		name: "Dustox",
+		types: ["Bug", "Poison"],
+		baseStats: {hp: 60, atk: 50, def: 70, spa: 50, spd: 90, spe: 65},
+		abilities: {0: "Shield Dust"},
+	},
+	lotad: {
+		num: 270,
+		name: "Lotad",
+		types: ["Water", "Grass"],
+		baseStats: {hp: 40, atk: 30, def: 30, spa: 40, spd: 50, spe: 30},
+		abilities: {0: "Swift Swim", 1: "Rain Dish"},
+	},
+	lombre: {
+		num: 271,
+		name: "Lombre",
+		types: ["Water", "Grass"],
+		baseStats: {hp: 60, atk: 50, def: 50, spa: 60, spd: 70, spe: 50},
+		abilities: {0: "Swift Swim", 1: "Rain Dish"},
+	},
+	ludicolo: {
+		num: 272,
+		name: "Ludicolo",
+		types: ["Water", "Grass"],
+		baseStats: {hp: 80, atk: 70, def: 70, spa: 90, spd: 100, spe: 70},
+		abilities: {0: "Swift Swim", 1: "Rain Dish"},
+	},
+	seedot: {
+		num: 273,
+		name: "Seedot",
+		types: ["Grass"],
+		baseStats: {hp: 40, atk: 40, def: 50, spa: 30, spd: 30, spe: 30},
+		abilities: {0: "Chlorophyll", 1: "Early Bird"},
+	},
+	nuzleaf: {
+		num: 274,
+		name: "Nuzleaf",
+		types: ["Grass", "Dark"],
+		baseStats: {hp: 70, atk: 70, def: 40, spa: 60, spd: 40, spe: 60},
+		abilities: {0: "Chlorophyll", 1: "Early Bird"},
+	},
+	shiftry: {
+		num: 275,
+		name: "Shiftry",
+		types: ["Grass", "Dark"],
+		baseStats: {hp: 90, atk: 100, def: 60, spa: 90, spd: 60, spe: 80},
+		abilities: {0: "Chlorophyll", 1: "Early Bird"},
+	},
+	taillow: {
+		num: 276,
+		name: "Taillow",
+		types: ["Normal", "Flying"],
+		baseStats: {hp: 40, atk: 55, def: 30, spa: 30, spd: 30, spe: 85},
+		abilities: {0: "Guts"},
+	},
+	swellow: {
+		num: 277,
+		name: "Swellow",
+		types: ["Normal", "Flying"],
+		baseStats: {hp: 60, atk: 85, def: 60, spa: 50, spd: 50, spe: 125},
+		abilities: {0: "Guts"},
+	},
+	wingull: {
+		num: 278,
+		name: "Wingull",
+		types: ["Water", "Flying"],
+		baseStats: {hp: 40, atk: 30, def: 30, spa: 55, spd: 30, spe: 85},
+		abilities: {0: "Keen Eye"},
+	},
+	pelipper: {
+		num: 279,
+		name: "Pelipper",
+		types: ["Water", "Flying"],
+		baseStats: {hp: 60, atk: 50, def: 100, spa: 85, spd: 70, spe: 65},
+		abilities: {0: "Keen Eye"},
+	},
+	ralts: {
+		num: 280,
+		name: "Ralts",
+		types: ["Psychic"],
+		baseStats: {hp: 28, atk: 25, def: 25, spa: 45, spd: 35, spe: 40},
+		abilities: {0: "Synchronize", 1: "Trace"},
+	},
+	kirlia: {
+		num: 281,
+		name: "Kirlia",
+		types: ["Psychic"],
+		baseStats: {hp: 38, atk: 35, def: 35, spa: 65, spd: 55, spe: 50},
+		abilities: {0: "Synchronize", 1: "Trace"},
+	},
+	gardevoir: {
+		num: 282,
+		name: "Gardevoir",
+		types: ["Psychic"],
+		baseStats: {hp: 68, atk: 65, def: 65, spa: 125, spd: 115, spe: 80},
+		abilities: {0: "Synchronize", 1: "Trace"},
+	},
+	surskit: {
+		num: 283,
+		name: "Surskit",
+		types: ["Bug", "Water"],
+		baseStats: {hp: 40, atk: 30, def: 32, spa: 50, spd: 52, spe: 65},
+		abilities: {0: "Swift Swim"},
+	},
+	masquerain: {
+		num: 284,
+		name: "Masquerain",
+		types: ["Bug", "Flying"],
+		baseStats: {hp: 70, atk: 60, def: 62, spa: 80, spd: 82, spe: 60},
+		abilities: {0: "Intimidate"},
+	},
+	shroomish: {
+		num: 285,
+		name: "Shroomish",
+		types: ["Grass"],
+		baseStats: {hp: 60, atk: 40, def: 60, spa: 40, spd: 60, spe: 35},
+		abilities: {0: "Effect Spore"},
+	},
+	breloom: {
+		num: 286,
+		name: "Breloom",
+		types: ["Grass", "Fighting"],
+		baseStats: {hp: 60, atk: 130, def: 80, spa: 60, spd: 60, spe: 70},
+		abilities: {0: "Effect Spore"},
+	},
+	slakoth: {
+		num: 287,
+		name: "Slakoth",
+		types: ["Normal"],
+		baseStats: {hp: 60, atk: 60, def: 60, spa: 35, spd: 35, spe: 30},
+		abilities: {0: "Truant"},
+	},
+	vigoroth: {
+		num: 288,
+		name: "Vigoroth",
+		types: ["Normal"],
+		baseStats: {hp: 80, atk: 80, def: 80, spa: 55, spd: 55, spe: 90},
+		abilities: {0: "Vital Spirit"},
+	},
+	slaking: {
+		num: 289,
+		name: "Slaking",
+		types: ["Normal"],
+		baseStats: {hp: 150, atk: 160, def: 100, spa: 95, spd: 65, spe: 100},
+		abilities: {0: "Truant"},
+	},
+	nincada: {
+		num: 290,
+		name: "Nincada",
+		types: ["Bug", "Ground"],
+		baseStats: {hp: 31, atk: 45, def: 90, spa: 30, spd: 30, spe: 40},
+		abilities: {0: "Compound Eyes"},
+	},
+	ninjask: {
+		num: 291,
+		name: "Ninjask",
+		types: ["Bug", "Flying"],
+		baseStats: {hp: 61, atk: 90, def: 45, spa: 50, spd: 50, spe: 160},
+		abilities: {0: "Speed Boost"},
+	},
+	shedinja: {
+		num: 292,
+		name: "Shedinja",
+		types: ["Bug", "Ghost"],
+		baseStats: {hp: 1, atk: 90, def: 45, spa: 30, spd: 30, spe: 40},
+		abilities: {0: "Wonder Guard"},
+	},
+	whismur: {
+		num: 293,
+		name: "Whismur",
+		types: ["Normal"],
+		baseStats: {hp: 64, atk: 51, def: 23, spa: 51, spd: 23, spe: 28},
+		abilities: {0: "Soundproof"},
+	},
+	loudred: {
+		num: 294,
+		name: "Loudred",
+		types: ["Normal"],
+		baseStats: {hp: 84, atk: 71, def: 43, spa: 71, spd: 43, spe: 48},
+		abilities: {0: "Soundproof"},
+	},
+	exploud: {
+		num: 295,
+		name: "Exploud",
+		types: ["Normal"],
+		baseStats: {hp: 104, atk: 91, def: 63, spa: 91, spd: 63, spe: 68},
+		abilities: {0: "Soundproof"},
+	},
+	makuhita: {
+		num: 296,
+		name: "Makuhita",
+		types: ["Fighting"],
+		baseStats: {hp: 72, atk: 60, def: 30, spa: 20, spd: 30, spe: 25},
+		abilities: {0: "Thick Fat", 1: "Guts"},
+	},
+	hariyama: {
+		num: 297,
+		name: "Hariyama",
+		types: ["Fighting"],
+		baseStats: {hp: 144, atk: 120, def: 60, spa: 40, spd: 60, spe: 50},
+		abilities: {0: "Thick Fat", 1: "Guts"},
+	},
+	azurill: {
+		num: 298,
+		name: "Azurill",
+		types: ["Normal"],
+		baseStats: {hp: 50, atk: 20, def: 40, spa: 20, spd: 40, spe: 20},
+		abilities: {0: "Thick Fat", 1: "Huge Power"},
+	},
+	nosepass: {
+		num: 299,
+		name: "Nosepass",
+		types: ["Rock"],
+		baseStats: {hp: 30, atk: 45, def: 135, spa: 45, spd: 90, spe: 30},
+		abilities: {0: "Sturdy", 1: "Magnet Pull"},
+	},
+	skitty: {
+		num: 300,
+		name: "Skitty",
+		types: ["Normal"],
+		baseStats: {hp: 50, atk: 45, def: 45, spa: 35, spd: 35, spe: 50},
+		abilities: {0: "Cute Charm"},
+	},
+	delcatty: {
+		num: 301,
+		name: "Delcatty",
+		types: ["Normal"],
+		baseStats: {hp: 70, atk: 65, def: 65, spa: 55, spd: 55, spe: 70},
+		abilities: {0: "Cute Charm"},
+	},
+	sableye: {
+		num: 302,
+		name: "Sableye",
+		types: ["Dark", "Ghost"],
+		baseStats: {hp: 50, atk: 75, def: 75, spa: 65, spd: 65, spe: 50},
+		abilities: {0: "Keen Eye"},
+	},
+	mawile: {
+		num: 303,
+		name: "Mawile",
+		types: ["Steel"],
+		baseStats: {hp: 50, atk: 85, def: 85, spa: 55, spd: 55, spe: 50},
+		abilities: {0: "Hyper Cutter", 1: "Intimidate"},
+	},
+	aron: {
+		num: 304,
+		name: "Aron",
+		types: ["Steel", "Rock"],
+		baseStats: {hp: 50, atk: 70, def: 100, spa: 40, spd: 40, spe: 30},
+		abilities: {0: "Sturdy", 1: "Rock Head"},
+	},
+	lairon: {
+		num: 305,
+		name: "Lairon",
+		types: ["Steel", "Rock"],
+		baseStats: {hp: 60, atk: 90, def: 140, spa: 50, spd: 50, spe: 40},
+		abilities: {0: "Sturdy", 1: "Rock Head"},
+	},
+	aggron: {
+		num: 306,
+		name: "Aggron",
+		types: ["Steel", "Rock"],
+		baseStats: {hp: 70, atk: 110, def: 180, spa: 60, spd: 60, spe: 50},
+		abilities: {0: "Sturdy", 1: "Rock Head"},
+	},
+	meditite: {
+		num: 307,
+		name: "Meditite",
+		types: ["Fighting", "Psychic"],
+		baseStats: {hp: 30, atk: 40, def: 55, spa: 40, spd: 55, spe: 60},
+		abilities: {0: "Pure Power"},
+	},
+	medicham: {
+		num: 308,
+		name: "Medicham",
+		types: ["Fighting", "Psychic"],
+		baseStats: {hp: 60, atk: 60, def: 75, spa: 60, spd: 75, spe: 80},
+		abilities: {0: "Pure Power"},
+	},
+	electrike: {
+		num: 309,
+		name: "Electrike",
+		types: ["Electric"],
+		baseStats: {hp: 40, atk: 45, def: 40, spa: 65, spd: 40, spe: 65},
+		abilities: {0: "Static", 1: "Lightning Rod"},
+	},
+	manectric: {
+		num: 310,
+		name: "Manectric",
+		types: ["Electric"],
+		baseStats: {hp: 70, atk: 75, def: 60, spa: 105, spd: 60, spe: 105},
+		abilities: {0: "Static", 1: "Lightning Rod"},
+	},
+	plusle: {
+		num: 311,
+		name: "Plusle",
+		types: ["Electric"],
+		baseStats: {hp: 60, atk: 50, def: 40, spa: 85, spd: 75, spe: 95},
+		abilities: {0: "Plus"},
+	},
+	minun: {
+		num: 312,
+		name: "Minun",
+		types: ["Electric"],
+		baseStats: {hp: 60, atk: 40, def: 50, spa: 75, spd: 85, spe: 95},
+		abilities: {0: "Minus"},
+	},
+	volbeat: {
+		num: 313,
+		name: "Volbeat",
+		types: ["Bug"],
+		baseStats: {hp: 65, atk: 73, def: 55, spa: 47, spd: 75, spe: 85},
+		abilities: {0: "Illuminate", 1: "Swarm"},
+	},
+	illumise: {
+		num: 314,
+		name: "Illumise",
+		types: ["Bug"],
+		baseStats: {hp: 65, atk: 47, def: 55, spa: 73, spd: 75, spe: 85},
+		abilities: {0: "Oblivious"},
+	},
+	roselia: {
+		num: 315,
+		name: "Roselia",
+		types: ["Grass", "Poison"],
+		baseStats: {hp: 50, atk: 60, def: 45, spa: 100, spd: 80, spe: 65},
+		abilities: {0: "Natural Cure", 1: "Poison Point"},
+	},
+	gulpin: {
+		num: 316,
+		name: "Gulpin",
+		types: ["Poison"],
+		baseStats: {hp: 70, atk: 43, def: 53, spa: 43, spd: 53, spe: 40},
+		abilities: {0: "Liquid Ooze", 1: "Sticky Hold"},
+	},
+	swalot: {
+		num: 317,
+		name: "Swalot",
+		types: ["Poison"],
+		baseStats: {hp: 100, atk: 73, def: 83, spa: 73, spd: 83, spe: 55},
+		abilities: {0: "Liquid Ooze", 1: "Sticky Hold"},
+	},
+	carvanha: {
+		num: 318,
+		name: "Carvanha",
+		types: ["Water", "Dark"],
+		baseStats: {hp: 45, atk: 90, def: 20, spa: 65, spd: 20, spe: 65},
+		abilities: {0: "Rough Skin"},
+	},
+	sharpedo: {
+		num: 319,
+		name: "Sharpedo",
+		types: ["Water", "Dark"],
+		baseStats: {hp: 70, atk: 120, def: 40, spa: 95, spd: 40, spe: 95},
+		abilities: {0: "Rough Skin"},
+	},
+	wailmer: {
+		num: 320,
+		name: "Wailmer",
+		types: ["Water"],
+		baseStats: {hp: 130, atk: 70, def: 35, spa: 70, spd: 35, spe: 60},
+		abilities: {0: "Water Veil", 1: "Oblivious"},
+	},
+	wailord: {
+		num: 321,
+		name: "Wailord",
+		types: ["Water"],
+		baseStats: {hp: 170, atk: 90, def: 45, spa: 90, spd: 45, spe: 60},
+		abilities: {0: "Water Veil", 1: "Oblivious"},
+	},
+	numel: {
+		num: 322,
+		name: "Numel",
+		types: ["Fire", "Ground"],
+		baseStats: {hp: 60, atk: 60, def: 40, spa: 65, spd: 45, spe: 35},
+		abilities: {0: "Oblivious"},
+	},
+	camerupt: {
+		num: 323,
+		name: "Camerupt",
+		types: ["Fire", "Ground"],
+		baseStats: {hp: 70, atk: 100, def: 70, spa: 105, spd: 75, spe: 40},
+		abilities: {0: "Magma Armor"},
+	},
+	torkoal: {
+		num: 324,
+		name: "Torkoal",
+		types: ["Fire"],
+		baseStats: {hp: 70, atk: 85, def: 140, spa: 85, spd: 70, spe: 20},
+		abilities: {0: "White Smoke"},
+	},
+	spoink: {
+		num: 325,
+		name: "Spoink",
+		types: ["Psychic"],
+		baseStats: {hp: 60, atk: 25, def: 35, spa: 70, spd: 80, spe: 60},
+		abilities: {0: "Thick Fat", 1: "Own Tempo"},
+	},
+	grumpig: {
+		num: 326,
+		name: "Grumpig",
+		types: ["Psychic"],
+		baseStats: {hp: 80, atk: 45, def: 65, spa: 90, spd: 110, spe: 80},
+		abilities: {0: "Thick Fat", 1: "Own Tempo"},
+	},
+	spinda: {
+		num: 327,
+		name: "Spinda",
+		types: ["Normal"],
+		baseStats: {hp: 60, atk: 60, def: 60, spa: 60, spd: 60, spe: 60},
+		abilities: {0: "Own Tempo"},
+	},
+	trapinch: {
+		num: 328,
+		name: "Trapinch",
+		types: ["Ground"],
+		baseStats: {hp: 45, atk: 100, def: 45, spa: 45, spd: 45, spe: 10},
+		abilities: {0: "Hyper Cutter", 1: "Arena Trap"},
+	},
+	vibrava: {
+		num: 329,
+		name: "Vibrava",
+		types: ["Ground", "Dragon"],
+		baseStats: {hp: 50, atk: 70, def: 50, spa: 50, spd: 50, spe: 70},
+		abilities: {0: "Levitate"},
+	},
+	flygon: {
+		num: 330,
+		name: "Flygon",
+		types: ["Ground", "Dragon"],
+		baseStats: {hp: 80, atk: 100, def: 80, spa: 80, spd: 80, spe: 100},
+		abilities: {0: "Levitate"},
+	},
+	cacnea: {
+		num: 331,
+		name: "Cacnea",
+		types: ["Grass"],
+		baseStats: {hp: 50, atk: 85, def: 40, spa: 85, spd: 40, spe: 35},
+		abilities: {0: "Sand Veil"},
+	},
+	cacturne: {
+		num: 332,
+		name: "Cacturne",
+		types: ["Grass", "Dark"],
+		baseStats: {hp: 70, atk: 115, def: 60, spa: 115, spd: 60, spe: 55},
+		abilities: {0: "Sand Veil"},
+	},
+	swablu: {
+		num: 333,
+		name: "Swablu",
+		types: ["Normal", "Flying"],
+		baseStats: {hp: 45, atk: 40, def: 60, spa: 40, spd: 75, spe: 50},
+		abilities: {0: "Natural Cure"},
+	},
+	altaria: {
+		num: 334,
+		name: "Altaria",
+		types: ["Dragon", "Flying"],
+		baseStats: {hp: 75, atk: 70, def: 90, spa: 70, spd: 105, spe: 80},
+		abilities: {0: "Natural Cure"},
+	},
+	zangoose: {
+		num: 335,
+		name: "Zangoose",
+		types: ["Normal"],
+		baseStats: {hp: 73, atk: 115, def: 60, spa: 60, spd: 60, spe: 90},
+		abilities: {0: "Immunity"},
+	},
+	seviper: {
+		num: 336,
+		name: "Seviper",
+		types: ["Poison"],
+		baseStats: {hp: 73, atk: 100, def: 60, spa: 100, spd: 60, spe: 65},
+		abilities: {0: "Shed Skin"},
+	},
+	lunatone: {
+		num: 337,
+		name: "Lunatone",
+		types: ["Rock", "Psychic"],
+		baseStats: {hp: 70, atk: 55, def: 65, spa: 95, spd: 85, spe: 70},
+		abilities: {0: "Levitate"},
+	},
+	solrock: {
+		num: 338,
+		name: "Solrock",
+		types: ["Rock", "Psychic"],
+		baseStats: {hp: 70, atk: 95, def: 85, spa: 55, spd: 65, spe: 70},
+		abilities: {0: "Levitate"},
+	},
+	barboach: {
+		num: 339,
+		name: "Barboach",
+		types: ["Water", "Ground"],
+		baseStats: {hp: 50, atk: 48, def: 43, spa: 46, spd: 41, spe: 60},
+		abilities: {0: "Oblivious"},
+	},
+	whiscash: {
+		num: 340,
+		name: "Whiscash",
+		types: ["Water", "Ground"],
+		baseStats: {hp: 110, atk: 78, def: 73, spa: 76, spd: 71, spe: 60},
+		abilities: {0: "Oblivious"},
+	},
+	corphish: {
+		num: 341,
+		name: "Corphish",
+		types: ["Water"],
+		baseStats: {hp: 43, atk: 80, def: 65, spa: 50, spd: 35, spe: 35},
+		abilities: {0: "Hyper Cutter", 1: "Shell Armor"},
+	},
+	crawdaunt: {
+		num: 342,
+		name: "Crawdaunt",
+		types: ["Water", "Dark"],
+		baseStats: {hp: 63, atk: 120, def: 85, spa: 90, spd: 55, spe: 55},
+		abilities: {0: "Hyper Cutter", 1: "Shell Armor"},
+	},
+	baltoy: {
+		num: 343,
+		name: "Baltoy",
+		types: ["Ground", "Psychic"],
+		baseStats: {hp: 40, atk: 40, def: 55, spa: 40, spd: 70, spe: 55},
+		abilities: {0: "Levitate"},
+	},
+	claydol: {
+		num: 344,
+		name: "Claydol",
+		types: ["Ground", "Psychic"],
+		baseStats: {hp: 60, atk: 70, def: 105, spa: 70, spd: 120, spe: 75},
+		abilities: {0: "Levitate"},
+	},
+	lileep: {
+		num: 345,
+		name: "Lileep",
+		types: ["Rock", "Grass"],
+		baseStats: {hp: 66, atk: 41, def: 77, spa: 61, spd: 87, spe: 23},
+		abilities: {0: "Suction Cups"},
+	},
+	cradily: {
+		num: 346,
+		name: "Cradily",
+		types: ["Rock", "Grass"],
+		baseStats: {hp: 86, atk: 81, def: 97, spa: 81, spd: 107, spe: 43},
+		abilities: {0: "Suction Cups"},
+	},
+	anorith: {
+		num: 347,
+		name: "Anorith",
+		types: ["Rock", "Bug"],
+		baseStats: {hp: 45, atk: 95, def: 50, spa: 40, spd: 50, spe: 75},
+		abilities: {0: "Battle Armor"},
+	},
+	armaldo: {
+		num: 348,
+		name: "Armaldo",
+		types: ["Rock", "Bug"],
+		baseStats: {hp: 75, atk: 125, def: 100, spa: 70, spd: 80, spe: 45},
+		abilities: {0: "Battle Armor"},
+	},
+	feebas: {
+		num: 349,
+		name: "Feebas",
+		types: ["Water"],
+		baseStats: {hp: 20, atk: 15, def: 20, spa: 10, spd: 55, spe: 80},
+		abilities: {0: "Swift Swim"},
+	},
+	milotic: {
+		num: 350,
+		name: "Milotic",
+		types: ["Water"],
+		baseStats: {hp: 95, atk: 60, def: 79, spa: 100, spd: 125, spe: 81},
+		abilities: {0: "Marvel Scale"},
+	},
+	castform: {
+		num: 351,
+		name: "Castform",
+		types: ["Normal"],
+		baseStats: {hp: 70, atk: 70, def: 70, spa: 70, spd: 70, spe: 70},
+		abilities: {0: "Forecast"},
+	},
+	kecleon: {
+		num: 352,
+		name: "Kecleon",
+		types: ["Normal"],
+		baseStats: {hp: 60, atk: 90, def: 70, spa: 60, spd: 120, spe: 40},
+		abilities: {0: "Color Change"},
+	},
+	shuppet: {
+		num: 353,
+		name: "Shuppet",
+		types: ["Ghost"],
+		baseStats: {hp: 44, atk: 75, def: 35, spa: 63, spd: 33, spe: 45},
+		abilities: {0: "Insomnia"},
+	},
+	banette: {
+		num: 354,
+		name: "Banette",
+		types: ["Ghost"],
+		baseStats: {hp: 64, atk: 115, def: 65, spa: 83, spd: 63, spe: 65},
+		abilities: {0: "Insomnia"},
+	},
+	duskull: {
+		num: 355,
+		name: "Duskull",
+		types: ["Ghost"],
+		baseStats: {hp: 20, atk: 40, def: 90, spa: 30, spd: 90, spe: 25},
+		abilities: {0: "Levitate"},
+	},
+	dusclops: {
+		num: 356,
+		name: "Dusclops",
+		types: ["Ghost"],
+		baseStats: {hp: 40, atk: 70, def: 130, spa: 60, spd: 130, spe: 25},
+		abilities: {0: "Pressure"},
+	},
+	tropius: {
+		num: 357,
+		name: "Tropius",
+		types: ["Grass", "Flying"],
+		baseStats: {hp: 99, atk: 68, def: 83, spa: 72, spd: 87, spe: 51},
+		abilities: {0: "Chlorophyll"},
+	},
+	chimecho: {
+		num: 358,
+		name: "Chimecho",
+		types: ["Psychic"],
+		baseStats: {hp: 65, atk: 50, def: 70, spa: 95, spd: 80, spe: 65},
+		abilities: {0: "Levitate"},
+	},
+	absol: {
+		num: 359,
+		name: "Absol",
+		types: ["Dark"],
+		baseStats: {hp: 65, atk: 130, def: 60, spa: 75, spd: 60, spe: 75},
+		abilities: {0: "Pressure"},
+	},
+	wynaut: {
+		num: 360,
+		name: "Wynaut",
+		types: ["Psychic"],
+		baseStats: {hp: 95, atk: 23, def: 48, spa: 23, spd: 48, spe: 23},
+		abilities: {0: "Shadow Tag"},
+	},
+	snorunt: {
+		num: 361,
+		name: "Snorunt",
+		types: ["Ice"],
+		baseStats: {hp: 50, atk: 50, def: 50, spa: 50, spd: 50, spe: 50},
+		abilities: {0: "Inner Focus"},
+	},
+	glalie: {
+		num: 362,
+		name: "Glalie",
+		types: ["Ice"],
+		baseStats: {hp: 80, atk: 80, def: 80, spa: 80, spd: 80, spe: 80},
+		abilities: {0: "Inner Focus"},
+	},
+	spheal: {
+		num: 363,
+		name: "Spheal",
+		types: ["Ice", "Water"],
+		baseStats: {hp: 70, atk: 40, def: 50, spa: 55, spd: 50, spe: 25},
+		abilities: {0: "Thick Fat"},
+	},
+	sealeo: {
+		num: 364,
+		name: "Sealeo",
+		types: ["Ice", "Water"],
+		baseStats: {hp: 90, atk: 60, def: 70, spa: 75, spd: 70, spe: 45},
+		abilities: {0: "Thick Fat"},
+	},
+	walrein: {
+		num: 365,
+		name: "Walrein",
+		types: ["Ice", "Water"],
+		baseStats: {hp: 110, atk: 80, def: 90, spa: 95, spd: 90, spe: 65},
+		abilities: {0: "Thick Fat"},
+	},
+	clamperl: {
+		num: 366,
+		name: "Clamperl",
+		types: ["Water"],
+		baseStats: {hp: 35, atk: 64, def: 85, spa: 74, spd: 55, spe: 32},
+		abilities: {0: "Shell Armor"},
+	},
+	huntail: {
+		num: 367,
+		name: "Huntail",
+		types: ["Water"],
+		baseStats: {hp: 55, atk: 104, def: 105, spa: 94, spd: 75, spe: 52},
+		abilities: {0: "Swift Swim"},
+	},
+	gorebyss: {
+		num: 368,
+		name: "Gorebyss",
+		types: ["Water"],
+		baseStats: {hp: 55, atk: 84, def: 105, spa: 114, spd: 75, spe: 52},
+		abilities: {0: "Swift Swim"},
+	},
+	relicanth: {
+		num: 369,
+		name: "Relicanth",
+		types: ["Water", "Rock"],
+		baseStats: {hp: 100, atk: 90, def: 130, spa: 45, spd: 65, spe: 55},
+		abilities: {0: "Swift Swim", 1: "Rock Head"},
+	},
+	luvdisc: {
+		num: 370,
+		name: "Luvdisc",
+		types: ["Water"],
+		baseStats: {hp: 43, atk: 30, def: 55, spa: 40, spd: 65, spe: 97},
+		abilities: {0: "Swift Swim"},
+	},
+	bagon: {
+		num: 371,
+		name: "Bagon",
+		types: ["Dragon"],
+		baseStats: {hp: 45, atk: 75, def: 60, spa: 40, spd: 30, spe: 50},
+		abilities: {0: "Rock Head"},
+	},
+	shelgon: {
+		num: 372,
+		name: "Shelgon",
+		types: ["Dragon"],
+		baseStats: {hp: 65, atk: 95, def: 100, spa: 60, spd: 50, spe: 50},
+		abilities: {0: "Rock Head"},
+	},
+	salamence: {
+		num: 373,
+		name: "Salamence",
+		types: ["Dragon", "Flying"],
+		baseStats: {hp: 95, atk: 135, def: 80, spa: 110, spd: 80, spe: 100},
+		abilities: {0: "Intimidate"},
+	},
+	beldum: {
+		num: 374,
+		name: "Beldum",
+		types: ["Steel", "Psychic"],
+		baseStats: {hp: 40, atk: 55, def: 80, spa: 35, spd: 60, spe: 30},
+		abilities: {0: "Clear Body"},
+	},
+	metang: {
+		num: 375,
+		name: "Metang",
+		types: ["Steel", "Psychic"],
+		baseStats: {hp: 60, atk: 75, def: 100, spa: 55, spd: 80, spe: 50},
+		abilities: {0: "Clear Body"},
+	},
+	metagross: {
+		num: 376,
+		name: "Metagross",
+		types: ["Steel", "Psychic"],
+		baseStats: {hp: 80, atk: 135, def: 130, spa: 95, spd: 90, spe: 70},
+		abilities: {0: "Clear Body"},
+	},
+	regirock: {
+		num: 377,
+		name: "Regirock",
+		types: ["Rock"],
+		baseStats: {hp: 80, atk: 100, def: 200, spa: 50, spd: 100, spe: 50},
+		abilities: {0: "Clear Body"},
+	},
+	regice: {
+		num: 378,
+		name: "Regice",
+		types: ["Ice"],
+		baseStats: {hp: 80, atk: 50, def: 100, spa: 100, spd: 200, spe: 50},
+		abilities: {0: "Clear Body"},
+	},
+	registeel: {
+		num: 379,
+		name: "Registeel",
+		types: ["Steel"],
+		baseStats: {hp: 80, atk: 75, def: 150, spa: 75, spd: 150, spe: 50},
+		abilities: {0: "Clear Body"},
+	},
+	latias: {
+		num: 380,
+		name: "Latias",
+		types: ["Dragon", "Psychic"],
+		baseStats: {hp: 80, atk: 80, def: 90, spa: 110, spd: 130, spe: 110},
+		abilities: {0: "Levitate"},
+	},
+	latios: {
+		num: 381,
+		name: "Latios",
+		types: ["Dragon", "Psychic"],
+		baseStats: {hp: 80, atk: 90, def: 80, spa: 130, spd: 110, spe: 110},
+		abilities: {0: "Levitate"},
+	},
+	kyogre: {
+		num: 382,
+		name: "Kyogre",
+		types: ["Water"],
+		baseStats: {hp: 100, atk: 100, def: 90, spa: 150, spd: 140, spe: 90},
+		abilities: {0: "Drizzle"},
+	},
+	groudon: {
+		num: 383,
+		name: "Groudon",
+		types: ["Ground"],
+		baseStats: {hp: 100, atk: 150, def: 140, spa: 100, spd: 90, spe: 90},
+		abilities: {0: "Drought"},
+	},
+	rayquaza: {
+		num: 384,
+		name: "Rayquaza",
+		types: ["Dragon", "Flying"],
+		baseStats: {hp: 105, atk: 150, def: 90, spa: 150, spd: 90, spe: 95},
+		abilities: {0: "Air Lock"},
+	},
+	jirachi: {
+		num: 385,
+		name: "Jirachi",
+		types: ["Steel", "Psychic"],
+		baseStats: {hp: 100, atk: 100, def: 100, spa: 100, spd: 100, spe: 100},
+		abilities: {0: "Serene Grace"},
+	},
+	deoxys: {
+		num: 386,
+		name: "Deoxys",
+		types: ["Psychic"],
+		baseStats: {hp: 50, atk: 150, def: 50, spa: 150, spd: 50, spe: 150},
+		abilities: {0: "Pressure"},
+	},
+	deoxysattack: {
+		num: 386,
+		name: "Deoxys-Attack",
+		types: ["Psychic"],
+		baseStats: {hp: 50, atk: 180, def: 20, spa: 180, spd: 20, spe: 150},
+		abilities: {0: "Pressure"},
+	},
+	deoxysdefense: {
+		num: 386,
+		name: "Deoxys-Defense",
+		types: ["Psychic"],
+		baseStats: {hp: 50, atk: 70, def: 160, spa: 70, spd: 160, spe: 90},
+		abilities: {0: "Pressure"},
+	},
+	deoxysspeed: {
+		num: 386,
+		name: "Deoxys-Speed",
+		types: ["Psychic"],
+		baseStats: {hp: 50, atk: 95, def: 90, spa: 95, spd: 90, spe: 180},
+		abilities: {0: "Pressure"},
+	},
+};
@@ -0,0 +1,23 @@
+import random
+
+from battle_env.agents import GreedyAgent
+from battle_env.battle import Battle, random_policy
+from battle_env.random_teams import RandomTeamGenerator
+
+
+def test_greedy_agent_beats_random_policy():
+    generator = RandomTeamGenerator(["OU"])
+    battles, wins = 40, 0
+    for seed in range(battles):
+        rng = random.Random(seed)
+        team1, team2 = generator.sample_team(rng), generator.sample_team(rng)
+        random.seed(seed)
+        battle = Battle(team1, team2, verbose=False)
+        # alternate sides so neither slot's advantage decides the result
+        greedy_side = 1 + seed % 2
+        if greedy_side == 1:
+            result = battle.run_battle(GreedyAgent(), random_policy)
+        else:
+            result = battle.run_battle(random_policy, GreedyAgent())
+        wins += result.winner == greedy_side
+    assert wins / battles >= 0.8
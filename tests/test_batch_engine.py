@@ -0,0 +1,54 @@
+import pytest
+
+from battle_env.batch_engine import validate_against_battle
+from battle_env.moves_loader import load_gen3_moves
+from battle_env.team import TeamTemplate
+from battle_env.team_builder import parse_showdown
+
+TEAM1 = """
+Snorlax @ Leftovers
+Ability: Thick Fat
+Level: 50
+EVs: 252 HP / 252 Atk
+Adamant Nature
+- Body Slam
+- Earthquake
+- Shadow Ball
+
+Raikou @ Magnet
+Ability: Pressure
+Level: 50
+- Thunderbolt
+- Crunch
+"""
+
+TEAM2 = """
+Aerodactyl
+Ability: Pressure
+Level: 50
+EVs: 252 HP / 252 Atk
+Adamant Nature
+- Rock Slide
+- Earthquake
+- Wing Attack
+
+Skarmory @ Leftovers
+Ability: Keen Eye
+Level: 50
+EVs: 252 HP / 252 Def
+- Drill Peck
+- Steel Wing
+"""
+
+
+def test_batch_engine_agrees_with_battle():
+    # Leftovers is on both teams to keep it on the batch path; it heals in neither engine
+    moves_db = load_gen3_moves()
+    t1, t2 = (TeamTemplate.from_team(parse_showdown(text, moves_db)) for text in (TEAM1, TEAM2))
+    report = validate_against_battle(t1, t2, range(400))
+    assert report['supported']
+    assert report['damage_checked'] == 20
+    assert report['damage_mismatches'] == 0
+    batch, obj = report['batch'], report['object']
+    assert batch['p1_win'] == pytest.approx(obj['p1_win'], abs=0.1)
+    assert batch['mean_turns'] == pytest.approx(obj['mean_turns'], abs=1.0)
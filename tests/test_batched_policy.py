@@ -0,0 +1,59 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from battle_env.battle import Battle, random_policy
+from battle_env.batched_policy import BatchPolicy, LinearPolicy, run_batched
+from battle_env.moves_loader import load_gen3_moves
+from battle_env.team import TeamTemplate
+from battle_env.team_builder import parse_showdown
+
+ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture(scope="module")
+def templates():
+    moves_db = load_gen3_moves()
+    return [TeamTemplate.from_team(parse_showdown((ROOT / name).read_text(), moves_db))
+            for name in ("team1.txt", "team2.txt")]
+
+
+def battles(templates, n):
+    t1, t2 = templates
+    return [Battle(t1.instantiate(), t2.instantiate(), verbose=False) for _ in range(n)]
+
+
+def outcome(result):
+    return result.winner, result.turns, result.reason
+
+
+class IllegalPolicy(BatchPolicy):
+    def __call__(self, obs, mask):
+        return (~mask).argmax(axis=1)
+
+
+def test_illegal_batch_actions_raise(templates):
+    with pytest.raises(ValueError, match="illegal action"):
+        run_batched(battles(templates, 2), IllegalPolicy(), random_policy)
+
+
+def test_every_battle_finishes(templates):
+    results = run_batched(battles(templates, 8), LinearPolicy(seed=0), random_policy, seeds=range(8))
+    assert all(r is not None and r.reason for r in results)
+    assert all(r.turns <= 500 for r in results)
+
+
+def test_outcomes_depend_only_on_the_seed(templates):
+    greedy = LinearPolicy(seed=0, temperature=0)
+    batched = run_batched(battles(templates, 4), greedy, random_policy, seeds=[7, 8, 9, 10])
+    alone = run_batched(battles(templates, 1), greedy, random_policy, seeds=[9])
+    assert outcome(batched[2]) == outcome(alone[0])
+    # with per-battle policies on both sides it matches Battle.run_battle
+    state = random.getstate()
+    mixed = run_batched(battles(templates, 3), random_policy, random_policy, seeds=[1, 2, 3])
+    assert random.getstate() == state
+    for seed, result in zip([1, 2, 3], mixed):
+        random.seed(seed)
+        [battle] = battles(templates, 1)
+        assert outcome(battle.run_battle(random_policy, random_policy)) == outcome(result)
@@ -0,0 +1,136 @@
+from pathlib import Path
+
+import pytest
+
+from battle_env.agents import GreedyAgent
+from battle_env.battle import MOVE_SLOTS, Battle, first_legal_policy
+from battle_env.moves_loader import load_gen3_moves
+from battle_env.ruleset import get_ruleset
+from battle_env.team_builder import parse_showdown
+
+ROOT = Path(__file__).parent.parent
+
+SHADOW_TAG_TEAM = """
+Wobbuffet @ Leftovers
+Ability: Shadow Tag
+Level: 50
+- Counter
+- Mirror Coat
+
+Marowak @ Thick Club
+Ability: Rock Head
+Level: 50
+- Earthquake
+"""
+
+
+@pytest.fixture
+def battle():
+    moves_db = load_gen3_moves()
+    team1 = parse_showdown((ROOT / "team1.txt").read_text(), moves_db)
+    team2 = parse_showdown(SHADOW_TAG_TEAM, moves_db)
+    battle = Battle(team1, team2, verbose=False)
+    battle.start()
+    return battle
+
+
+def switch_bits(mask):
+    return mask >> MOVE_SLOTS
+
+
+def test_shadow_tag_removes_switches(battle):
+    assert battle.p1.trapped
+    assert switch_bits(battle.legal_action_mask(1)) == 0
+    assert all(action['type'] == 'move' for action in battle.legal_actions(1))
+    # the trapper itself can still switch
+    assert switch_bits(battle.legal_action_mask(2)) != 0
+
+
+def test_trapping_ends_when_the_trapper_leaves(battle):
+    battle.switch_in(2, 1)
+    assert not battle.p1.trapped
+    assert switch_bits(battle.legal_action_mask(1)) == 0b10
+
+
+def test_trapping_ends_when_the_trapper_faints(battle):
+    battle.p2.apply_damage(battle.p2.current_hp)
+    battle.switch_in(2, 1)
+    assert switch_bits(battle.legal_action_mask(1)) == 0b10
+
+
+def test_trapped_pokemon_switched_in_later_is_trapped(battle):
+    battle.switch_in(2, 1)
+    battle.switch_in(1, 1)
+    battle.switch_in(2, 0)
+    assert battle.p1.trapped
+    assert switch_bits(battle.legal_action_mask(1)) == 0
+
+
+def test_double_switch_turn_is_recorded():
+    moves_db = load_gen3_moves()
+    team1 = parse_showdown((ROOT / "team1.txt").read_text(), moves_db)
+    team2 = parse_showdown((ROOT / "team2.txt").read_text(), moves_db)
+    battle = Battle(team1, team2, verbose=False, record_history=True)
+    battle.start()
+    battle.play_turn({'type': 'switch', 'index': 1}, {'type': 'switch', 'index': 1})
+    assert len(battle.history.deltas) == 2
+    state = battle.history.state_at(-1)
+    assert state['p1.active'] == 1 and state['p2.active'] == 1
+
+
+def test_gen2_ruleset_drives_categories_and_agent_scores():
+    rules = get_ruleset(2)
+    assert rules.effectiveness('Ghost', ['Steel']) == 0.5
+    moves_db = load_gen3_moves()
+    team1 = parse_showdown((ROOT / "team1.txt").read_text(), moves_db)
+    team2 = parse_showdown((ROOT / "team2.txt").read_text(), moves_db)
+    miltank = team1.members[0]
+    body_slam = miltank.moves[1]
+    body_slam.category = 'Special'
+    shadow_ball = miltank.moves[0] = moves_db['shadow ball'].copy()
+    team2.members[0].types = ['Steel']
+    battle = Battle(team1, team2, verbose=False, ruleset=rules)
+    assert body_slam.category == shadow_ball.category == 'Physical'
+    scores = GreedyAgent().table(battle, 1).offense[0][0]
+    stab = 1.5 if 'Normal' in miltank.types else 1.0
+    expected = scores[1][0] / stab / rules.effectiveness('Normal', ['Steel']) * 80 / 85 * 0.5
+    assert scores[0][0] == pytest.approx(expected)
+
+
+
+TRUANT_TEAM = """
+Slaking
+Ability: Truant
+Level: 50
+- Body Slam
+
+Slaking
+Ability: Truant
+Level: 50
+- Body Slam
+"""
+
+
+def truant_battle():
+    moves_db = load_gen3_moves()
+    team1 = parse_showdown(TRUANT_TEAM, moves_db)
+    team2 = parse_showdown((ROOT / "team2.txt").read_text(), moves_db)
+    return Battle(team1, team2, verbose=False)
+
+
+def test_truant_loafs_every_other_turn_for_leads_and_switch_ins():
+    battle = truant_battle()
+    battle.start()
+    assert battle.p1.truantTurn is False
+    battle.switch_in(1, 1)
+    assert battle.p1.truantTurn is False
+    loafed = []
+    for _ in range(2):
+        battle.log_messages.clear()
+        battle.play_turn({'type': 'move', 'index': 0}, {'type': 'move', 'index': 0})
+        loafed.append("Slaking is loafing around!" in battle.log_messages)
+    assert loafed == [False, True]
+
+
+def test_truant_battles_run_to_completion():
+    assert truant_battle().run_battle(first_legal_policy, first_legal_policy).turns > 0
@@ -0,0 +1,53 @@
+import threading
+import time
+from pathlib import Path
+
+from battle_env.broker import Broker, Job, run_worker
+
+ROOT = Path(__file__).parent.parent
+
+
+def make_jobs(count):
+    team1, team2 = (ROOT / "team1.txt").read_text(), (ROOT / "team2.txt").read_text()
+    return [Job(i, team1, team2, seed=i, policy1='first', policy2='random', max_turns=50) for i in range(count)]
+
+
+def test_empty_broker_is_finished():
+    assert Broker([]).finished.is_set()
+    assert Broker([]).lease('w', 4) == {'done': True}
+
+
+def test_workers_on_localhost_complete_every_job():
+    broker = Broker(make_jobs(12))
+    broker.serve("127.0.0.1:0")
+    try:
+        counts = []
+        threads = [threading.Thread(target=lambda i=i: counts.append(run_worker(broker.address, 2, f"w{i}")))
+                   for i in range(3)]
+        for t in threads:
+            t.start()
+        assert broker.wait(60)
+        for t in threads:
+            t.join(10)
+        assert not any(t.is_alive() for t in threads)
+        assert sorted(broker.results) == list(range(12))
+        assert not broker.failed
+        assert sum(counts) == 12
+        assert all(r['reason'] for r in broker.results.values())
+    finally:
+        broker.shutdown()
+
+
+def test_expired_leases_are_requeued_and_retried():
+    broker = Broker(make_jobs(2), lease_seconds=0.05, max_attempts=2)
+    assert [job['id'] for job in broker.lease('lost', 2)['jobs']] == [0, 1]
+    time.sleep(0.1)
+    # the lost worker's jobs come back to the next lease
+    assert [job['id'] for job in broker.lease('w', 1)['jobs']] == [0]
+    broker.complete('w', [{'id': 0, 'winner': 1, 'turns': 3, 'reason': 'faint'}])
+    assert [job['id'] for job in broker.lease('w', 2)['jobs']] == [1]
+    time.sleep(0.1)
+    # job 1 expired on both of its attempts; job 0 is done
+    assert broker.lease('w', 2) == {'done': True}
+    assert broker.failed == {1: "lease expired"}
+    assert broker.results[0]['winner'] == 1
@@ -0,0 +1,47 @@
+import shutil
+import sys
+
+import pytest
+
+import convert_data
+
+pytestmark = pytest.mark.skipif(shutil.which("node") is None, reason="needs node")
+
+SOURCE = """export const FormatsData: {[k: string]: SpeciesFormatsData} = {
+\tbulbasaur: {
+\t\ttier: "LC",
+\t},
+};
+"""
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "formats-data.ts").write_text(SOURCE)
+    monkeypatch.setattr(convert_data, "REPO_ROOT", tmp_path)
+    monkeypatch.setattr(convert_data, "DATA_DIR", tmp_path / "data")
+    monkeypatch.setattr(convert_data, "CACHE_DIR", tmp_path / "data" / ".cache")
+    monkeypatch.setattr(convert_data, "MANIFEST_FILE", tmp_path / "data" / ".convert_manifest.json")
+    monkeypatch.setattr(convert_data, "TARGETS", {
+        "formats": convert_data.Target("formats.json", (convert_data.Source("src/formats-data.ts", "FormatsData"),)),
+    })
+    return tmp_path
+
+
+def run_main(monkeypatch, capsys, *args):
+    monkeypatch.setattr(sys, "argv", ["convert_data.py", *args])
+    convert_data.main()
+    return capsys.readouterr().out
+
+
+def test_rerun_is_up_to_date(tree, monkeypatch, capsys):
+    assert "Wrote" in run_main(monkeypatch, capsys)
+    assert (tree / "data" / "formats.json").read_text().count('"tier": "LC"') == 1
+    assert run_main(monkeypatch, capsys).strip() == "Everything up to date."
+    # a changed source is converted again; --force always rewrites
+    (tree / "src" / "formats-data.ts").write_text(SOURCE.replace('"LC"', '"NFE"'))
+    assert convert_data.build(["formats"]) == ["formats.json"]
+    assert '"NFE"' in (tree / "data" / "formats.json").read_text()
+    assert convert_data.build(["formats"]) == []
+    assert convert_data.build(["formats"], force=True) == ["formats.json"]
@@ -0,0 +1,45 @@
+import pytest
+
+from battle_env.damage import get_damage_range_int
+
+# Expected values worked by hand through 3gen_env_Showdown/scripts.ts
+# ``modifyDamage``: burn, weather, min 1 (physical), +2, crit, STAB, then one
+# doubling or floored halving per type step.  ``randomizer`` then scales by
+# (100 - random(16)) / 100, so the high roll is the pre-roll damage and the
+# low roll is floor(high * 85 / 100).
+CASES = [
+    # 50 + 2 = 52 -> STAB 78 -> 2x 156
+    ("STAB, super effective", 50, {'types': ['Fire']}, {'types': ['Grass']},
+     {'type': 'Fire', 'category': 'Special', 'power': 90}, False, None, (132, 156)),
+    # 1 + 2 = 3 -> STAB floor(4.5) = 4 -> 2x 8 (not floor(3 * 1.5 * 2) = 9)
+    ("STAB floors before doubling", 1, {'types': ['Fire']}, {'types': ['Grass']},
+     {'type': 'Fire', 'category': 'Special', 'power': 90}, False, None, (6, 8)),
+    # rain: floor(21 * 1.5) = 31 before the +2 -> 33 (not (21 + 2) * 1.5 = 34)
+    ("weather before +2", 21, {'types': ['Normal']}, {'types': ['Normal']},
+     {'type': 'Water', 'category': 'Special', 'power': 95}, False, 'rain', (28, 33)),
+    # burn 101 // 2 = 50 -> 52 -> 0.25x as two floored halvings: 26, 13
+    ("burn and double resist", 101, {'types': ['Water'], 'status': 'brn'}, {'types': ['Rock', 'Steel']},
+     {'type': 'Normal', 'category': 'Physical', 'power': 70}, False, None, (11, 13)),
+    # 30 + 2 = 32 -> crit 64 -> STAB 96 -> 4x 384
+    ("crit, STAB, 4x", 30, {'types': ['Electric']}, {'types': ['Water', 'Flying']},
+     {'type': 'Electric', 'category': 'Special', 'power': 95}, True, None, (326, 384)),
+    # Guts ignores the burn halving: 40 + 2 = 42
+    ("Guts", 40, {'types': ['Fighting'], 'status': 'brn', 'ability': 'Guts'}, {'types': ['Normal']},
+     {'type': 'Normal', 'category': 'Physical', 'power': 70}, False, None, (35, 42)),
+    # physical damage of 0 becomes 1 before the +2; special stays 0
+    ("physical minimum", 0, {'types': ['Water']}, {'types': ['Normal']},
+     {'type': 'Normal', 'category': 'Physical', 'power': 10}, False, None, (2, 3)),
+    ("special minimum", 0, {'types': ['Normal']}, {'types': ['Normal']},
+     {'type': 'Water', 'category': 'Special', 'power': 10}, False, None, (1, 2)),
+    # 253 + 2 = 255 -> low roll floor(255 * 0.85) = 216 (the Gen 1/2 roll would give 217)
+    ("85-100% roll", 253, {'types': ['Normal']}, {'types': ['Normal']},
+     {'type': 'Water', 'category': 'Special', 'power': 80}, False, None, (216, 255)),
+    ("immunity", 80, {'types': ['Normal']}, {'types': ['Ghost']},
+     {'type': 'Normal', 'category': 'Physical', 'power': 80}, False, None, (0, 0)),
+]
+
+
+@pytest.mark.parametrize("name,initial,attacker,defender,move,crit,weather,expected", CASES,
+                         ids=[case[0] for case in CASES])
+def test_damage_range_int_matches_showdown(name, initial, attacker, defender, move, crit, weather, expected):
+    assert get_damage_range_int(initial, attacker, defender, move, crit, weather) == expected
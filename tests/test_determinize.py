@@ -0,0 +1,42 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from battle_env.determinize import DeterminizationSampler, Revealed, Usage
+from battle_env.learnsets import load_learnsets, to_id
+from battle_env.stats_loader import local_abilities
+
+ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture(scope="module")
+def sampler():
+    usage = Usage.from_teams([(ROOT / "team1.txt").read_text(), (ROOT / "team2.txt").read_text()])
+    return DeterminizationSampler(usage=usage)
+
+
+def test_samples_keep_revealed_moves_item_and_ability(sampler):
+    revealed = [Revealed("Snorlax", frozenset({"Body Slam", "Curse"}), "Leftovers", "Immunity"),
+                Revealed("Miltank", frozenset({"Milk Drink"}))]
+    rng = random.Random(3)
+    for team in sampler.sample_many(revealed, 50, rng):
+        snorlax, miltank = team[:2]
+        assert {"bodyslam", "curse"} <= {to_id(m) for m in snorlax.moves}
+        assert (snorlax.item, snorlax.ability) == ("leftovers", "immunity")
+        assert "milkdrink" in {to_id(m) for m in miltank.moves}
+        assert len({to_id(g.species) for g in team}) == 6
+
+
+def test_unrevealed_fields_come_from_species_data_and_usage(sampler):
+    learnsets, abilities = load_learnsets(), local_abilities()
+    rng = random.Random(5)
+    miltank_items = set()
+    for team in sampler.sample_many([Revealed("Miltank")], 50, rng):
+        for gene in team:
+            ident = to_id(gene.species)
+            assert all(to_id(m) in learnsets[ident] for m in gene.moves)
+            assert gene.ability in abilities[ident]
+        miltank_items.add(team[0].item)
+    # Miltank was only ever seen holding a Lum Berry
+    assert miltank_items == {"lumberry"}
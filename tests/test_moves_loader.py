@@ -0,0 +1,18 @@
+import pytest
+
+from battle_env.moves_loader import GEN3_META_FILE, GEN3_MOVES_FILE, load_gen3_moves, main
+
+
+def test_missing_gen3_table_is_not_built_implicitly(tmp_path):
+    path = tmp_path / "moves_gen3.json"
+    with pytest.raises(FileNotFoundError, match="battle_env.moves_loader"):
+        load_gen3_moves(path)
+    assert not path.exists()
+
+
+def test_build_step_reproduces_the_shipped_tables(tmp_path):
+    out, meta = tmp_path / "moves_gen3.json", tmp_path / "moves_gen3_meta.json"
+    main(["--out", str(out), "--meta", str(meta)])
+    assert out.read_text() == GEN3_MOVES_FILE.read_text()
+    assert meta.read_text() == GEN3_META_FILE.read_text()
+    assert load_gen3_moves(out)["thunderbolt"].power == 95
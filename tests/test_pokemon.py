@@ -0,0 +1,49 @@
+from battle_env.item import items_map
+from battle_env.moves_loader import load_gen3_moves
+from battle_env.team_builder import parse_showdown
+
+MAROWAK = """
+Marowak @ Thick Club
+Ability: Rock Head
+Level: 50
+EVs: 252 Atk
+Adamant Nature
+- Earthquake
+"""
+
+
+def marowak():
+    return parse_showdown(MAROWAK, load_gen3_moves()).members[0]
+
+
+def test_stage_changes_invalidate_cached_stats():
+    mon = marowak()
+    atk = mon.stats['atk']
+    assert mon.get_modified_stat('atk') == atk
+    assert mon._stat_cache == {'atk': atk}
+    mon.change_stage('atk', 2)
+    assert mon.get_modified_stat('atk') == atk * 2
+    mon.change_stage('atk', -3)
+    assert mon.get_modified_stat('atk') == atk * 2 // 3
+    mon.change_stage('atk', -6)
+    mon.change_stage('atk', -1)  # already at -6: nothing changes
+    assert mon.get_modified_stat('atk') == atk * 2 // 8
+
+
+def test_status_changes_invalidate_effective_stats():
+    mon = marowak()
+    spe = mon.get_effective_stat('spe')
+    mon.set_status('par')
+    assert mon.get_effective_stat('spe') == spe // 4
+    mon.heal_status()
+    assert mon.get_effective_stat('spe') == spe
+
+
+def test_item_start_invalidates_cached_stats():
+    mon = marowak()
+    atk = mon.get_modified_stat('atk')
+    effective = mon.get_effective_stat('atk')
+    mon.item = items_map['thickclub'](mon)
+    mon.item.on_start(None)
+    assert mon.get_modified_stat('atk') == 2 * atk
+    assert mon.get_effective_stat('atk') == 2 * effective
@@ -0,0 +1,54 @@
+import random
+from collections import Counter
+
+import pytest
+
+from battle_env.random_teams import AliasTable, RandomTeamGenerator
+
+
+def implied(table):
+    """Exact probability of each item encoded by the alias table."""
+    p = [0.0] * table.n
+    for i in range(table.n):
+        p[i] += table.prob[i] / table.n
+        p[table.alias[i]] += (1.0 - table.prob[i]) / table.n
+    return p
+
+
+def test_alias_table_frequencies():
+    weights = [1, 2, 3, 4, 0.5, 9.5]
+    table = AliasTable(list("abcdef"), weights)
+    assert implied(table) == pytest.approx([w / 20 for w in weights])
+    rng = random.Random(0)
+    draws = 200_000
+    counts = Counter(table.sample(rng) for _ in range(draws))
+    for item, w in zip("abcdef", weights):
+        assert counts[item] / draws == pytest.approx(w / 20, abs=0.005)
+
+
+def test_alias_table_uniform_and_empty():
+    assert implied(AliasTable(list(range(7)))) == pytest.approx([1 / 7] * 7)
+    with pytest.raises(ValueError):
+        AliasTable([])
+
+
+@pytest.fixture(scope="module")
+def generator():
+    return RandomTeamGenerator({"Uber": 1.0, "NFE": 1.0})
+
+
+def test_tier_weights_split_evenly(generator):
+    probs = {name: p for name, p in zip(generator.species.items, implied(generator.species))}
+    uber = RandomTeamGenerator(["Uber"]).species.items
+    assert sum(p for name, p in probs.items() if name in uber) == pytest.approx(0.5)
+
+
+def test_species_clause(generator):
+    rng = random.Random(1)
+    for _ in range(200):
+        genes = generator.sample_genes(rng)
+        assert len({g.species for g in genes}) == 6
+    whole = generator.sample_genes(rng, generator.pool_size)
+    assert {g.species for g in whole} == set(generator.species.items)
+    with pytest.raises(ValueError):
+        generator.sample_genes(rng, generator.pool_size + 1)
@@ -0,0 +1,55 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from battle_env.results_store import ResultStore, team_hash
+
+ROOT = Path(__file__).parent.parent
+TEAM1 = (ROOT / "team1.txt").read_text()
+TEAM2 = (ROOT / "team2.txt").read_text()
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ResultStore(tmp_path / "results.db") as store:
+        yield store
+
+
+def test_concurrent_writers_get_distinct_ids(tmp_path):
+    path = tmp_path / "results.db"
+    with ResultStore(path) as a, ResultStore(path) as b:
+        t1, t2 = a.add_team(TEAM1), b.add_team(TEAM1)
+        u = b.add_team(TEAM2)
+        assert t1 == t2
+        a.add(t1, u, 1, 1, 10, events=[(3, 2, 0, 'faint', None)], source='a')
+        b.add(t1, u, 1, 2, 12, events=[(5, 1, 0, 'faint', None)], source='b')
+        [id_b] = b.flush()
+        [id_a] = a.flush()
+        assert id_a != id_b
+        assert a.events(id_a) == [(3, 2, 0, 'faint', None)]
+        assert a.events(id_b) == [(5, 1, 0, 'faint', None)]
+        members = a.conn.execute("SELECT COUNT(*) FROM member_moves WHERE team = ?", (t1,)).fetchone()[0]
+        assert members == TEAM1.count("\n- ")
+
+
+def test_win_rates_and_matchups(store):
+    t1, t2 = store.add_team(TEAM1), store.add_team(TEAM2)
+    assert t1 == team_hash(TEAM1)
+    for winner in (1, 1, 2, 0):  # team1 seated first: 2 wins, 1 loss, 1 draw
+        store.add(t1, t2, None, winner, 10)
+    store.add(t2, t1, None, 1, 10)  # team2 seated first and wins
+    rates = {key: (wins, games) for key, wins, games, _ in store.win_rates('team')}
+    assert rates == {t1: (2, 5), t2: (2, 5)}
+    species = {key: (wins, games) for key, wins, games, _ in store.win_rates('species')}
+    assert species['Miltank'] == (2, 5)
+    items = dict((key, rate) for key, _, _, rate in store.win_rates('item'))
+    assert items['lumberry'] == pytest.approx(0.4)
+    assert store.win_rates('team', min_games=6) == []
+    with pytest.raises(ValueError):
+        store.win_rates('nature')
+    teams, wins, games = store.matchup_matrix()
+    i, j = teams.index(t1), teams.index(t2)
+    assert wins[i, j] == 2 and wins[j, i] == 2
+    assert games[i, j] == games[j, i] == 5
+    assert np.trace(games) == 0
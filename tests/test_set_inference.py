@@ -0,0 +1,54 @@
+import pytest
+
+from battle_env.moves_loader import load_gen3_moves
+from battle_env.set_inference import build_damage_index, infer_spreads
+from battle_env.team_builder import parse_showdown
+
+TEAM = """
+Snorlax
+Ability: Thick Fat
+Level: 100
+EVs: 252 Atk
+Adamant Nature
+- Self-Destruct
+
+Abra
+Ability: Synchronize
+Level: 100
+- Psychic
+"""
+
+
+@pytest.fixture
+def matchup():
+    attacker, defender = parse_showdown(TEAM, load_gen3_moves()).members
+    return attacker, attacker.moves[0], defender
+
+
+def top_row(attacker, move, defender):
+    _, rows, _, _ = build_damage_index(attacker, move, defender).groups[0]
+    return rows[-1]
+
+
+def test_damage_between_rolls_is_possible(matchup):
+    attacker, move, defender = matchup
+    assert top_row(attacker, move, defender)[1:3] == (1137, 1338)
+    # the lowest two of the 16 rolls are 1137 and 1150; Battle can deal anything between
+    spreads = {(c.ev, c.nature, c.items) for c in infer_spreads(attacker, move, defender, 1140)}
+    assert (252, 'boosting', (None,)) in spreads
+
+
+def test_guts_ignores_the_burn_penalty(matchup):
+    attacker, move, defender = matchup
+    attacker.status = 'brn'
+    burned = top_row(attacker, move, defender)
+    attacker.ability = 'guts'
+    guts = top_row(attacker, move, defender)
+    assert guts[0] == burned[0] * 3 // 2
+    assert guts[2] > 2 * burned[2]
+
+
+def test_huge_power_doubles_attack(matchup):
+    attacker, move, defender = matchup
+    attacker.ability = 'Huge Power'
+    assert top_row(attacker, move, defender)[0] == 700
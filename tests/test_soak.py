@@ -0,0 +1,53 @@
+import json
+import random
+
+import pytest
+
+from battle_env import soak
+from battle_env.battle import Battle
+from battle_env.random_teams import RandomTeamGenerator
+from battle_env.team import Team
+from battle_env.team_search import export_team
+
+
+@pytest.fixture(scope="module")
+def generator():
+    return RandomTeamGenerator(["OU"])
+
+
+def state(battle):
+    return [(m.name, m.current_hp, m.status) for m in battle.team1.members + battle.team2.members]
+
+
+def test_replay_reproduces_a_recorded_trace(generator):
+    for seed in range(5):
+        rng = random.Random(seed)
+        genes1, genes2 = generator.sample_genes(rng, 3), generator.sample_genes(rng, 3)
+        team1 = Team([generator.build_pokemon(g) for g in genes1])
+        team2 = Team([generator.build_pokemon(g) for g in genes2])
+        trace, battle = soak.play_one(team1, team2, seed, 200, soak.SoakStats())
+        record = {'seed': seed, 'teams': [export_team(genes1), export_team(genes2)],
+                  'trace': json.loads(json.dumps(trace))}
+        replayed = soak.replay(record)
+        assert trace
+        assert replayed.log_messages == battle.log_messages
+        assert state(replayed) == state(battle)
+        assert replayed.winner() == battle.winner()
+
+
+def test_failure_records_replay_the_exception(generator, tmp_path, monkeypatch):
+    play_turn = Battle.play_turn
+
+    def flaky(self, action1, action2):
+        if self.turn == 3:
+            raise RuntimeError("boom")
+        return play_turn(self, action1, action2)
+
+    monkeypatch.setattr(Battle, "play_turn", flaky)
+    failures = tmp_path / "failures.jsonl"
+    stats = soak.soak(generator, battles=1, seed=7, team_size=3, failures=failures)
+    assert stats.failures == 1
+    record = json.loads(failures.read_text())
+    assert record['error'] == "RuntimeError: boom"
+    with pytest.raises(RuntimeError, match="boom"):
+        soak.replay(record)
@@ -0,0 +1,83 @@
+from battle_env.damage import calculate_initial_damage
+from battle_env.item import items_map
+from battle_env.moves_loader import load_gen3_moves
+from battle_env.ruleset import get_ruleset
+from battle_env.spread_optimizer import OHKO, Outspeed, Survive, optimize_spread
+from battle_env.team import _registry_id
+from battle_env.team_builder import parse_showdown
+
+TEAM = """
+Raikou
+Ability: Pressure
+Level: 50
+- Thunderbolt
+
+Snorlax
+Ability: Thick Fat
+Level: 50
+EVs: 252 Atk
+Adamant Nature
+- Body Slam
+
+Gyarados
+Ability: Intimidate
+Level: 50
+EVs: 252 HP / 176 SpD
+Calm Nature
+- Surf
+"""
+
+RAIKOU = """
+Raikou
+Ability: Pressure
+Level: 50
+EVs: {evs}
+{nature} Nature
+- Thunderbolt
+"""
+
+
+def damage_range(attacker, move, defender):
+    """Min/max damage the way Battle computes it (no crit, no weather)."""
+    physical = move.category == 'Physical'
+    atk = attacker.get_modified_stat('atk' if physical else 'spa')
+    dfn = defender.get_modified_stat('def' if physical else 'spd')
+    initial = calculate_initial_damage(attacker.level, move.power, atk, dfn)
+    low, high = get_ruleset().damage_range(
+        initial, {'types': attacker.types, 'status': attacker.status},
+        {'types': defender.types}, move.__dict__)
+    item = items_map.get(_registry_id(attacker.item))
+    if item is not None and item.metadata.get('boost_type') == move.type:
+        mult = item.metadata.get('boost_multiplier', 1.0)
+        low, high = int(low * mult), int(high * mult)
+    return low, high
+
+
+def test_spreads_hold_when_rechecked_with_pokemon():
+    moves = load_gen3_moves()
+    raikou, snorlax, gyarados = parse_showdown(TEAM, moves).members
+    constraints = [
+        Survive(snorlax, snorlax.moves[0], hits=2),
+        OHKO(gyarados, raikou.moves[0]),
+        Outspeed(140),
+    ]
+    # a bare Raikou fails every one of them
+    assert 2 * damage_range(snorlax, snorlax.moves[0], raikou)[1] >= raikou.stats['hp']
+    assert damage_range(raikou, raikou.moves[0], gyarados)[0] < gyarados.stats['hp']
+    assert raikou.stats['spe'] <= 140
+    spreads = optimize_spread(raikou, constraints)
+    assert spreads
+    for spread in spreads:
+        evs = ' / '.join(f"{v} {k}" for k, v in spread.evs.items() if v)
+        mon = parse_showdown(RAIKOU.format(evs=evs, nature=spread.nature), moves).members[0]
+        assert mon.stats == spread.stats
+        assert sum(spread.evs.values()) <= 510
+        assert 2 * damage_range(snorlax, snorlax.moves[0], mon)[1] < mon.stats['hp']
+        assert damage_range(mon, mon.moves[0], gyarados)[0] >= gyarados.stats['hp']
+        assert mon.stats['spe'] > 140
+
+
+def test_impossible_constraints_give_no_spread():
+    raikou, snorlax, _ = parse_showdown(TEAM, load_gen3_moves()).members
+    assert optimize_spread(raikou, [Survive(snorlax, snorlax.moves[0], hits=20)]) == []
+    assert optimize_spread(raikou, [Outspeed(999)]) == []
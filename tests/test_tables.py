@@ -0,0 +1,18 @@
+import numpy as np
+
+from battle_env.tables import TYPE_IDS, GameTables, load_tables
+
+
+def test_tables_build_and_reopen(tmp_path):
+    tables = load_tables(tmp_path)
+    assert len(tables.species_names) == 389
+    gyarados = tables.species_row("Gyarados")
+    assert (gyarados["type1"], gyarados["type2"]) == (TYPE_IDS["Water"], TYPE_IDS["Flying"])
+    assert tables.species_row("Nidoran♀")["hp"] == 55
+    assert tables.species_row("Deoxys Attack Forme")["atk"] == 180
+
+    reopened = GameTables(tmp_path)
+    assert reopened.species_names == tables.species_names
+    assert np.array_equal(reopened.moves, tables.moves)
+    ids = [reopened.move_ids["thunderbolt"]], [reopened.species_ids["gyarados"]]
+    assert reopened.effectiveness(*ids)[0, 0] == 4.0
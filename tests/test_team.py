@@ -0,0 +1,49 @@
+from pathlib import Path
+
+from battle_env.battle import Battle
+from battle_env.moves_loader import load_gen3_moves
+from battle_env.team import TeamTemplate
+from battle_env.team_builder import parse_showdown
+
+ROOT = Path(__file__).parent.parent
+
+MAROWAK = """
+Marowak @ Thick Club
+Ability: Rock Head
+Level: 50
+- Earthquake
+"""
+
+
+def template(text):
+    return TeamTemplate.from_team(parse_showdown(text, load_gen3_moves()))
+
+
+def test_instances_have_independent_pp_hp_and_stats():
+    tpl = template((ROOT / "team1.txt").read_text())
+    a, b = tpl.instantiate(), tpl.instantiate()
+    mon_a, mon_b = a.members[0], b.members[0]
+    full_pp, full_hp = mon_b.moves[0].current_pp, mon_b.current_hp
+    mon_a.moves[0].current_pp -= 1
+    mon_a.apply_damage(10)
+    mon_a.stats['atk'] += 1
+    mon_a.change_stage('def', 1)
+    mon_a.set_status('par')
+    assert mon_b.moves[0].current_pp == full_pp
+    assert mon_b.current_hp == full_hp
+    assert mon_b.stats['atk'] == mon_a.stats['atk'] - 1
+    assert mon_b.stages.get('def', 0) == 0 and mon_b.status is None
+    fresh = tpl.instantiate().members[0]
+    assert fresh.moves[0].current_pp == full_pp and fresh.current_hp == full_hp
+
+
+def test_item_boosts_do_not_leak_into_the_template():
+    tpl = template(MAROWAK)
+    other = template((ROOT / "team2.txt").read_text())
+    atk = tpl.instantiate().members[0].stats['atk']
+    battle = Battle(tpl.instantiate(), other.instantiate(), verbose=False)
+    battle.start()
+    assert battle.p1.stats['atk'] == 2 * atk  # Thick Club
+    assert tpl.instantiate().members[0].stats['atk'] == atk
+    # a template taken from a team mid-battle drops the boost too
+    assert TeamTemplate.from_team(battle.team1).instantiate().members[0].stats['atk'] == atk
@@ -0,0 +1,51 @@
+from pathlib import Path
+
+import pytest
+
+from battle_env.moves_loader import load_gen3_moves
+from battle_env.stats_loader import get_base_stats, get_pokemon_types
+from battle_env.team_builder import parse_showdown
+from battle_env.team_stream import stream_teams
+
+ROOT = Path(__file__).parent.parent
+TEAM1 = (ROOT / "team1.txt").read_text()
+TEAM2 = (ROOT / "team2.txt").read_text()
+BROKEN = "Missingno\nAbility: Pressure\n- Tackle\n"
+
+
+def species(team):
+    return [mon.name for mon in team.members]
+
+
+def write_dump(tmp_path, text):
+    path = tmp_path / "dump.txt"
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_types_come_from_local_data():
+    assert get_pokemon_types("Gyarados") == ["Water", "Flying"]
+    assert get_pokemon_types("Nidoran♀") == ["Poison"]
+    assert get_base_stats("Snorlax")["hp"] == 160
+    with pytest.raises(ValueError):
+        get_pokemon_types("Missingno")
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_stream_splits_on_headers_and_skips_bad_teams(tmp_path, workers):
+    text = f"=== [gen3ou] One ===\n\n{TEAM1}\n=== [gen3ou] Bad ===\n\n{BROKEN}\n=== [gen3ou] Two ===\n\n{TEAM2}"
+    dump = write_dump(tmp_path, text)
+    bad_start = text.splitlines().index("=== [gen3ou] Bad ===") + 2
+    errors = []
+    teams = list(stream_teams(dump, workers=workers, chunk_size=1, on_error=errors.append))
+    assert [(i, name) for i, name, _ in teams] == [(0, "[gen3ou] One"), (2, "[gen3ou] Two")]
+    assert species(teams[0][2])[0] == "Miltank"
+    assert [(e.index, e.name, e.line) for e in errors] == [(1, "[gen3ou] Bad", bad_start)]
+    assert "Missingno" in errors[0].message
+
+
+def test_dump_without_headers_is_one_team(tmp_path):
+    dump = write_dump(tmp_path, TEAM1)
+    [(index, name, team)] = stream_teams(dump, on_error=None)
+    assert (index, name) == (0, None)
+    assert species(team) == species(parse_showdown(TEAM1, load_gen3_moves()))
@@ -0,0 +1,50 @@
+from pathlib import Path
+
+import pytest
+
+from battle_env.learnsets import load_learnsets
+from battle_env.moves_loader import load_moves
+from battle_env.team_builder import parse_showdown
+from battle_env.team_validator import validate_team
+
+ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture(scope="module")
+def moves_db():
+    return load_moves()
+
+
+@pytest.mark.parametrize("name", ["team1.txt", "team2.txt"])
+def test_sample_teams_validate(name, moves_db):
+    team = parse_showdown((ROOT / name).read_text(), moves_db)
+    assert validate_team(team) == []
+
+
+def test_unlearnable_move_is_reported(moves_db):
+    team = parse_showdown((ROOT / "team2.txt").read_text(), moves_db)
+    team.members[1].moves[0].id = "swordsdance"
+    assert validate_team(team) == ["Politoed can't learn swordsdance."]
+
+
+def test_learnsets_filter_sources_and_inherit_prevo_moves(tmp_path):
+    path = tmp_path / "learnsets.ts"
+    path.write_text(
+        "export const Learnsets = {\n"
+        "\tpoliwag: {\n\t\tlearnset: {\n"
+        "\t\t\thaze: [\"3E\"],\n"
+        "\t\t\tmist: [\"2E\"],\n"
+        "\t\t},\n\t},\n"
+        "\tpoliwhirl: {\n\t\tlearnset: {\n"
+        "\t\t\tsurf: [\"3M\"],\n"
+        "\t\t},\n\t},\n"
+        "\tpolitoed: {\n\t\tlearnset: {\n"
+        "\t\t\tperishsong: [\"3L51\", \"2L35\"],\n"
+        "\t\t},\n\t},\n"
+        "};\n"
+    )
+    prevos = {"poliwhirl": "poliwag", "politoed": "poliwhirl"}
+    learnsets = load_learnsets(path, gen=3, prevos=prevos)
+    assert learnsets["poliwag"] == {"haze"}
+    assert learnsets["politoed"] == {"haze", "surf", "perishsong"}
+    assert load_learnsets(path, gen=2, prevos={})["politoed"] == {"perishsong"}
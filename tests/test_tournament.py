@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+from battle_env.tournament import ResultLog
+
+HEADER = {'tournament': 'abc'}
+
+
+def write_log(path, *rows, tail=b""):
+    path.write_bytes(b"".join(json.dumps(r).encode() + b"\n" for r in (HEADER, *rows)) + tail)
+
+
+@pytest.mark.parametrize("garbage,expected", [
+    (b'{"index": 2, "win', {0, 1}),                          # torn final line
+    (b"\x00" * 64 + b"\n", {0, 1}),                          # zero-filled block after a power loss
+    (b'{"index": 2}\n\xff\xfe\n{"index": 3}\n', {0, 1, 2}),  # garbage in the middle
+])
+def test_recover_cuts_at_first_bad_line(tmp_path, garbage, expected):
+    path = tmp_path / "results.jsonl"
+    write_log(path, {'index': 0}, {'index': 1}, tail=garbage)
+    log = ResultLog(path, HEADER)
+    assert set(log.done) == expected
+    log.append({'index': 9})
+    log.close()
+    assert set(ResultLog(path, HEADER).done) == expected | {9}
+
+
+def test_recover_rejects_another_tournament(tmp_path):
+    path = tmp_path / "results.jsonl"
+    write_log(path, {'index': 0})
+    with pytest.raises(ValueError):
+        ResultLog(path, {'tournament': 'other'})